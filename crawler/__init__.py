@@ -0,0 +1 @@
+"""쇼핑몰 크롤러 공용 모듈"""
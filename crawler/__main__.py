@@ -0,0 +1,118 @@
+"""모든 사이트를 하나의 명령으로 크롤링
+
+    python -m crawler joamom                                   # 한 사이트 전체
+    python -m crawler all --workers 8                          # 모든 사이트
+    python -m crawler chicfox --category-id 001 113 --max-pages 3
+    python -m crawler baddiary --category "dress|outer" --export csv xlsx
+    python -m crawler closhoew --list-categories               # 카테고리 ID 확인
+    python -m crawler joamom --category-html menu.html         # 바뀐 카테고리 메뉴 HTML로 크롤링
+"""
+import argparse
+import re
+
+from crawler.engine import (EXPORT_FORMATS, FETCH_BACKEND, LOG_LEVEL, MAX_WORKERS, PARSE_PROCESSES, USE_PAGE_CACHE,
+                            run_site, select_categories)
+from crawler.fetch import FETCH_BACKENDS
+from crawler.profiling import PROFILE_MODES
+from crawler.sites import SITES, get_site
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m crawler', description="쇼핑몰 상품 크롤러")
+    parser.add_argument('sites', nargs='+', choices=list(SITES) + ['all'], help="크롤링할 사이트 (all이면 모든 사이트)")
+
+    scope = parser.add_argument_group("크롤링 범위")
+    scope.add_argument('--category', metavar='REGEX',
+                       help="카테고리 이름이나 URL에서 찾는 정규식 (대소문자 무시, 예: 'dress|outer')")
+    scope.add_argument('--category-id', nargs='+', metavar='ID',
+                       help="카테고리 ID (카페24 cate_no, 메이크샵 xcode 또는 xcode:mcode, 예: 001 113:002)")
+    scope.add_argument('--max-categories', type=int, metavar='N', help="필터를 적용한 뒤 앞에서부터 N개 카테고리만")
+    scope.add_argument('--max-pages', type=int, metavar='N', help="카테고리당 최대 페이지 수 (기본: 모든 페이지)")
+    scope.add_argument('--category-html', metavar='FILE',
+                       help="사이트에 들어 있는 카테고리 메뉴 대신 이 파일의 HTML에서 카테고리 추출 (사이트 하나만)")
+    scope.add_argument('--list-categories', action='store_true', help="범위에 맞는 카테고리와 ID만 출력하고 종료")
+
+    run = parser.add_argument_group("실행")
+    run.add_argument('--workers', type=int, default=MAX_WORKERS, help=f"동시에 크롤링할 카테고리 수 (기본: {MAX_WORKERS})")
+    run.add_argument('--backend', choices=FETCH_BACKENDS, default=FETCH_BACKEND,
+                     help=f"페치 백엔드 (기본: {FETCH_BACKEND}, http는 필요할 때 셀레늄으로 대체)")
+    run.add_argument('--parse-processes', type=int, default=PARSE_PROCESSES,
+                     help="목록 페이지를 파싱할 프로세스 수 (0이면 페치 워커 스레드에서 파싱)")
+    run.add_argument('--no-cache', action='store_true', help="페이지 캐시를 쓰지 않음")
+    run.add_argument('--resume', action='store_true', help="저널에 기록된 완료 페이지는 건너뛰고 이어서 크롤링")
+    run.add_argument('--incremental', action='store_true',
+                     help="신상품순으로 보다가 이전에 수집한 상품만 있는 페이지에서 멈춤")
+    run.add_argument('--details', action='store_true', help="상품 상세 페이지의 옵션/재고도 함께 수집")
+    run.add_argument('--images', action='store_true', help="상품 이미지를 내려받고 결과에 이미지해시 추가")
+
+    output = parser.add_argument_group("출력")
+    output.add_argument('--export', nargs='*', choices=['csv', 'xlsx'], default=list(EXPORT_FORMATS),
+                        help="Parquet 외에 추가로 저장할 형식 (기본: csv)")
+    output.add_argument('--log-level', choices=['debug', 'info', 'warning', 'error'], default=LOG_LEVEL,
+                        help="출력할 최소 로그 수준 (debug면 상품별 추출 결과까지 출력)")
+    output.add_argument('--log-json', action='store_true', help="콘솔에도 JSON 한 줄 형식으로 로그 출력")
+    output.add_argument('--profile', nargs='?', const='timers', choices=PROFILE_MODES,
+                        help="구간별/카테고리별 소요 시간 측정 (cprofile, pyinstrument면 카테고리를 하나씩 크롤링하며 코드 프로파일도 저장)")
+    return parser
+
+
+def print_categories(site, category_links):
+    print(f"\n===== {site.name}: 카테고리 {len(category_links)}개 =====")
+    for category in category_links:
+        print(f"{site.category_id(category) or '-'}\t{site.category_name(category)}\t{category['url']}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    names = list(SITES) if 'all' in args.sites else list(dict.fromkeys(args.sites))
+    if args.category_html and len(names) > 1:
+        parser.error("--category-html은 사이트 하나에만 쓸 수 있습니다")
+    if args.category:
+        try:
+            re.compile(args.category)
+        except re.error as e:
+            parser.error(f"--category 정규식 오류: {e}")
+    # --max-pages, --max-categories는 0이면 제한 없음과 구분되지 않으므로 1 이상만 받음
+    for option, value in (('--workers', args.workers), ('--max-pages', args.max_pages),
+                          ('--max-categories', args.max_categories)):
+        if value is not None and value < 1:
+            parser.error(f"{option}는 1 이상이어야 합니다")
+    if args.parse_processes < 0:
+        parser.error("--parse-processes는 0 이상이어야 합니다")
+
+    for name in names:
+        site = get_site(name)
+        if args.category_html:
+            with open(args.category_html, encoding='utf-8') as f:
+                site.category_html = f.read()
+
+        if args.list_categories:
+            print_categories(site, select_categories(site, site.categories(), args.category, args.category_id,
+                                                     args.max_categories))
+            continue
+
+        print(f"\n########## {name} 크롤링 ##########")
+        run_site(
+            site,
+            resume=args.resume,
+            max_pages=args.max_pages,
+            max_workers=args.workers,
+            exports=args.export,
+            use_cache=USE_PAGE_CACHE and not args.no_cache,
+            incremental=args.incremental,
+            details=args.details,
+            images=args.images,
+            parse_processes=args.parse_processes,
+            log_level=args.log_level,
+            log_json=args.log_json,
+            profile=args.profile,
+            category_pattern=args.category,
+            category_ids=args.category_id,
+            max_categories=args.max_categories,
+            backend=args.backend,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""저장된 HTML 픽스처로 사이트별 상품 추출 속도를 측정하는 오프라인 벤치마크
+
+네트워크 없이 실행된다. 저장소에는 joamom 목록 페이지만 저장되어 있어서 기본 실행은 joamom만 측정한다.
+chicfox와 카페24 사이트(closhoew, baddiary)는 목록 페이지를 저장해서 --fixture로 넘기면 같은 방식으로
+속도와 REQUIRED_FIELDS를 확인한다.
+
+item_10_debug.html은 잘린 HTML 조각이라 dl.item-list 36개 중 4개가 .item-cont 밖에 있어서 상품이 32개로
+잡힌다. 실제 사이트가 주는 페이지 모양이 아니므로 이 픽스처의 상품/초와 필드별 비용은 참고용이다.
+결과에는 목록 선택자와 상관없이 찾은 상품 요소 수(원본 항목)도 함께 보여 주고, 추출한 상품 수와 다르면 경고한다.
+
+    python -m crawler.benchmark
+    python -m crawler.benchmark --repeat 10 --parser lxml html.parser
+    python -m crawler.benchmark --fixture joamom=item_10_debug.html --save bench.json
+    python -m crawler.benchmark --baseline bench.json --tolerance 0.2
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from selenium.webdriver.common.by import By
+
+from crawler.parsing import SoupElement
+from crawler.sites import get_site
+
+# 저장소에 들어 있는 픽스처 (사이트 이름, 파일 경로) - 다른 사이트는 아직 저장된 목록 페이지가 없음
+FIXTURES = [
+    ('joamom', 'debug_html.txt'),
+    ('joamom', 'item_10_debug.html'),
+]
+
+# 원본 항목 수와 추출한 상품 수가 다른 이유가 알려진 픽스처 (파일 이름: 설명)
+FIXTURE_NOTES = {
+    'debug_html.txt': "베스트 상품 캐러셀(.swiper-wrapper)의 항목은 목록에서 뺌",
+    'item_10_debug.html': "잘린 HTML 조각이라 일부 항목이 .item-cont 밖에 있음, 실제 페이지 모양이 아님",
+}
+
+# 비교할 BeautifulSoup 파서 (설치된 것만 사용)
+PARSER_BACKENDS = ('lxml', 'html.parser', 'html5lib')
+
+FIXTURE_BASE_URL = 'https://fixture.invalid/'
+
+# 픽스처의 상품 중 적어도 하나는 값이 있어야 하는 필드
+# (선택자나 정규식이 HTML과 어긋나면 오류 없이 모든 상품이 빈 값이나 0이 되므로 따로 확인)
+REQUIRED_FIELDS = {
+    'joamom': ('상품명', '상품URL', '판매가', '리뷰수'),
+    'chicfox': ('상품명', '상품URL', '판매가'),
+    'closhoew': ('상품명', '상품URL', '가격'),
+    'baddiary': ('상품명', '상품URL', '판매가'),
+}
+
+
+def available_parsers():
+    """설치되어 있는 파서 목록"""
+    parsers = []
+    for parser in PARSER_BACKENDS:
+        if parser == 'html.parser' or importlib.util.find_spec(parser) is not None:
+            parsers.append(parser)
+    return parsers
+
+
+class TimedElement:
+    """find_element/find_elements/text/get_attribute에 걸린 시간을 선택자(필드)별로 기록하는 요소 래퍼"""
+
+    def __init__(self, element, timings, path=''):
+        self.element = element
+        self.timings = timings
+        self.path = path
+
+    def _record(self, name, started):
+        entry = self.timings.setdefault(name, {'calls': 0, 'seconds': 0.0})
+        entry['calls'] += 1
+        entry['seconds'] += time.perf_counter() - started
+
+    def _child_path(self, value):
+        return f'{self.path} {value}'.strip()
+
+    def find_element(self, by, value):
+        path = self._child_path(value)
+        started = time.perf_counter()
+        try:
+            element = self.element.find_element(by, value)
+        finally:
+            self._record(path, started)
+        return TimedElement(element, self.timings, path)
+
+    def find_elements(self, by, value):
+        path = self._child_path(value)
+        started = time.perf_counter()
+        elements = self.element.find_elements(by, value)
+        self._record(path, started)
+        return [TimedElement(element, self.timings, path) for element in elements]
+
+    @property
+    def text(self):
+        started = time.perf_counter()
+        text = self.element.text
+        self._record(f'{self.path} (text)', started)
+        return text
+
+    def get_attribute(self, name):
+        started = time.perf_counter()
+        value = self.element.get_attribute(name)
+        self._record(f'{self.path} @{name}', started)
+        return value
+
+
+def raw_item_count(site, html, parser):
+    """목록 선택자의 마지막 단계(예: dl.item-list)만으로 찾은 상품 요소 수 (컨테이너 조건을 빼고 셈)"""
+    page = SoupElement.from_html(html, FIXTURE_BASE_URL, parser)
+    return max((len(page.find_elements(By.CSS_SELECTOR, selector.split()[-1])) for selector in site.list_selectors),
+               default=0)
+
+
+def extract_all(site, html, parser):
+    """파싱부터 상품 정보 추출까지 한 번 실행하고 (파싱 시간, 추출 시간, 상품 수) 반환"""
+    started = time.perf_counter()
+    page = SoupElement.from_html(html, FIXTURE_BASE_URL, parser)
+    parsed = time.perf_counter()
+    products = [site.extract_product_info(element) for element in site.find_product_elements(page)]
+    extracted = time.perf_counter()
+    return parsed - started, extracted - parsed, sum(1 for product in products if product)
+
+
+def empty_fields(site_name, site, html, parser):
+    """REQUIRED_FIELDS 중 모든 상품에서 비어 있거나 0인 필드 목록"""
+    page = SoupElement.from_html(html, FIXTURE_BASE_URL, parser)
+    products = [product for product in map(site.extract_product_info, site.find_product_elements(page)) if product]
+    return [field for field in REQUIRED_FIELDS.get(site_name, ())
+            if not any(product.get(field) for product in products)]
+
+
+def field_costs(site, html, parser):
+    """선택자(필드)별 누적 시간 측정"""
+    page = SoupElement.from_html(html, FIXTURE_BASE_URL, parser)
+    timings = {}
+    for element in site.find_product_elements(page):
+        site.extract_product_info(TimedElement(element, timings))
+    return timings
+
+
+def peak_memory(site, html, parser):
+    """파싱과 추출 한 번에 쓰는 최대 메모리 (바이트)"""
+    tracemalloc.start()
+    try:
+        extract_all(site, html, parser)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(fixtures, parsers, repeat=5):
+    """픽스처와 파서 조합마다 측정 결과 목록 반환 (시간은 repeat번 중 가장 빠른 값)"""
+    results = []
+    for site_name, path in fixtures:
+        site = get_site(site_name)
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            html = f.read()
+
+        for parser in parsers:
+            runs = [extract_all(site, html, parser) for _ in range(repeat)]
+            parse_seconds = min(run[0] for run in runs)
+            extract_seconds = min(run[1] for run in runs)
+            products = runs[0][2]
+            total_seconds = parse_seconds + extract_seconds
+            results.append({
+                'site': site_name,
+                'fixture': os.path.basename(path),
+                'parser': parser,
+                'products': products,
+                'raw_items': raw_item_count(site, html, parser),
+                'parse_ms': parse_seconds * 1000,
+                'extract_ms': extract_seconds * 1000,
+                'products_per_sec': products / total_seconds if total_seconds else 0.0,
+                'peak_memory_mb': peak_memory(site, html, parser) / 1024 / 1024,
+                'fields': field_costs(site, html, parser),
+                'empty_fields': empty_fields(site_name, site, html, parser),
+            })
+    return results
+
+
+def print_results(results, top_fields=10):
+    print("\n===== 상품 추출 벤치마크 =====")
+    print(f"{'픽스처':<22} {'파서':<12} {'원본 항목':>7} {'상품':>5} {'파싱(ms)':>10} {'추출(ms)':>10} {'상품/초':>10} {'최대 메모리(MB)':>16}")
+    for result in results:
+        print(f"{result['fixture']:<22} {result['parser']:<12} {result['raw_items']:>7} {result['products']:>5} "
+              f"{result['parse_ms']:>10.1f} {result['extract_ms']:>10.1f} "
+              f"{result['products_per_sec']:>10.1f} {result['peak_memory_mb']:>16.1f}")
+    for result in results:
+        if result['raw_items'] != result['products']:
+            reason = FIXTURE_NOTES.get(result['fixture'], "픽스처가 잘렸거나 목록 선택자가 HTML과 맞지 않을 수 있음")
+            print(f"주의: {result['fixture']} / {result['parser']} 상품 요소 {result['raw_items']}개 중 "
+                  f"{result['products']}개만 추출 ({reason})")
+
+    for result in results:
+        fields = result['fields']
+        total = sum(entry['seconds'] for entry in fields.values()) or 1.0
+        products = result['products'] or 1
+        print(f"\n----- 필드별 비용: {result['fixture']} / {result['parser']} (상위 {top_fields}개) -----")
+        ranked = sorted(fields.items(), key=lambda item: item[1]['seconds'], reverse=True)
+        for name, entry in ranked[:top_fields]:
+            print(f"{entry['seconds'] * 1000:8.2f}ms {entry['seconds'] / total * 100:5.1f}% "
+                  f"{entry['seconds'] / products * 1e6:8.1f}us/상품 {entry['calls']:6d}회  {name}")
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """기준 결과보다 상품/초가 tolerance 비율 이상 떨어진 조합 목록"""
+    baseline_rates = {
+        (entry['fixture'], entry['parser']): entry['products_per_sec'] for entry in baseline
+    }
+    regressions = []
+    for result in results:
+        key = (result['fixture'], result['parser'])
+        before = baseline_rates.get(key)
+        if before and result['products_per_sec'] < before * (1 - tolerance):
+            regressions.append((key, before, result['products_per_sec']))
+    return regressions
+
+
+def parse_fixture(value):
+    site_name, sep, path = value.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError("픽스처는 사이트=경로 형식으로 지정하세요")
+    return site_name, path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 HTML로 상품 추출 속도 측정 (네트워크 없음)")
+    parser.add_argument('--fixture', action='append', type=parse_fixture,
+                        help="측정할 픽스처 (사이트=경로, 여러 번 지정 가능, 기본: 저장소의 픽스처)")
+    parser.add_argument('--parser', nargs='+', default=None, help="비교할 파서 (기본: 설치된 파서 전체)")
+    parser.add_argument('--repeat', type=int, default=5, help="조합마다 반복 횟수")
+    parser.add_argument('--save', help="결과를 JSON으로 저장할 경로")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON (상품/초가 떨어지면 종료 코드 1)")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="허용할 상품/초 감소 비율")
+    args = parser.parse_args(argv)
+
+    fixtures = args.fixture or FIXTURES
+    results = run_benchmark(fixtures, args.parser or available_parsers(), args.repeat)
+    print_results(results)
+
+    uncovered = sorted(set(REQUIRED_FIELDS) - {site_name for site_name, _ in fixtures})
+    if uncovered:
+        print(f"\n픽스처가 없어 측정하지 않은 사이트: {', '.join(uncovered)} (--fixture 사이트=경로로 지정)")
+
+    empty = [(result['fixture'], result['parser'], result['empty_fields'])
+             for result in results if result['empty_fields']]
+    for fixture, parser_name, fields in empty:
+        print(f"추출 실패: {fixture} / {parser_name} 모든 상품의 {', '.join(fields)} 값이 비어 있음")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n벤치마크 결과 저장 완료: {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+        for (fixture, parser_name), before, after in regressions:
+            print(f"성능 저하: {fixture} / {parser_name} 상품/초 {before:.1f} -> {after:.1f}")
+        if regressions:
+            return 1
+        print("기준 결과 대비 성능 저하 없음")
+    return 1 if empty else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+
+from crawler.journal import STATE_DIR
+
+# HTTP 페이지 캐시 기본 디렉토리
+CACHE_DIR = os.path.join(STATE_DIR, 'http_cache')
+
+
+class PageCache:
+    """URL별 페이지 본문과 ETag/Last-Modified를 디스크에 저장하는 캐시
+
+    저장된 페이지는 조건부 요청(If-None-Match/If-Modified-Since)으로 재검증하고, 서버가 304를
+    돌려주면 본문을 다시 받지 않고 캐시에서 꺼낸다. fresh_for초 안에 검증한 항목은 요청 없이 바로 쓴다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 지우고(LRU),
+    max_age초 동안 검증되지 않은 항목은 만료된 것으로 보고 지운다.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=200 * 1024 * 1024, max_age=7 * 24 * 3600, fresh_for=0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.fresh_for = fresh_for
+        self.stats = {'hit': 0, 'revalidated': 0, 'miss': 0, 'stored': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._total_bytes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _meta_path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, f'{key}.html.z')
+
+    def _load(self):
+        """디스크에 있는 캐시 항목의 메타데이터 읽기"""
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            key = filename[:-len('.json')]
+            try:
+                with open(self._meta_path(key), encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not os.path.exists(self._body_path(key)):
+                continue
+            self._entries[key] = entry
+            self._total_bytes += entry.get('size', 0)
+
+    def _write_file(self, path, data, mode):
+        # 임시 파일에 쓰고 교체해서 중간에 죽어도 반쯤 쓴 파일이 남지 않게 함
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, mode) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _save_meta(self, key, entry):
+        self._write_file(self._meta_path(key), json.dumps(entry, ensure_ascii=False).encode('utf-8'), 'wb')
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._total_bytes -= entry.get('size', 0)
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def lookup(self, url):
+        """캐시 항목 반환 (없거나 max_age가 지났으면 None, 이때 본문을 새로 받으므로 miss로 셈)"""
+        key = self._key(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry['validated_at'] > self.max_age:
+                self._remove(key)
+                self.stats['evicted'] += 1
+                entry = None
+            if entry is None:
+                self.stats['miss'] += 1
+                return None
+            return dict(entry)
+
+    def record_miss(self):
+        """캐시 항목이 있었지만 재검증 결과 본문이 바뀌어 새로 받은 경우"""
+        with self._lock:
+            self.stats['miss'] += 1
+
+    def is_fresh(self, entry):
+        """요청 없이 바로 써도 되는 항목인지 (fresh_for초 안에 검증됨)"""
+        return self.fresh_for > 0 and time.time() - entry['validated_at'] <= self.fresh_for
+
+    def conditional_headers(self, entry):
+        """재검증용 조건부 요청 헤더"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_body(self, url, revalidated=False):
+        """캐시된 본문을 읽고 사용 기록 갱신 (revalidated=True면 304로 재검증된 경우)"""
+        key = self._key(url)
+        with open(self._body_path(key), 'rb') as f:
+            html = zlib.decompress(f.read()).decode('utf-8')
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                now = time.time()
+                entry['last_access'] = now
+                if revalidated:
+                    entry['validated_at'] = now
+                self._save_meta(key, entry)
+            self.stats['revalidated' if revalidated else 'hit'] += 1
+        return html
+
+    def store(self, url, html, final_url, headers):
+        """새로 받은 페이지를 저장하고 크기 제한을 넘으면 오래 쓰지 않은 항목부터 정리"""
+        key = self._key(url)
+        body = zlib.compress(html.encode('utf-8'))
+        now = time.time()
+        entry = {
+            'url': url,
+            'final_url': final_url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'size': len(body),
+            'validated_at': now,
+            'last_access': now,
+        }
+        with self._lock:
+            # 검증 수단이 없는 응답은 재검증할 수 없으므로 fresh_for를 쓰지 않는 한 저장하지 않음
+            if not entry['etag'] and not entry['last_modified'] and self.fresh_for <= 0:
+                return
+            old_entry = self._entries.get(key)
+            if old_entry:
+                self._total_bytes -= old_entry.get('size', 0)
+            self._write_file(self._body_path(key), body, 'wb')
+            self._save_meta(key, entry)
+            self._entries[key] = entry
+            self._total_bytes += entry['size']
+            self.stats['stored'] += 1
+            self._evict()
+
+    def _evict(self):
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1]['last_access']):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            self.stats['evicted'] += 1
+
+    def print_summary(self):
+        stats = self.stats
+        requests_seen = stats['hit'] + stats['revalidated'] + stats['miss']
+        if not requests_seen:
+            return
+        hit_rate = (stats['hit'] + stats['revalidated']) / requests_seen * 100
+        print("\n===== HTTP 페이지 캐시 통계 =====")
+        print(f"캐시 적중: {stats['hit']}회, 304 재검증: {stats['revalidated']}회, 새로 받음: {stats['miss']}회 "
+              f"(적중률 {hit_rate:.1f}%)")
+        print(f"저장: {stats['stored']}개, 정리: {stats['evicted']}개, "
+              f"캐시 크기: {self._total_bytes / 1024 / 1024:.1f}MB / {self.max_bytes / 1024 / 1024:.0f}MB")
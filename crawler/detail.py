@@ -0,0 +1,251 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.common.by import By
+
+from crawler.fetch import HttpFetcher
+from crawler.index import INDEX_PATH, connect
+from crawler.metrics import log
+from crawler.parsing import SoupElement
+from crawler.schema import to_int
+
+# 상세 페이지를 동시에 가져오는 워커 수
+DETAIL_WORKERS = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS product_details (
+    product_id INTEGER PRIMARY KEY REFERENCES products (id),
+    url TEXT NOT NULL,
+    content_hash TEXT,
+    option_count INTEGER,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS product_options (
+    id INTEGER PRIMARY KEY,
+    product_id INTEGER NOT NULL REFERENCES products (id),
+    option_name TEXT,
+    option_value TEXT,
+    price INTEGER,
+    stock INTEGER,
+    sold_out INTEGER
+);
+CREATE INDEX IF NOT EXISTS product_options_product ON product_options (product_id);
+"""
+
+# 카페24 상세 페이지 스크립트의 옵션별 재고 데이터
+CAFE24_STOCK_PATTERN = re.compile(r"option_stock_data\s*=\s*'(.*?)';", re.S)
+
+# 옵션 이름 뒤에 붙는 추가 금액/품절 표시 (예: "블랙 (+2,000원)", "S [품절]")
+OPTION_SUFFIX_PATTERN = re.compile(r'\s*[\(\[]\s*(?:[+-]?[\d,]+원|품절)\s*[\)\]]')
+
+
+def _clean_option_text(text):
+    return OPTION_SUFFIX_PATTERN.sub('', text).strip()
+
+
+def parse_makeshop_options(page, html=''):
+    """메이크샵 상세 페이지의 옵션 선택 상자에서 옵션 목록 추출"""
+    options = []
+    for select in page.find_elements(By.CSS_SELECTOR, 'select[name="optionlist[]"], select.basic_option'):
+        option_name = select.get_attribute('label') or select.get_attribute('title') or ''
+        for option in select.find_elements(By.CSS_SELECTOR, 'option'):
+            value = option.get_attribute('value')
+            text = option.text.strip()
+            # 첫 번째 안내 항목(예: "옵션 선택")은 value가 비어 있음
+            if not value or not text:
+                continue
+            options.append({
+                'option_name': option_name,
+                'option_value': _clean_option_text(option.get_attribute('title') or text),
+                'price': to_int(option.get_attribute('price')),
+                'stock': to_int(option.get_attribute('stock')),
+                'sold_out': '품절' in text or option.get_attribute('disabled') is not None,
+            })
+    return options
+
+
+def _parse_cafe24_stock_data(html):
+    stock_match = CAFE24_STOCK_PATTERN.search(html)
+    if not stock_match:
+        return None
+    try:
+        # 자바스크립트 문자열 안의 JSON이라 따옴표가 이스케이프되어 있음
+        return json.loads(json.loads(f'"{stock_match.group(1)}"'))
+    except ValueError:
+        return None
+
+
+def parse_cafe24_options(page, html=''):
+    """카페24 상세 페이지의 옵션별 재고 데이터(option_stock_data)에서 옵션 목록 추출
+
+    재고 데이터가 없으면 옵션 선택 상자에서 이름만 읽는다.
+    """
+    stock_data = _parse_cafe24_stock_data(html)
+    if stock_data:
+        options = []
+        for item in stock_data.values():
+            use_stock = item.get('use_stock') in (True, 'T')
+            stock = to_int(item.get('stock_number')) if use_stock else None
+            options.append({
+                'option_name': '/'.join(item.get('option_name_mapping') or []) or item.get('option_name'),
+                'option_value': item.get('option_value'),
+                'price': to_int(str(item.get('option_price', '')).split('.')[0]),
+                'stock': stock,
+                'sold_out': item.get('is_selling') == 'F' or (use_stock and stock == 0),
+            })
+        return options
+
+    options = []
+    for select in page.find_elements(By.CSS_SELECTOR, 'select[id^="product_option_id"]'):
+        option_name = select.get_attribute('option_title') or ''
+        for option in select.find_elements(By.CSS_SELECTOR, 'option'):
+            value = option.get_attribute('value')
+            text = option.text.strip()
+            # '*', '**'는 "- [필수] 옵션을 선택해 주세요 -" 같은 안내 항목
+            if not value or value in ('*', '**'):
+                continue
+            options.append({
+                'option_name': option_name,
+                'option_value': _clean_option_text(text),
+                'price': None,
+                'stock': None,
+                'sold_out': '품절' in text,
+            })
+    return options
+
+
+class DetailStore:
+    """상품 상세 정보(옵션/재고)를 상품 색인 DB의 자식 테이블에 저장"""
+
+    def __init__(self, path=INDEX_PATH):
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._hashes = dict(self._conn.execute('SELECT product_id, content_hash FROM product_details'))
+
+    def is_known(self, product_id):
+        return product_id in self._hashes
+
+    def is_unchanged(self, product_id, content_hash):
+        return self._hashes.get(product_id) == content_hash
+
+    def save(self, product_id, url, content_hash, options):
+        """상품의 옵션 목록을 새 내용으로 교체"""
+        with self._lock:
+            self._conn.execute('DELETE FROM product_options WHERE product_id = ?', (product_id,))
+            self._conn.executemany(
+                'INSERT INTO product_options (product_id, option_name, option_value, price, stock, sold_out) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (product_id, option['option_name'], option['option_value'], option['price'],
+                     option['stock'], int(bool(option['sold_out'])))
+                    for option in options
+                ],
+            )
+            self._conn.execute(
+                'INSERT OR REPLACE INTO product_details (product_id, url, content_hash, option_count, fetched_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (product_id, url, content_hash, len(options), time.time()),
+            )
+            self._conn.commit()
+            self._hashes[product_id] = content_hash
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class DetailStage:
+    """목록 크롤링과 동시에 상품 상세 페이지를 가져오는 두 번째 단계
+
+    목록 워커가 submit()으로 상품 행을 넘기면 상세 워커 풀(max_workers개)이 HTTP로 상세 페이지를
+    가져와 옵션과 재고를 저장한다. 대기 중인 작업은 max_pending개까지만 두어서 목록 크롤링이
+    훨씬 빠를 때도 메모리가 늘지 않는다. 지난 실행 이후 바뀌지 않은 페이지(캐시 적중/304 또는
+    본문 해시가 같음)는 파싱과 저장을 건너뛴다.
+    """
+
+    def __init__(self, site, limiter=None, cache=None, max_workers=DETAIL_WORKERS, max_pending=None,
+                 store=None):
+        self.site = site
+        self.limiter = limiter
+        self.cache = cache
+        self.store = store or DetailStore()
+        self.stats = {'fetched': 0, 'unchanged': 0, 'failed': 0, 'options': 0}
+        self._stats_lock = threading.Lock()
+        self._submitted = set()
+        self._submitted_lock = threading.Lock()
+        self._local = threading.local()
+        self._fetchers = []
+        self._pending = threading.BoundedSemaphore(max_pending or max_workers * 4)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='detail')
+
+    def _fetcher(self):
+        fetcher = getattr(self._local, 'fetcher', None)
+        if fetcher is None:
+            fetcher = self._local.fetcher = HttpFetcher(limiter=self.limiter, cache=self.cache)
+            with self._stats_lock:
+                self._fetchers.append(fetcher)
+        return fetcher
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def _claim(self, key):
+        """목록 워커 여러 개가 같은 키를 동시에 넘겨도 한 번만 True"""
+        with self._submitted_lock:
+            if key in self._submitted:
+                return False
+            self._submitted.add(key)
+            return True
+
+    def submit(self, products):
+        """상세 정보를 가져올 상품 행 추가 (같은 실행에서 이미 넘긴 상품은 무시)"""
+        for product in products:
+            product_id = product.get('상품ID')
+            url = product.get('상품URL')
+            if product_id is None or not url or not self._claim(product_id):
+                continue
+            # 대기 작업이 가득 차면 자리가 날 때까지 목록 워커를 잠시 멈춤
+            self._pending.acquire()
+            self._executor.submit(self._run, product_id, url)
+
+    def _run(self, product_id, url):
+        try:
+            self._crawl_detail(product_id, url)
+        except Exception as e:
+            self._count('failed')
+            log('warning', 'detail_failed', f"상세 페이지 처리 중 오류 발생: {url} ({e})", url=url, error=str(e))
+        finally:
+            self._pending.release()
+
+    def _crawl_detail(self, product_id, url):
+        html, page_url, changed = self._fetcher().fetch_html(url)
+        content_hash = hashlib.sha1(html.encode('utf-8')).hexdigest()
+        if (not changed and self.store.is_known(product_id)) or self.store.is_unchanged(product_id, content_hash):
+            self._count('unchanged')
+            return
+
+        page = SoupElement.from_html(html, page_url)
+        options = self.site.parse_detail(page, html)
+        self.store.save(product_id, url, content_hash, options)
+        self._count('fetched')
+        self._count('options', len(options))
+
+    def close(self):
+        """남은 상세 작업을 모두 마치고 정리"""
+        self._executor.shutdown(wait=True)
+        for fetcher in self._fetchers:
+            fetcher.close()
+        self.store.close()
+
+    def print_summary(self):
+        stats = self.stats
+        print("\n===== 상세 페이지 단계 =====")
+        print(f"새로 저장: {stats['fetched']}개 (옵션 {stats['options']}개), 변경 없음: {stats['unchanged']}개, "
+              f"실패: {stats['failed']}개")
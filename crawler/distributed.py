@@ -0,0 +1,444 @@
+"""작업 큐로 여러 프로세스/머신에 나눠서 크롤링
+
+    python -m crawler.distributed seed chicfox joamom closhoew baddiary --fresh
+    python -m crawler.distributed work --processes 4          # 이 머신에서 워커 프로세스 4개
+    python -m crawler.distributed status
+    python -m crawler.distributed collect chicfox joamom closhoew baddiary --export csv
+
+여러 머신에서 돌릴 때는 큐를 가진 머신에서 serve를 띄우고 다른 머신의 워커는 --queue로 접속한다.
+큐 서버와 워커는 같은 공유 토큰(--token 또는 CRAWL_QUEUE_TOKEN 환경 변수)을 써야 한다.
+
+    python -m crawler.distributed --token 비밀값 serve --host 0.0.0.0 --port 8765
+    python -m crawler.distributed --queue http://큐서버:8765 --token 비밀값 work --processes 4 --total-processes 8
+
+호스트 제한기는 워커 프로세스마다 따로 있으므로, 사이트에 보내는 요청 속도와 동시 요청 수는
+--total-processes(모든 머신의 워커 프로세스 수, 기본: --processes)로 나눠서 워커 전체가 단일 실행과
+같은 한도를 넘지 않게 한다.
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import secrets
+import socket
+import threading
+import time
+
+from crawler.engine import (EXPORT_FORMATS, HOST_CONCURRENCY, INITIAL_REQUEST_INTERVAL, LOG_LEVEL,
+                            MIN_REQUEST_INTERVAL, RETRY_BUDGET, category_csv_path, create_fetcher, fetch_with_retry,
+                            parse_listing, select_categories)
+from crawler.history import PriceHistory
+from crawler.incremental import KnownProducts, snapshot_path
+from crawler.index import ProductIndex
+from crawler.metrics import LOG, METRICS, log, run_log_path
+from crawler.pagination import plan_pages
+from crawler.retry import RetryBudget, retry_call
+from crawler.scheduler import HostLimiter
+from crawler.sink import CsvSink, DedupSink, open_output_sink
+from crawler.sites import SITES, get_site
+from crawler.workqueue import QUEUE_HOST, TOKEN_ENV, VISIBILITY_TIMEOUT, is_remote, open_queue, serve_queue
+
+# 작업 큐가 비어 있지만 다른 워커가 처리 중인 작업이 있을 때 다시 확인하는 간격(초)
+POLL_INTERVAL = 5
+
+# 워커 프로세스 하나에서 작업을 동시에 처리하는 스레드 수
+WORKER_THREADS = 2
+
+# 작업 큐 요청(임대/완료/실패 기록)의 재시도 횟수와 첫 대기 시간(초)
+QUEUE_RETRIES = 3
+QUEUE_RETRY_DELAY = 1.0
+# 작업 큐 요청이 재시도까지 연달아 이만큼 실패하면 스레드를 끝냄 (큐 서버가 내려간 경우)
+MAX_QUEUE_ERRORS = 10
+
+
+def seed_site(queue, site, max_pages=None, fresh=False, category_filter=(None, None, None)):
+    """사이트의 카테고리마다 첫 페이지 작업을 큐에 추가 (나머지 페이지 작업은 첫 페이지를 처리한 워커가 추가)
+
+    category_filter는 select_categories()에 넘기는 (정규식, 카테고리 ID 목록, 최대 카테고리 수)이다.
+    """
+    if fresh:
+        queue.reset(site.name)
+    category_links = site.categories()
+    if site.categories_file:
+        with CsvSink(site.categories_file) as categories_sink:
+            categories_sink.write(category_links)
+    category_links = select_categories(site, category_links, *category_filter)
+    tasks = []
+    for category in category_links:
+        url = site.listing_url(category['url'])
+        tasks.append({
+            'site': site.name,
+            'category': category,
+            'listing_url': url,
+            'page': 1,
+            'page_url': url,
+            'plan': True,
+            'max_pages': max_pages or site.max_pages,
+        })
+    added = queue.add(tasks)
+    print(f"[{site.name}] 카테고리 {len(category_links)}개 중 {added}개의 첫 페이지 작업을 큐에 추가했습니다.")
+    return added
+
+
+def crawl_task(site, task, fetcher, budget=None):
+    """작업(목록 페이지 하나)을 처리하고 (상품 행 목록, 이어서 추가할 작업 목록) 반환
+
+    첫 페이지 작업이면 총 페이지 수를 계산해서 나머지 페이지 작업을 만든다.
+    """
+    category = task['category']
+    label = f"[{site.category_name(category)}] 페이지 {task['page']}"
+    page = fetch_with_retry(site, fetcher, task['page_url'], budget, label)
+    products, total_pages = parse_listing(site, page, category, plan=task['plan'])
+    if not task['plan']:
+        return products, []
+
+    page_urls = plan_pages(task['listing_url'], total_pages, task['max_pages'])
+    new_tasks = [
+        dict(task, page=page_number, page_url=page_url, plan=False)
+        for page_number, page_url in enumerate(page_urls, 1)
+        if page_number > 1
+    ]
+    log('info', 'pages_planned', f"[{site.category_name(category)}] 크롤링할 총 페이지 수: {len(page_urls)}",
+        pages=len(page_urls))
+    return products, new_tasks
+
+
+class LeaseKeeper:
+    """작업을 처리하는 동안 임대 시간의 1/3마다 임대를 연장하는 백그라운드 스레드
+
+    느린 페이지 때문에 임대 시간이 지나서 같은 작업을 다른 워커가 다시 가져가는 일을 막는다.
+    """
+
+    def __init__(self, queue, task, visibility_timeout=VISIBILITY_TIMEOUT):
+        self.queue = queue
+        self.task = task
+        self.visibility_timeout = visibility_timeout
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.visibility_timeout / 3):
+            try:
+                if not self.queue.heartbeat(self.task['id'], self.task['owner'], self.visibility_timeout):
+                    self.lost = True
+                    return
+            except Exception as e:
+                log('warning', 'lease_heartbeat_failed', f"작업 {self.task['id']} 임대 연장 실패: {e}", error=str(e))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+
+class Worker:
+    """큐에서 작업을 임대해서 처리하는 워커 (프로세스 하나에 threads개의 스레드)
+
+    스레드마다 큐 연결과 페치 백엔드를 따로 쓰고, 호스트별 요청 간격은 사이트마다 만든 HostLimiter를
+    프로세스 안의 스레드가 함께 쓴다. 다른 프로세스/머신과는 제한기를 공유하지 않으므로 host_share
+    (같은 사이트에 요청하는 워커 프로세스 수)로 요청 속도와 동시 요청 수를 나눈다.
+    """
+
+    def __init__(self, location=None, sites=None, threads=WORKER_THREADS, visibility_timeout=VISIBILITY_TIMEOUT,
+                 poll_interval=POLL_INTERVAL, name=None, token=None, host_share=1):
+        self.location = location
+        self.token = token
+        self.host_share = max(1, host_share)
+        self.sites = list(sites) if sites else None
+        self.threads = threads
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.budget = RetryBudget(RETRY_BUDGET)
+        self.stats = {'done': 0, 'failed': 0, 'lost': 0}
+        self._lock = threading.Lock()
+        self._sites = {}
+        self._limiters = {}
+
+    def _site(self, name):
+        with self._lock:
+            if name not in self._sites:
+                site = self._sites[name] = get_site(name)
+                # 워커 프로세스 host_share개가 합쳐서 단일 실행의 요청 속도와 동시 요청 수를 넘지 않도록 나눔
+                share = self.host_share
+                self._limiters[name] = HostLimiter(max(1, math.ceil(HOST_CONCURRENCY / share)),
+                                                   (site.min_request_interval or MIN_REQUEST_INTERVAL) * share,
+                                                   INITIAL_REQUEST_INTERVAL * share)
+            return self._sites[name], self._limiters[name]
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _call_queue(self, label, func, *args):
+        """작업 큐 요청을 지수 백오프로 다시 시도 (SQLite 잠금, 큐 서버의 일시적인 오류)"""
+        return retry_call(lambda: func(*args), QUEUE_RETRIES, QUEUE_RETRY_DELAY, label=label)
+
+    def _process(self, queue, task, fetchers):
+        site, limiter = self._site(task['site'])
+        if site.name not in fetchers:
+            fetchers[site.name] = create_fetcher(limiter)
+        category_name = site.category_name(task['category'])
+
+        with METRICS.labels(site=site.name, category=category_name):
+            try:
+                with LeaseKeeper(queue, task, self.visibility_timeout) as keeper:
+                    products, new_tasks = crawl_task(site, task, fetchers[site.name], self.budget)
+            except Exception as e:
+                self._count('failed')
+                METRICS.inc('failed_pages')
+                log('warning', 'task_failed', f"[{category_name}] 페이지 {task['page']} 작업 실패: {e}",
+                    task=task['id'], page=task['page'], attempts=task['attempts'], error=str(e))
+                try:
+                    self._call_queue(f"[{category_name}] 페이지 {task['page']} 실패 기록", queue.fail,
+                                     task['id'], task['owner'], e)
+                except Exception as queue_error:
+                    # 기록하지 못해도 임대 시간이 지나면 다른 워커가 다시 가져감
+                    log('error', 'task_fail_unrecorded',
+                        f"[{category_name}] 페이지 {task['page']} 작업 실패를 큐에 기록하지 못했습니다: {queue_error}",
+                        task=task['id'], error=str(queue_error))
+                return
+
+            try:
+                completed = not keeper.lost and self._call_queue(
+                    f"[{category_name}] 페이지 {task['page']} 완료 기록", queue.complete,
+                    task['id'], task['owner'], products, new_tasks)
+            except Exception as e:
+                self._count('failed')
+                log('error', 'task_complete_unrecorded',
+                    f"[{category_name}] 페이지 {task['page']} 결과를 큐에 기록하지 못했습니다 "
+                    f"(임대 시간이 지나면 다시 처리됨): {e}", task=task['id'], error=str(e))
+                return
+            if not completed:
+                # 임대 시간이 지나 다른 워커가 가져간 작업이면 이 결과는 버림 (그 워커가 다시 기록함)
+                self._count('lost')
+                log('warning', 'lease_lost', f"[{category_name}] 페이지 {task['page']} 작업의 임대를 잃어 결과를 버립니다.",
+                    task=task['id'], page=task['page'])
+                return
+            self._count('done')
+            METRICS.inc('pages')
+            METRICS.inc('products', len(products))
+            log('info', 'task_done', f"[{category_name}] 페이지 {task['page']} 완료: {len(products)}개 상품"
+                + (f", 페이지 작업 {len(new_tasks)}개 추가" if new_tasks else ''),
+                task=task['id'], page=task['page'], products=len(products), new_tasks=len(new_tasks))
+
+    def _run_thread(self, index):
+        owner = f"{self.name}:{index}"
+        queue = open_queue(self.location, self.token)
+        fetchers = {}
+        errors = 0
+        try:
+            while True:
+                try:
+                    task = self._call_queue(f"[{owner}] 작업 임대", queue.lease, owner, self.sites,
+                                            self.visibility_timeout)
+                    # 다른 워커가 처리 중인 첫 페이지 작업이 나머지 페이지 작업을 만들 수 있으므로 모두 끝날 때까지 대기
+                    if task is None and not self._call_queue(f"[{owner}] 남은 작업 확인", queue.has_work, self.sites):
+                        return
+                    errors = 0
+                except Exception as e:
+                    errors += 1
+                    if errors >= MAX_QUEUE_ERRORS:
+                        log('error', 'queue_unavailable', f"[{owner}] 작업 큐 요청이 {errors}번 연달아 실패해서 멈춥니다: {e}",
+                            owner=owner, error=str(e))
+                        return
+                    log('warning', 'queue_error', f"[{owner}] 작업 큐 요청 실패, {self.poll_interval}초 뒤 다시 시도합니다: {e}",
+                        owner=owner, error=str(e))
+                    time.sleep(self.poll_interval)
+                    continue
+                if task is None:
+                    time.sleep(self.poll_interval)
+                    continue
+                try:
+                    self._process(queue, task, fetchers)
+                except Exception as e:
+                    # 예상하지 못한 오류도 이 작업만 버리고 다음 작업으로 (임대 시간이 지나면 다시 처리됨)
+                    self._count('failed')
+                    log('error', 'task_error', f"[{owner}] 작업 {task['id']} 처리 중 오류 발생: {e}",
+                        task=task['id'], error=str(e))
+        finally:
+            for fetcher in fetchers.values():
+                fetcher.close()
+            queue.close()
+
+    def run(self):
+        """큐에 남은 작업이 없을 때까지 처리"""
+        threads = [
+            threading.Thread(target=self._run_thread, args=(index,), name=f'worker-{index}')
+            for index in range(1, self.threads + 1)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print(f"\n[{self.name}] 완료한 작업: {self.stats['done']}개, 실패: {self.stats['failed']}개, "
+              f"임대를 잃어 버린 결과: {self.stats['lost']}개")
+        METRICS.print_summary()
+
+
+def run_worker(location=None, sites=None, threads=WORKER_THREADS, visibility_timeout=VISIBILITY_TIMEOUT,
+               log_level=LOG_LEVEL, log_json=False, token=None, host_share=1):
+    """워커 하나를 실행 (워커 프로세스의 시작 함수)"""
+    LOG.configure(log_level, log_json, run_log_path(f'worker_{os.getpid()}'))
+    try:
+        Worker(location, sites, threads, visibility_timeout, token=token, host_share=host_share).run()
+    finally:
+        LOG.close()
+
+
+def run_workers(processes=1, host_share=None, **options):
+    """워커 프로세스 processes개를 실행하고 모두 끝날 때까지 대기 (1이면 이 프로세스에서 실행)
+
+    host_share는 같은 사이트에 요청하는 모든 머신의 워커 프로세스 수이다 (None이면 processes).
+    """
+    options['host_share'] = host_share or max(1, processes)
+    if processes <= 1:
+        run_worker(**options)
+        return
+    context = multiprocessing.get_context('spawn')
+    workers = [context.Process(target=run_worker, kwargs=options) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def collect_site(queue, site, exports=EXPORT_FORMATS):
+    """큐에 쌓인 사이트 결과를 상품 색인/가격 이력에 반영하고 결과 파일로 저장
+
+    결과는 완료된 순서로 읽으며 매번 전체를 다시 기록하므로 크롤링 중간에 실행해도 된다.
+    """
+    output = open_output_sink(site.output_name, '상품ID', exports)
+    index = ProductIndex(site.name)
+    history = PriceHistory(site.name)
+    known = KnownProducts(snapshot_path(site.name))
+    category_sinks = {}
+    try:
+        after_id = 0
+        while True:
+            results = queue.results(site.name, after_id)
+            if not results:
+                break
+            for after_id, category, page, products in results:
+                index.assign(site, products)
+                history.record(products)
+                known.add(product['상품키'] for product in products)
+                output.write(products)
+                if site.category_dir:
+                    category_name = site.category_name(category)
+                    if category_name not in category_sinks:
+                        category_sinks[category_name] = DedupSink(CsvSink(category_csv_path(site, category_name)),
+                                                                  '상품ID')
+                    category_sinks[category_name].write(products)
+    finally:
+        for category_sink in category_sinks.values():
+            category_sink.close()
+        output.close()
+        known.save()
+        index.close()
+        history.close()
+
+    counts = queue.counts(site.name)
+    print(f"[{site.name}] 원본 상품 수: {output.rows_seen}, 중복 제거 후 상품 수: {output.rows_written}, "
+          f"새로 색인에 추가된 상품 수: {index.new_products}, 가격/재고 변경 이력: {history.changes}건")
+    for sink in output.sink.sinks:
+        print(f"[{site.name}] 통합 파일 저장 완료: {sink.path}")
+    if counts['pending'] or counts['leased']:
+        print(f"[{site.name}] 아직 끝나지 않은 작업이 {counts['pending'] + counts['leased']}개 있습니다 (중간 결과).")
+    if counts['dead']:
+        print(f"[{site.name}] 시도 횟수를 다 써서 포기한 작업: {counts['dead']}개")
+
+
+def print_status(queue, sites):
+    """사이트별 작업 상태 출력"""
+    for name in sites:
+        counts = queue.counts(name)
+        print(f"{name}: 대기 {counts['pending']}개, 처리 중 {counts['leased']}개, 완료 {counts['done']}개, "
+              f"포기 {counts['dead']}개")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="작업 큐로 여러 워커 프로세스/머신에 나눠서 크롤링")
+    parser.add_argument('--queue', help="큐 위치 (SQLite 파일 경로 또는 http://호스트:포트, 기본: crawl_state/tasks.sqlite)")
+    parser.add_argument('--token', default=os.environ.get(TOKEN_ENV),
+                        help=f"큐 서버와 워커가 함께 쓰는 공유 토큰 (기본: {TOKEN_ENV} 환경 변수, serve에서 없으면 새로 만듦)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed = commands.add_parser('seed', help="사이트의 카테고리 첫 페이지 작업을 큐에 추가")
+    seed.add_argument('sites', nargs='+', choices=list(SITES))
+    seed.add_argument('--max-pages', type=int, help="카테고리당 최대 페이지 수 (기본: 사이트 설정)")
+    seed.add_argument('--fresh', action='store_true', help="이전 작업과 결과를 지우고 새로 시작")
+    seed.add_argument('--category', metavar='REGEX', help="카테고리 이름이나 URL에서 찾는 정규식 (대소문자 무시)")
+    seed.add_argument('--category-id', nargs='+', metavar='ID', help="카테고리 ID (카페24 cate_no, 메이크샵 xcode[:mcode])")
+    seed.add_argument('--max-categories', type=int, metavar='N', help="필터를 적용한 뒤 앞에서부터 N개 카테고리만")
+
+    work = commands.add_parser('work', help="큐의 작업이 모두 끝날 때까지 처리")
+    work.add_argument('--site', dest='sites', nargs='*', choices=list(SITES), help="이 사이트의 작업만 처리")
+    work.add_argument('--processes', type=int, default=1, help="이 머신에서 띄울 워커 프로세스 수")
+    work.add_argument('--threads', type=int, default=WORKER_THREADS, help="워커 프로세스당 스레드 수")
+    work.add_argument('--total-processes', type=int, metavar='N',
+                      help="모든 머신에서 함께 도는 워커 프로세스 수 (기본: --processes), 사이트별 요청 속도와 "
+                           "동시 요청 수를 이 수로 나눔")
+    work.add_argument('--visibility-timeout', type=float, default=VISIBILITY_TIMEOUT,
+                      help="임대한 작업을 연장 없이 붙잡아 두는 최대 시간(초)")
+    work.add_argument('--log-level', choices=['debug', 'info', 'warning', 'error'], default=LOG_LEVEL)
+    work.add_argument('--log-json', action='store_true', help="콘솔에도 JSON 한 줄 형식으로 로그 출력")
+
+    serve = commands.add_parser('serve', help="로컬 SQLite 큐를 HTTP로 공개 (다른 머신의 워커용)")
+    serve.add_argument('--host', default=QUEUE_HOST,
+                       help=f"받을 주소 (기본: {QUEUE_HOST}, 다른 머신의 워커를 받으려면 0.0.0.0 등으로 지정)")
+    serve.add_argument('--port', type=int, default=8765)
+
+    status = commands.add_parser('status', help="사이트별 작업 상태")
+    status.add_argument('sites', nargs='*', choices=list(SITES))
+
+    collect = commands.add_parser('collect', help="큐에 쌓인 결과를 결과 파일로 저장")
+    collect.add_argument('sites', nargs='+', choices=list(SITES))
+    collect.add_argument('--export', nargs='*', choices=['csv', 'xlsx'], default=list(EXPORT_FORMATS),
+                         help="Parquet 외에 추가로 저장할 형식 (기본: csv)")
+
+    args = parser.parse_args(argv)
+    if args.command == 'work':
+        if args.total_processes is not None and args.total_processes < 1:
+            parser.error("--total-processes는 1 이상이어야 합니다")
+        run_workers(args.processes, args.total_processes, location=args.queue, sites=args.sites,
+                    threads=args.threads, visibility_timeout=args.visibility_timeout, log_level=args.log_level,
+                    log_json=args.log_json, token=args.token)
+        return
+    if args.command == 'seed':
+        for option, value in (('--max-pages', args.max_pages), ('--max-categories', args.max_categories)):
+            if value is not None and value < 1:
+                parser.error(f"{option}는 1 이상이어야 합니다")
+    if args.command == 'seed' and args.fresh and is_remote(args.queue):
+        parser.error("--fresh는 원격 큐에 쓸 수 없습니다 (큐 서버 머신에서 SQLite 큐 경로로 실행)")
+    if args.command == 'serve' and is_remote(args.queue):
+        parser.error("serve에는 SQLite 파일 경로를 지정해야 합니다")
+
+    queue = open_queue(args.queue, args.token)
+    try:
+        if args.command == 'seed':
+            for name in args.sites:
+                seed_site(queue, get_site(name), args.max_pages, args.fresh,
+                          (args.category, args.category_id, args.max_categories))
+        elif args.command == 'serve':
+            token = args.token
+            if not token:
+                token = secrets.token_urlsafe(24)
+                print(f"공유 토큰을 새로 만들었습니다. 워커는 --token {token} (또는 {TOKEN_ENV} 환경 변수)로 접속하세요.")
+            serve_queue(queue, token, args.host, args.port)
+        elif args.command == 'status':
+            print_status(queue, args.sites or list(SITES))
+        elif args.command == 'collect':
+            for name in args.sites:
+                collect_site(queue, get_site(name), args.export)
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
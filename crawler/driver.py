@@ -0,0 +1,195 @@
+import json
+import os
+import time
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from crawler.metrics import METRICS, log
+
+# 크롬 드라이버 경로 캐시 파일 (ChromeDriverManager().install() 결과를 재사용)
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'jasamolcrlr', 'chromedriver.json')
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
+
+# True면 이미지/미디어/폰트와 외부 위젯/분석 스크립트를 받지 않는 가벼운 브라우저 프로필 사용
+LEAN_PROFILE = True
+
+# 페이지 하나를 여는 데 기다리는 최대 시간(초), 넘으면 로딩을 멈추고 그때까지의 DOM을 사용
+PAGE_LOAD_TIMEOUT = 20
+
+# 가벼운 프로필에서 요청을 막는 URL 패턴 (목록에서는 텍스트와 src 속성만 읽으므로 본문 외에는 필요 없음)
+BLOCKED_URL_PATTERNS = [
+    # 이미지, 미디어, 폰트
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.mp3', '*.m3u8',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    # 외부 위젯 (스냅핏, 크리마 리뷰 - 리뷰 수는 서버가 렌더링한 HTML에 이미 있음)
+    '*snapfit.co.kr*', '*cre.ma*', '*crema.me*',
+    # 광고/분석 스크립트
+    '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*',
+    '*facebook.net*', '*facebook.com/tr*', '*criteo.com*', '*criteo.net*',
+    '*wcs.naver.net*', '*t1.daumcdn.net*', '*keepgrow.com*', '*megadata.co.kr*', '*piclick.kr*',
+]
+
+_resolved_driver_path = None
+
+
+def _read_cached_driver_path():
+    """디스크에 캐시된 크롬 드라이버 경로 읽기"""
+    try:
+        with open(DRIVER_CACHE_FILE, encoding='utf-8') as f:
+            path = json.load(f).get('path')
+    except (OSError, ValueError):
+        return None
+    if path and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+
+def _write_cached_driver_path(path):
+    """크롬 드라이버 경로를 디스크에 캐시"""
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+        with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'path': path, 'resolved_at': time.time()}, f)
+    except OSError as e:
+        log('warning', 'driver_cache_failed', f"크롬 드라이버 경로 캐시 저장 실패: {e}", error=str(e))
+
+
+def resolve_driver_path(refresh=False):
+    """크롬 드라이버 경로 확인 (프로세스당 1회, 디스크 캐시 우선)"""
+    global _resolved_driver_path
+
+    if not refresh:
+        if _resolved_driver_path:
+            return _resolved_driver_path
+        cached_path = _read_cached_driver_path()
+        if cached_path:
+            _resolved_driver_path = cached_path
+            return cached_path
+
+    # 캐시가 없을 때만 ChromeDriverManager로 다운로드/버전 확인
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    _write_cached_driver_path(path)
+    _resolved_driver_path = path
+    return path
+
+
+def build_chrome_options(lean=LEAN_PROFILE):
+    """크롬 옵션 설정 (lean=True면 이미지/알림을 끄고 DOM이 준비되면 바로 반환하는 eager 로딩 사용)"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # 헤드리스 모드 (브라우저 창 표시 안 함)
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    if lean:
+        # driver.get()이 이미지/서브리소스까지 기다리지 않고 DOMContentLoaded에서 반환
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+            'profile.default_content_setting_values.geolocation': 2,
+        })
+    return chrome_options
+
+
+def block_resources(driver, patterns=None):
+    """DevTools로 패턴에 맞는 요청을 막음 (크롬이 아니거나 실패하면 그대로 진행)"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns or BLOCKED_URL_PATTERNS})
+    except (AttributeError, WebDriverException) as e:
+        log('warning', 'block_resources_failed', f"리소스 차단 설정 실패 (모든 리소스를 받습니다): {e}", error=str(e))
+
+
+def _start_driver(driver_path, lean):
+    driver = webdriver.Chrome(service=Service(driver_path), options=build_chrome_options(lean))
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    if lean:
+        block_resources(driver)
+    return driver
+
+
+def setup_driver(lean=LEAN_PROFILE):
+    """셀레늄 웹드라이버 설정"""
+    with METRICS.phase('driver_setup'):
+        try:
+            return _start_driver(resolve_driver_path(), lean)
+        except WebDriverException as e:
+            # 크롬이 업데이트되어 캐시된 드라이버가 맞지 않는 경우 다시 확인
+            log('warning', 'driver_refresh', f"캐시된 크롬 드라이버로 시작 실패, 드라이버를 다시 확인합니다: {e}",
+                error=str(e))
+            return _start_driver(resolve_driver_path(refresh=True), lean)
+
+
+def load_page(driver, url):
+    """페이지 열기 (PAGE_LOAD_TIMEOUT을 넘기면 로딩을 멈추고 그때까지 받은 DOM으로 진행)"""
+    try:
+        with METRICS.phase('page_load'):
+            driver.get(url)
+    except TimeoutException:
+        log('warning', 'page_load_timeout', f"페이지 로딩이 {PAGE_LOAD_TIMEOUT}초를 넘어 로딩을 멈추고 진행합니다: {url}",
+            url=url, timeout=PAGE_LOAD_TIMEOUT)
+        try:
+            driver.execute_script('window.stop();')
+        except WebDriverException:
+            pass
+
+
+class DriverManager:
+    """워커당 브라우저 1개를 유지하고, 브라우저가 죽으면 다시 시작하는 관리자
+
+    페이지마다 세션을 확인하면 WebDriver 요청이 하나 더 들므로, 사용하는 쪽이 WebDriverException을
+    받았을 때만 is_alive()로 확인하고 restart()로 다시 시작한다.
+    """
+
+    def __init__(self, driver_factory=setup_driver):
+        self.driver_factory = driver_factory
+        self.driver = None
+        self.restarts = 0
+
+    def is_alive(self):
+        """브라우저 세션이 살아있는지 확인"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def get(self):
+        """드라이버 반환 (없으면 새로 시작, 세션이 살아있는지는 확인하지 않음)"""
+        if self.driver is None:
+            self.driver = self.driver_factory()
+        return self.driver
+
+    def restart(self):
+        """브라우저 강제 재시작"""
+        self.quit()
+        self.restarts += 1
+        return self.get()
+
+    def quit(self):
+        """브라우저 종료"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.quit()
+        return False
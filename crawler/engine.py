@@ -0,0 +1,810 @@
+import os
+import re
+from collections import deque
+from contextlib import nullcontext
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from crawler.cache import PageCache
+from crawler.detail import DetailStage
+from crawler.fetch import PageNotReady, build_fetcher
+from crawler.history import PriceHistory
+from crawler.images import ImageStage
+from crawler.incremental import KnownProducts, snapshot_path
+from crawler.journal import CrawlJournal, journal_path
+from crawler.metrics import LOG, METRICS, log, metrics_path, run_log_path
+from crawler.index import ProductIndex
+from crawler.pagination import count_total_pages, plan_pages, query_param, set_query_params, strip_tracking_params
+from crawler.pipeline import ParsePool, completed
+from crawler.profiling import CodeProfiler, phase_report, print_phase_report, save_phase_report
+from crawler.retry import DeadLetters, RetryBudget, dead_letter_path, retry_call
+from crawler.scheduler import HostLimiter, crawl_categories
+from crawler.sink import CsvSink, DedupSink, open_output_sink
+from crawler.waits import WAIT_STATS
+
+# 'http': 브라우저 없이 HTTP로 가져오고 상품 목록이 없을 때만 셀레늄 사용, 'selenium': 항상 셀레늄 사용
+FETCH_BACKEND = 'http'
+
+# 셀레늄 사용 시 True면 목록 페이지 소스를 한 번에 파싱, False면 상품 요소마다 WebDriver로 조회
+FAST_PARSE = True
+
+# 동시에 크롤링할 카테고리 수(워커 수)와 같은 호스트에 대한 요청 제한
+MAX_WORKERS = 4
+HOST_CONCURRENCY = 2  # 호스트별 동시 요청 수
+INITIAL_REQUEST_INTERVAL = 1.0  # 같은 호스트로 보내는 요청 간격의 시작 값(초), 응답 상태에 따라 조절됨
+MIN_REQUEST_INTERVAL = 0.25  # 응답이 빨라도 이보다 자주 요청하지 않음 (robots.txt Crawl-delay가 더 크면 그 값)
+
+# 목록 페이지 요청이 실패하면 지수 백오프로 다시 시도할 횟수와 첫 대기 시간(초), 실행 전체의 재시도 한도
+PAGE_RETRIES = 3
+RETRY_BASE_DELAY = 2.0
+RETRY_BUDGET = 100
+
+# 목록 페이지 파싱에 쓰는 프로세스 수 (0이면 페치 스레드에서 바로 파싱)와 카테고리마다 먼저 받아 둘 페이지 수
+PARSE_PROCESSES = os.cpu_count() or 1
+PARSE_AHEAD = 2
+
+# True면 목록 페이지를 디스크에 캐시하고 다음 실행에서 조건부 요청으로 재검증
+USE_PAGE_CACHE = True
+
+# 통합 결과는 Parquet으로 저장하고 여기 있는 형식('csv', 'xlsx')은 추가로 내보냄
+EXPORT_FORMATS = ('csv',)
+
+# 콘솔과 실행 로그에 남길 최소 로그 수준 (debug면 상품 하나하나의 추출 결과까지 출력)
+LOG_LEVEL = 'info'
+
+
+class SiteAdapter:
+    """사이트별 크롤링 규칙 선언
+
+    사이트 모듈은 이 클래스를 상속해 선택자, 페이지 규칙, 출력 파일명을 클래스 속성으로 채우고
+    카테고리 파서(parse_categories)와 상품 필드 추출기(extract_product_info)를 지정한다.
+    페이지 요청, 동시성, 저널, 중복 제거, 저장은 엔진이 공통으로 처리한다.
+    """
+
+    name = ''
+
+    # 상품 목록이 로딩되었는지 판단하는 선택자 (요소가 나타나고 개수가 안정되면 준비 완료)
+    ready_selector = ''
+    # 상품 요소 선택자 (앞에서부터 시도해서 처음으로 찾은 결과 사용)
+    list_selectors = ()
+
+    # 총 상품 수 선택자와 텍스트에서 숫자를 꺼내는 정규식 (None이면 텍스트 전체를 숫자로 읽음)
+    total_selector = ''
+    total_pattern = None
+    # 화면에 보이는 페이지 링크 선택자
+    pagination_selector = ''
+    # 상품이 없는 목록에 나오는 안내 요소 선택자 (없으면 총 상품 수가 0일 때만 빈 목록으로 봄)
+    empty_selector = ''
+    # 첫 페이지에서 페이지당 상품 수를 알 수 없을 때 사용하는 기본값
+    page_size = 20
+    # 같은 호스트로 보내는 요청 간격의 하한(초) (None이면 MIN_REQUEST_INTERVAL, 실제 간격은 응답에 따라 조절됨)
+    min_request_interval = None
+    # 카테고리당 최대 페이지 수 (None이면 모든 페이지)
+    max_pages = None
+    # 증분 크롤링에서 신상품순으로 정렬하는 쿼리 파라미터 (None이면 사이트 기본 정렬 사용)
+    newest_sort = None
+
+    # 상품 URL에서 상품 키를 꺼내는 쿼리 파라미터와 경로 정규식 (못 찾으면 추적용 파라미터를 뺀 상품 URL 사용)
+    product_key_param = None
+    product_key_pattern = None
+
+    # 카테고리 메뉴 HTML
+    category_html = ''
+    # 카테고리 ID로 쓰는 목록 URL의 쿼리 파라미터 (예: 카페24 cate_no, 메이크샵 xcode/mcode)
+    category_id_params = ()
+    # 카테고리 목록 CSV 파일명 (None이면 저장 안 함)
+    categories_file = None
+    # 카테고리별 CSV 저장 디렉토리 (None이면 저장 안 함)
+    category_dir = None
+    # 통합 결과 파일명 (확장자 제외)
+    output_name = ''
+
+    def parse_categories(self, html_content):
+        raise NotImplementedError
+
+    def extract_product_info(self, product_element):
+        raise NotImplementedError
+
+    def categories(self):
+        """카테고리 메뉴 HTML에서 카테고리 목록 추출"""
+        return self.parse_categories(self.category_html)
+
+    def category_name(self, category):
+        """로그와 결과에 쓰는 카테고리 표시 이름"""
+        main_category = category['main_category']
+        sub_category = category['sub_category']
+        return f"{main_category} > {sub_category}" if sub_category else main_category
+
+    def category_id(self, category):
+        """카테고리 URL의 ID 파라미터 값을 ':'로 이은 카테고리 ID (예: '001:007', 없으면 '')"""
+        values = [query_param(category['url'], param) for param in self.category_id_params]
+        return ':'.join(value for value in values if value)
+
+    def category_fields(self, category):
+        """상품 정보에 추가할 카테고리 컬럼"""
+        return {
+            '카테고리_대분류': category['main_category'],
+            '카테고리_소분류': category['sub_category'],
+            '카테고리_전체': self.category_name(category),
+        }
+
+    def listing_url(self, url, incremental=False):
+        """카테고리 목록 URL (증분 크롤링이면 신상품순 정렬 적용)"""
+        if incremental and self.newest_sort:
+            return set_query_params(url, self.newest_sort)
+        return url
+
+    def product_key(self, product):
+        """카테고리나 추적용 파라미터와 상관없이 같은 상품이면 같은 값인 상품 키"""
+        product_url = product.get('상품URL') or ''
+        if self.product_key_param:
+            value = query_param(product_url, self.product_key_param)
+            if value:
+                return value
+        if self.product_key_pattern:
+            key_match = re.search(self.product_key_pattern, product_url)
+            if key_match:
+                return key_match.group(1)
+        return strip_tracking_params(product_url)
+
+    def parse_detail(self, page, html):
+        """상품 상세 페이지에서 옵션 목록 추출 (option_name, option_value, price, stock, sold_out)"""
+        return []
+
+    def find_product_elements(self, page):
+        """목록 페이지에서 상품 요소 찾기"""
+        for selector in self.list_selectors:
+            product_elements = page.find_elements(By.CSS_SELECTOR, selector)
+            if product_elements:
+                return product_elements
+        return []
+
+    def read_total_items(self, page):
+        """목록 페이지에서 총 상품 수 읽기 (확인할 수 없으면 0)"""
+        total_text = page.find_element(By.CSS_SELECTOR, self.total_selector).text.strip()
+        if self.total_pattern is None:
+            return int(total_text)
+        total_match = re.search(self.total_pattern, total_text)
+        return int(total_match.group(1)) if total_match else 0
+
+    def is_empty_listing(self, page):
+        """상품 목록이 없는 페이지가 원래 상품이 없는 정상 페이지인지 (빈 목록 안내가 있거나 총 상품 수가 0)"""
+        if self.empty_selector and page.find_elements(By.CSS_SELECTOR, self.empty_selector):
+            return True
+        if not self.total_selector:
+            return False
+        try:
+            total_text = page.find_element(By.CSS_SELECTOR, self.total_selector).text.strip()
+        except NoSuchElementException:
+            return False
+        # read_total_items()와 달리 숫자를 읽지 못한 경우는 빈 목록으로 보지 않음
+        if self.total_pattern is None:
+            return total_text == '0'
+        total_match = re.search(self.total_pattern, total_text)
+        return bool(total_match) and int(total_match.group(1)) == 0
+
+    def read_visible_max_page(self, page):
+        """화면에 보이는 페이지 링크 중 가장 큰 페이지 번호"""
+        max_page_found = 1
+        for page_link in page.find_elements(By.CSS_SELECTOR, self.pagination_selector):
+            try:
+                max_page_found = max(max_page_found, int(page_link.text.strip()))
+            except ValueError:
+                # 숫자가 아닌 페이지 링크 (예: 다음, 이전)
+                pass
+        return max_page_found
+
+
+def create_fetcher(limiter=None, cache=None, backend=FETCH_BACKEND, fast_parse=FAST_PARSE):
+    """엔진 설정에 맞는 페치 백엔드 생성"""
+    return build_fetcher(backend, fast_parse=fast_parse, limiter=limiter, cache=cache)
+
+
+def plan_category(site, page, category_name):
+    """첫 페이지에서 총 상품 수와 페이지 링크를 읽어 전체 페이지 수 계산"""
+    try:
+        total_items = site.read_total_items(page)
+        log('info', 'total_items', f"[{category_name}] 총 상품 개수: {total_items}", total_items=total_items)
+    except (NoSuchElementException, ValueError) as e:
+        log('warning', 'total_items_missing', f"[{category_name}] 총 상품 개수를 확인할 수 없습니다: {e}",
+            error=str(e))
+        total_items = 0
+
+    try:
+        max_page_found = site.read_visible_max_page(page)
+        log('debug', 'visible_max_page', f"[{category_name}] 발견된 최대 페이지 수: {max_page_found}",
+            max_page=max_page_found)
+    except Exception as e:
+        log('warning', 'pagination_error', f"[{category_name}] 페이지네이션 확인 중 오류: {e}", error=str(e))
+        max_page_found = 1
+
+    # 첫 페이지의 상품 수를 페이지당 상품 수로 보고 총 상품 수로 전체 페이지 수 계산
+    # (페이지 링크는 한 블록만 보이므로 링크만으로는 큰 카테고리를 덜 크롤링함)
+    page_size = len(site.find_product_elements(page)) or site.page_size
+    total_pages = count_total_pages(total_items, page_size, max_page_found)
+    log('info', 'category_planned', f"[{category_name}] 페이지당 상품 수: {page_size}, 계산된 총 페이지 수: {total_pages}",
+        page_size=page_size, total_pages=total_pages)
+    return total_pages
+
+
+def extract_page(site, page, category, category_name):
+    """목록 페이지 하나에서 상품 정보를 추출하고 카테고리 컬럼 추가"""
+    product_elements = site.find_product_elements(page)
+
+    category_fields = site.category_fields(category)
+    products = []
+    # 상품마다 남기는 기록은 debug 수준 (기본 수준에서는 메시지를 만들지도 않음)
+    debug = LOG.enabled('debug')
+    with METRICS.phase('extract'):
+        for idx, product_element in enumerate(product_elements, 1):
+            product_info = site.extract_product_info(product_element)
+            if product_info:
+                product_info.update(category_fields)
+                products.append(product_info)
+                if debug:
+                    log('debug', 'product_extracted', f"[{category_name}] 상품 {idx} 정보 추출 성공: {product_info['상품명']}",
+                        index=idx, name=product_info['상품명'])
+            else:
+                METRICS.inc('extract_failures')
+                if debug:
+                    log('debug', 'product_extract_failed', f"[{category_name}] 상품 {idx} 정보 추출 실패", index=idx)
+
+    log('info', 'page_extracted',
+        f"[{category_name}] 페이지에서 {len(product_elements)}개의 상품 항목 중 {len(products)}개 추출",
+        elements=len(product_elements), products=len(products))
+    return products
+
+
+def resolve_not_ready(site, fetcher, url, error):
+    """상품 목록이 없는 페이지(error: PageNotReady)를 정상적인 빈 페이지로 보거나 대체 수단(셀레늄)으로 한 번 다시 열기
+
+    총 상품 수가 0이거나 빈 목록 안내가 있는 페이지는 그대로 반환하고, 대체 수단으로도 상품 목록이 없으면
+    error를 다시 올린다.
+    """
+    if error.page is not None and site.is_empty_listing(error.page):
+        return error.page
+    try:
+        page = fetcher.fallback_page(url, site.ready_selector)
+    except PageNotReady as e:
+        if e.page is not None and site.is_empty_listing(e.page):
+            return e.page
+        raise
+    if page is None:
+        raise error
+    return page
+
+
+def fetch_with_retry(site, fetcher, url, budget=None, label=''):
+    """목록 페이지를 가져오고 일시적인 오류면 지수 백오프로 다시 시도
+
+    상품 목록이 없는 페이지는 다시 요청하지 않고 resolve_not_ready()로 넘긴다.
+    """
+    with METRICS.timer('fetch'):
+        try:
+            return retry_call(lambda: fetcher.fetch_page(url, site.ready_selector), PAGE_RETRIES, RETRY_BASE_DELAY,
+                              budget=budget, label=label)
+        except PageNotReady as e:
+            return resolve_not_ready(site, fetcher, url, e)
+
+
+def parse_listing(site, page, category, plan=False):
+    """파싱한 목록 페이지에서 (상품 목록, 총 페이지 수) 반환 (plan=False면 총 페이지 수는 None)"""
+    category_name = site.category_name(category)
+    with METRICS.timer('parse'):
+        total_pages = plan_category(site, page, category_name) if plan else None
+        return extract_page(site, page, category, category_name), total_pages
+
+
+def start_listing(site, fetcher, url, category, parse_pool=None, budget=None, label='', plan=False):
+    """목록 페이지를 가져와서 파싱을 시작하고 (상품 목록, 총 페이지 수, ...)를 돌려줄 Future 반환
+
+    parse_pool이 있으면 HTML만 받아서 파싱 프로세스에 넘기므로, 페치 워커는 파싱을 기다리지 않고
+    바로 다음 페이지를 받으러 갈 수 있다. 없으면 이 스레드에서 바로 파싱한다.
+    """
+    if parse_pool is None:
+        page = fetch_with_retry(site, fetcher, url, budget, label)
+        # 이 스레드에서 잰 파싱 시간과 추출 실패 수는 이미 지표에 들어 있음
+        return completed(parse_listing(site, page, category, plan) + (None, 0, ()))
+    try:
+        with METRICS.timer('fetch'):
+            html, page_url, _ = retry_call(lambda: fetcher.fetch_html(url, site.ready_selector), PAGE_RETRIES,
+                                           RETRY_BASE_DELAY, budget=budget, label=label)
+    except PageNotReady as e:
+        # 셀레늄 백엔드는 HTML을 넘기기 전에 상품 목록을 기다리므로 없으면 여기서 바로 처리
+        with METRICS.timer('fetch'):
+            page = resolve_not_ready(site, fetcher, url, e)
+        return completed(parse_listing(site, page, category, plan) + (None, 0, ()))
+    try:
+        return parse_pool.submit(site.name, html, page_url, category, plan)
+    except BaseException:
+        fetcher.confirm(url, False)
+        raise
+
+
+def finish_listing(site, fetcher, future, url, category, budget=None, label='', plan=False):
+    """start_listing()의 결과를 기다려서 (상품 목록, 총 페이지 수) 반환
+
+    결과는 (상품 목록, 총 페이지 수, 구간별 시간, 추출 실패 수, 파싱 프로세스의 로그 기록)이다.
+    """
+    # 파싱이 끝나면 성공, 실패, 취소와 상관없이 캐시 저장을 기다리던 페이지를 정리
+    ready = False
+    try:
+        products, total_pages, phase_seconds, extract_failures, records = future.result()
+        ready = True
+    except PageNotReady:
+        # HTML에 상품 목록이 없으면 (빈 카테고리는 파싱 프로세스에서 이미 걸러짐) 셀레늄으로 다시 열어서 이 스레드에서 파싱
+        with METRICS.timer('fetch'):
+            page = resolve_not_ready(site, fetcher, url, PageNotReady(f"'{site.ready_selector}' 요소가 없습니다"))
+        return parse_listing(site, page, category, plan)
+    finally:
+        fetcher.confirm(url, ready)
+    # 파싱 프로세스에서 남긴 로그는 이 스레드의 사이트/카테고리를 붙여서 실행 로그에 씀
+    LOG.replay(records, **METRICS.context_labels())
+    # 파싱 프로세스에서 잰 시간과 추출 실패 수는 이 프로세스의 지표에 합침
+    for phase, seconds in (phase_seconds or {}).items():
+        METRICS.observe(phase, seconds)
+    if extract_failures:
+        METRICS.inc('extract_failures', extract_failures)
+    return products, total_pages
+
+
+def crawl_products(site, url, category, max_pages=None, fetcher=None, journal=None, known=None,
+                   dead_letters=None, budget=None, parse_pool=None):
+    """페치 백엔드로 카테고리의 목록 페이지를 가져와서 페이지마다 상품 정보 목록을 yield
+
+    결과를 모아 두지 않고 페이지가 끝날 때마다 바로 넘기므로 호출하는 쪽에서 스트리밍 출력에 기록한다.
+    known(KnownProducts)을 넘기면 증분 모드로 신상품순 목록을 보다가, 한 페이지의 상품이 모두
+    이전 스냅샷에 있으면 남은 페이지는 가져오지 않는다.
+    페이지마다 따로 재시도하고, 재시도까지 실패한 페이지는 dead_letters(DeadLetters)에 넘긴 뒤
+    다음 페이지로 넘어간다.
+    parse_pool(ParsePool)을 넘기면 PARSE_AHEAD개 페이지까지 먼저 받아 두고 파싱은 프로세스 풀에서
+    진행한다 (증분 모드에서는 멈출 페이지를 넘겨 받지 않도록 미리 받지 않음). 페이지 순서는 유지된다.
+    """
+    # 페치 백엔드가 없으면 이 카테고리에서만 쓰는 백엔드를 생성
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = create_fetcher()
+    collected = 0
+    category_name = site.category_name(category)
+    url = site.listing_url(url, incremental=known is not None)
+    lookahead = PARSE_AHEAD if parse_pool is not None and known is None else 0
+    # 가져왔지만 아직 결과를 넘기지 않은 페이지 (페이지 번호, URL, Future, 저널에서 꺼낸 행)
+    pending = deque()
+
+    try:
+        # 이어하기: 저널에 총 페이지 수가 있으면 첫 페이지를 다시 받지 않음
+        first_page = None
+        total_pages = journal.total_pages(url) if journal else None
+        if total_pages:
+            log('info', 'journal_total_pages', f"[{category_name}] 저널에 기록된 총 페이지 수: {total_pages}",
+                total_pages=total_pages)
+        else:
+            label = f"[{category_name}] 첫 페이지"
+            try:
+                future = start_listing(site, fetcher, url, category, parse_pool, budget, label, plan=True)
+                first_page = finish_listing(site, fetcher, future, url, category, budget, label, plan=True)
+            except Exception as e:
+                # 첫 페이지가 없으면 페이지 수를 알 수 없으므로 카테고리 전체를 나중에 다시 시도
+                METRICS.inc('failed_pages')
+                log('warning', 'category_failed', f"[{category_name}] 첫 페이지를 가져오지 못해 나중에 다시 시도합니다: {e}",
+                    url=url, error=str(e))
+                if dead_letters is not None:
+                    dead_letters.add(category, url, error=e)
+                return
+            total_pages = first_page[1]
+
+        site_total_pages = total_pages
+
+        # 모든 페이지 URL을 미리 계획 (최대 페이지 수 제한 포함)
+        page_urls = plan_pages(url, total_pages, max_pages)
+        log('info', 'pages_planned', f"[{category_name}] 크롤링할 총 페이지 수: {len(page_urls)}",
+            pages=len(page_urls))
+
+        def finish_pages(keep):
+            """대기 중인 페이지가 keep개만 남을 때까지 앞에서부터 결과를 마무리해서 (페이지 번호, 상품 목록) yield"""
+            nonlocal collected
+            while len(pending) > keep:
+                current_page, page_url, future, journal_rows = pending.popleft()
+                if journal_rows is not None:
+                    collected += len(journal_rows)
+                    log('info', 'page_from_journal', f"[{category_name}] 페이지 {current_page}는 저널에 기록되어 있어 건너뜁니다.",
+                        page=current_page, products=len(journal_rows))
+                    yield current_page, journal_rows
+                    continue
+
+                label = f"[{category_name}] 페이지 {current_page}"
+                try:
+                    products = finish_listing(site, fetcher, future, page_url, category, budget, label)[0]
+                    collected += len(products)
+                    METRICS.inc('pages')
+                    METRICS.inc('products', len(products))
+                    log('info', 'page_done', f"[{category_name}] 페이지 {current_page} 완료, 현재까지 수집된 총 상품 수: {collected}",
+                        page=current_page, products=len(products), collected=collected)
+
+                    # 완료된 페이지를 저널에 기록 (크래시 후 이어하기용)
+                    if journal:
+                        journal.record_page(url, current_page, products, site_total_pages)
+
+                except Exception as e:
+                    # 이 페이지만 나중에 다시 시도하고 나머지 페이지는 계속 크롤링
+                    METRICS.inc('failed_pages')
+                    log('warning', 'page_failed',
+                        f"[{category_name}] 페이지 {current_page} 처리 중 오류 발생, 나중에 다시 시도합니다: {e}",
+                        page=current_page, url=page_url, error=str(e))
+                    if dead_letters is not None:
+                        dead_letters.add(category, url, current_page, page_url, site_total_pages, e)
+                    continue
+
+                yield current_page, products
+
+        for current_page, page_url in enumerate(page_urls, 1):
+            # 이전 실행에서 끝난 페이지는 저널에 기록된 결과를 그대로 사용
+            if journal and journal.is_done(url, current_page):
+                pending.append((current_page, page_url, None, journal.page_rows(url, current_page)))
+            elif current_page == 1 and first_page is not None:
+                # 페이지 수를 계산하려고 이미 받은 첫 페이지
+                pending.append((current_page, page_url, completed(first_page + (None, 0, ())), None))
+            else:
+                log('debug', 'page_fetch', f"[{category_name}] 페이지 {current_page}/{len(page_urls)}: {page_url}",
+                    page=current_page, url=page_url)
+                try:
+                    future = start_listing(site, fetcher, page_url, category, parse_pool, budget,
+                                           f"[{category_name}] 페이지 {current_page}")
+                except Exception as e:
+                    METRICS.inc('failed_pages')
+                    log('warning', 'page_failed',
+                        f"[{category_name}] 페이지 {current_page} 처리 중 오류 발생, 나중에 다시 시도합니다: {e}",
+                        page=current_page, url=page_url, error=str(e))
+                    if dead_letters is not None:
+                        dead_letters.add(category, url, current_page, page_url, site_total_pages, e)
+                    continue
+                pending.append((current_page, page_url, future, None))
+
+            # 파싱 중인 페이지가 lookahead개를 넘으면 가장 앞 페이지의 결과부터 넘김
+            for done_page, products in finish_pages(lookahead):
+                yield products
+
+                # 증분 모드: 페이지 전체가 이미 아는 상품이면 이후 페이지도 이전에 수집한 상품
+                if known is not None and known.all_known(site.product_key(product) for product in products):
+                    log('info', 'incremental_stop',
+                        f"[{category_name}] 페이지 {done_page}의 상품이 모두 이전에 수집한 상품이라 페이징을 멈춥니다.",
+                        page=done_page)
+                    return
+
+        for done_page, products in finish_pages(0):
+            yield products
+
+    except Exception as e:
+        log('error', 'category_error', f"[{category_name}] 크롤링 중 오류 발생: {e}", error=str(e))
+
+    finally:
+        # 멈춘 뒤 남은 파싱 작업은 결과를 기다리지 않고, 캐시 저장을 기다리던 페이지도 버림
+        for _, page_url, future, _ in pending:
+            if future is not None:
+                future.cancel()
+                fetcher.confirm(page_url, False)
+        if own_fetcher:
+            fetcher.close()
+
+
+def retry_dead_letters(site, dead_letters, fetcher, journal, handle, max_pages=None, known=None):
+    """실행 마지막에 실패한 페이지를 한 번 더 시도하고 handle(category, products)로 넘김
+
+    그래도 실패한 항목을 담은 DeadLetters를 반환한다.
+    """
+    remaining = DeadLetters()
+    for letter in dead_letters:
+        category = letter['category']
+        category_name = site.category_name(category)
+        with METRICS.labels(category=category_name):
+            if letter['page'] is None:
+                log('info', 'dead_letter_retry', f"[{category_name}] 카테고리를 처음부터 다시 시도합니다.")
+                for products in crawl_products(site, category['url'], category, max_pages, fetcher, journal, known,
+                                               remaining):
+                    handle(category, products)
+                continue
+
+            log('info', 'dead_letter_retry',
+                f"[{category_name}] 페이지 {letter['page']}를 다시 시도합니다: {letter['page_url']}",
+                page=letter['page'], url=letter['page_url'])
+            try:
+                page = fetch_with_retry(site, fetcher, letter['page_url'],
+                                        label=f"[{category_name}] 페이지 {letter['page']}")
+                products = extract_page(site, page, category, category_name)
+            except Exception as e:
+                log('error', 'dead_letter_failed',
+                    f"[{category_name}] 페이지 {letter['page']}를 끝내 가져오지 못했습니다: {e}",
+                    page=letter['page'], url=letter['page_url'], error=str(e))
+                remaining.add(category, letter['listing_url'], letter['page'], letter['page_url'],
+                              letter['total_pages'], e)
+                continue
+            METRICS.inc('pages')
+            METRICS.inc('products', len(products))
+            if journal:
+                journal.record_page(letter['listing_url'], letter['page'], products, letter['total_pages'])
+            handle(category, products)
+    return remaining
+
+
+def select_categories(site, category_links, pattern=None, ids=None, limit=None):
+    """크롤링할 카테고리만 골라냄
+
+    pattern은 카테고리 이름이나 URL에서 찾는 정규식(대소문자 무시)이고, ids는 카테고리 ID 목록이다.
+    ID는 앞부분만 맞아도 되므로 '001'은 '001:007' 같은 하위 카테고리도 포함한다. limit은 앞에서부터 고를 개수.
+    """
+    selected = list(category_links)
+    if pattern:
+        regex = re.compile(pattern, re.IGNORECASE)
+        selected = [
+            category for category in selected
+            if regex.search(site.category_name(category)) or regex.search(category['url'])
+        ]
+    if ids:
+        wanted = {str(category_id) for category_id in ids}
+
+        def matches_id(category):
+            category_id = site.category_id(category)
+            return any(category_id == wanted_id or category_id.startswith(wanted_id + ':') for wanted_id in wanted)
+
+        selected = [category for category in selected if matches_id(category)]
+    if limit:
+        selected = selected[:limit]
+    return selected
+
+
+def category_csv_path(site, category_name, suffix=''):
+    """카테고리별 CSV 파일 경로 (파일명에 쓸 수 없는 문자는 제거, 증분 크롤링은 suffix='_new')"""
+    safe_category_name = re.sub(r'[\\/*?:"<>|]', "", category_name)
+    return os.path.join(site.category_dir, f'{safe_category_name}{suffix}.csv')
+
+
+def result_paths(site, output, category_links, suffix=''):
+    """이번 실행에서 쓴 통합 결과 파일과 카테고리별 CSV 파일 경로"""
+    paths = [sink.path for sink in output.sink.sinks]
+    if site.category_dir:
+        paths.extend(category_csv_path(site, site.category_name(category), suffix) for category in category_links)
+    return paths
+
+
+def run_site(site, resume=False, max_pages=None, max_workers=MAX_WORKERS, exports=EXPORT_FORMATS,
+             use_cache=USE_PAGE_CACHE, incremental=False, details=False, images=False,
+             parse_processes=PARSE_PROCESSES, log_level=LOG_LEVEL, log_json=False, profile=None,
+             category_pattern=None, category_ids=None, max_categories=None, backend=FETCH_BACKEND):
+    """사이트의 모든 카테고리를 크롤링하면서 결과를 출력 파일에 바로 기록
+
+    incremental=True면 카테고리마다 신상품순으로 보다가 이전 스냅샷의 상품만 있는 페이지에서 멈추고,
+    결과는 전체 결과 파일을 덮어쓰지 않도록 '<출력 이름>_new' 파일에, 카테고리별 CSV도 '<카테고리>_new.csv'에 저장한다.
+    details=True면 목록에서 찾은 상품의 상세 페이지(옵션/재고)를 별도 워커 풀에서 동시에 가져온다.
+    images=True면 목록에서 찾은 상품 이미지를 별도 워커 풀에서 동시에 받고, 결과 파일을 다 쓴 뒤 '이미지해시'를 채운다.
+    parse_processes개의 프로세스가 목록 페이지를 파싱하고 페치 워커는 네트워크 요청만 한다.
+    실행 로그는 log_level 이상만 JSON Lines 파일(crawl_state/logs)에 남기고 콘솔에는 메시지를 출력하며
+    (log_json=True면 콘솔에도 JSON), 실행 지표는 요약과 함께 Prometheus 텍스트 파일(crawl_state/metrics)로 저장한다.
+    profile을 지정하면 세부 구간(드라이버 준비, 페이지 로딩, HTML 파싱, 상품 추출, 파일 마감)까지 재서
+    구간별/카테고리별 시간을 출력하고 crawl_state/profiles에 저장한다. 'cprofile'이나 'pyinstrument'면
+    카테고리 워커를 하나로 줄이고 그 스레드를 코드 프로파일러로도 감싼다 (CodeProfiler 참고).
+    category_pattern, category_ids, max_categories로 일부 카테고리만 크롤링한다 (select_categories 참고).
+    """
+    LOG.configure(log_level, log_json, run_log_path(site.name))
+    METRICS.reset()
+    METRICS.profiling = bool(profile)
+    try:
+        profiler = CodeProfiler(profile) if profile and profile != 'timers' else None
+        with METRICS.labels(site=site.name):
+            _run_site(site, resume, max_pages, max_workers, exports, use_cache, incremental, details, images,
+                      parse_processes, profiler, (category_pattern, category_ids, max_categories), backend)
+    except Exception as e:
+        log('error', 'run_failed', f"실행 중 오류 발생: {e}", site=site.name, error=str(e))
+        import traceback
+        traceback.print_exc()
+    finally:
+        METRICS.write_prometheus(metrics_path(site.name))
+        LOG.close()
+
+
+def _run_site(site, resume, max_pages, max_workers, exports, use_cache, incremental, details, images,
+              parse_processes, profiler=None, category_filter=(None, None, None), backend=FETCH_BACKEND):
+    category_links = site.categories()
+    if site.categories_file:
+        with CsvSink(site.categories_file) as categories_sink:
+            categories_sink.write(category_links)
+        log('info', 'categories_saved', f"카테고리 정보 CSV 파일 저장 완료: {site.categories_file}",
+            path=site.categories_file)
+
+    log('info', 'categories_found', f"총 {len(category_links)}개의 카테고리 URL을 추출했습니다.",
+        categories=len(category_links))
+
+    if any(category_filter):
+        total_categories = len(category_links)
+        category_links = select_categories(site, category_links, *category_filter)
+        log('info', 'categories_selected',
+            f"카테고리 필터를 적용해 {total_categories}개 중 {len(category_links)}개만 크롤링합니다.",
+            categories=len(category_links))
+        if not category_links:
+            log('warning', 'no_categories', "필터에 맞는 카테고리가 없습니다.")
+            return
+
+    # 최대 페이지 수 설정 (None이면 사이트 기본값 사용)
+    if max_pages is None:
+        max_pages = site.max_pages
+
+    def record_products(products, category_sink=None):
+        """페이지 하나의 상품 행을 색인/이력/추가 단계와 출력 파일에 반영"""
+        # 상품 키로 색인에서 상품ID를 찾아 붙이고 그 ID로 중복 제거
+        index.assign(site, products)
+        history.record(products)
+        if image_stage:
+            image_stage.submit(products)
+        if detail_stage:
+            detail_stage.submit(products)
+        known.add(product['상품키'] for product in products)
+        with METRICS.timer('write'):
+            output.write(products)
+            if category_sink:
+                category_sink.write(products)
+
+    def crawl_category(i, category, fetcher):
+        """워커 스레드에서 카테고리 하나를 크롤링하고 기록한 상품 수 반환"""
+        category_name = site.category_name(category)
+        log('info', 'category_start', f"\n===== ({i}/{len(category_links)}) {category_name} 카테고리 크롤링 시작 =====\n"
+            f"URL: {category['url']}", category=category_name, url=category['url'])
+
+        # 카테고리별 파일은 카테고리 안에서만 중복 제거
+        category_sink = None
+        if site.category_dir:
+            category_sink = DedupSink(CsvSink(category_csv_path(site, category_name, result_suffix)), '상품ID')
+
+        count = 0
+        # 이 스레드에서 기록하는 지표(페치 백엔드, 호스트 제한기 포함)에 카테고리 라벨을 붙임
+        profiling = profiler.thread() if profiler else nullcontext()
+        with METRICS.labels(site=site.name, category=category_name), profiling:
+            try:
+                for products in crawl_products(site, category['url'], category, max_pages, fetcher, journal,
+                                               known if incremental else None, dead_letters, budget, parse_pool):
+                    record_products(products, category_sink)
+                    count += len(products)
+            finally:
+                if category_sink:
+                    category_sink.close()
+                    log('info', 'category_saved',
+                        f"\n[{category_name}] 원본 상품 수: {category_sink.rows_seen}, "
+                        f"중복 제거 후 상품 수: {category_sink.rows_written}",
+                        category=category_name, rows_seen=category_sink.rows_seen,
+                        rows_written=category_sink.rows_written)
+                    if category_sink.rows_written:
+                        log('info', 'category_csv_saved', f"[{category_name}] CSV 파일 저장 완료: {category_sink.sink.path}",
+                            category=category_name, path=category_sink.sink.path)
+        return count
+
+    # 이전 실행까지 수집한 상품 ID (전체 크롤링도 이번에 본 ID를 스냅샷에 추가)
+    known = KnownProducts(snapshot_path(site.name))
+    if incremental:
+        log('info', 'incremental', f"증분 크롤링: 이전 스냅샷의 상품 ID {len(known)}개", known_products=len(known))
+        if not len(known):
+            log('info', 'no_snapshot', "이전 스냅샷이 없어 모든 페이지를 크롤링합니다.")
+
+    # 통합 결과 출력 (모든 카테고리에 걸쳐 중복 제거 후 Parquet과 추가 형식에 바로 기록)
+    # 증분 크롤링은 일찍 멈춘 일부 결과이므로 통합 파일과 카테고리별 파일 모두 전체 결과를 덮어쓰지 않음
+    result_suffix = '_new' if incremental else ''
+    output_name = f'{site.output_name}{result_suffix}'
+    output = open_output_sink(output_name, '상품ID', exports)
+
+    # 실행 간에 공유하는 상품 색인 (상품 키 -> 정수 상품ID)
+    index = ProductIndex(site.name)
+    log('info', 'index_loaded', f"상품 색인에 등록된 {site.name} 상품 수: {len(index)}", indexed_products=len(index))
+
+    # 가격/할인율/품절/색상이 바뀐 상품만 이번 실행 시각으로 이력에 추가
+    history = PriceHistory(site.name)
+
+    # 완료된 페이지를 기록하는 저널 (resume=True면 끝난 페이지를 건너뜀)
+    journal = CrawlJournal(journal_path(site.name), resume)
+
+    # 재시도까지 실패한 페이지는 모든 카테고리가 끝난 뒤 한 번 더 시도
+    dead_letters = DeadLetters()
+    budget = RetryBudget(RETRY_BUDGET)
+
+    # 여러 카테고리를 동시에 크롤링 (같은 사이트에 대한 동시 요청 수와 요청 속도는 HostLimiter가 조절)
+    limiter = HostLimiter(HOST_CONCURRENCY, site.min_request_interval or MIN_REQUEST_INTERVAL,
+                          INITIAL_REQUEST_INTERVAL)
+    # 워커들이 함께 쓰는 페이지 캐시
+    cache = PageCache() if use_cache else None
+    # 상세 페이지 단계는 같은 호스트 제한과 캐시를 공유
+    detail_stage = DetailStage(site, limiter, cache) if details else None
+    # 이미지는 내용 해시로 한 번만 저장 (이미지 호스트는 목록 페이지와 따로 제한)
+    image_stage = ImageStage() if images else None
+    # 셀레늄 요소로 직접 추출할 때(FAST_PARSE=False)는 HTML을 넘길 수 없으므로 스레드에서 파싱
+    if profiler and parse_processes:
+        # 코드 프로파일러는 워커 스레드만 보므로 파싱도 워커 스레드에서 해야 파싱 경로가 결과에 나옴
+        log('info', 'profile_inline_parse', "코드 프로파일링 중에는 파싱 프로세스 없이 워커 스레드에서 파싱합니다.")
+        parse_processes = 0
+    if profiler and max_workers > 1:
+        # 코드 프로파일러는 한 번에 하나만 켤 수 있으므로 카테고리를 차례로 크롤링
+        log('info', 'profile_single_worker', "코드 프로파일링 중에는 카테고리를 하나씩 크롤링합니다.")
+        max_workers = 1
+    parse_pool = ParsePool(parse_processes) if parse_processes and FAST_PARSE else None
+    try:
+        completed = crawl_categories(category_links, crawl_category, lambda: create_fetcher(limiter, cache, backend),
+                                     max_workers)
+        for done, (i, category, count) in enumerate(completed, 1):
+            log('info', 'category_done',
+                f"\n===== ({done}/{len(category_links)}) {category['url']} 카테고리 크롤링 완료: {count or 0}개 상품 =====",
+                url=category['url'], products=count or 0)
+
+        if len(dead_letters):
+            log('info', 'dead_letter_retry', f"\n===== 실패한 페이지 {len(dead_letters)}개 다시 시도 =====",
+                pages=len(dead_letters))
+            retry_sinks = {}
+
+            def record_retried(category, products):
+                # 카테고리별 파일에는 기존 내용 뒤에 덧붙임
+                category_sink = None
+                if site.category_dir:
+                    category_name = site.category_name(category)
+                    if category_name not in retry_sinks:
+                        retry_sinks[category_name] = DedupSink(
+                            CsvSink(category_csv_path(site, category_name, result_suffix), append=True), '상품ID')
+                    category_sink = retry_sinks[category_name]
+                record_products(products, category_sink)
+
+            try:
+                with create_fetcher(limiter, cache, backend) as fetcher:
+                    dead_letters = retry_dead_letters(site, dead_letters, fetcher, journal, record_retried,
+                                                      max_pages, known if incremental else None)
+            finally:
+                for category_sink in retry_sinks.values():
+                    category_sink.close()
+        dead_letters.save(dead_letter_path(site.name))
+        if len(dead_letters):
+            log('warning', 'dead_letters_saved',
+                f"끝내 가져오지 못한 페이지 {len(dead_letters)}개를 기록했습니다: {dead_letter_path(site.name)} "
+                f"(--resume으로 다시 실행하면 이 페이지들만 새로 가져옵니다)",
+                pages=len(dead_letters), path=dead_letter_path(site.name))
+    finally:
+        # 중간에 실패해도 그때까지 기록한 결과는 파일로 남김
+        if parse_pool:
+            parse_pool.close()
+        if detail_stage:
+            detail_stage.close()
+        journal.close()
+        with METRICS.phase('export'):
+            output.close()
+        if image_stage:
+            # 결과 파일을 다 쓴 뒤 이번 실행에서 받은 이미지의 해시를 채움
+            try:
+                image_stage.fill(result_paths(site, output, category_links, result_suffix))
+            finally:
+                image_stage.close()
+        known.save()
+        index.close()
+        history.close()
+
+    WAIT_STATS.print_summary()
+    limiter.print_summary()
+    if parse_pool:
+        parse_pool.print_summary()
+    if cache:
+        cache.print_summary()
+    if detail_stage:
+        detail_stage.print_summary()
+    if image_stage:
+        image_stage.print_summary()
+
+    METRICS.print_summary()
+    if METRICS.profiling:
+        report = phase_report()
+        elapsed = METRICS.summary()['elapsed_seconds']
+        print_phase_report(report, elapsed)
+        save_phase_report(site.name, report, elapsed)
+    if profiler:
+        profiler.save(site.name)
+
+    log('info', 'index_updated', f"새로 색인에 추가된 상품 수: {index.new_products}, 가격/재고 변경 이력: {history.changes}건",
+        new_products=index.new_products, history_changes=history.changes)
+    if output.rows_written:
+        log('info', 'output_saved', f"\n모든 카테고리 원본 상품 수: {output.rows_seen}, 중복 제거 후 상품 수: {output.rows_written}",
+            rows_seen=output.rows_seen, rows_written=output.rows_written)
+        for sink in output.sink.sinks:
+            log('info', 'output_file_saved', f"모든 카테고리 통합 파일 저장 완료: {sink.path}", path=sink.path)
+
+    log('info', 'run_summary', f"\n크롤링 완료! 총 {output.rows_written}개의 상품 정보를 저장했습니다.",
+        **METRICS.summary())
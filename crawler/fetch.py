@@ -0,0 +1,261 @@
+from contextlib import nullcontext
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from crawler.driver import DriverManager, USER_AGENT, load_page
+from crawler.metrics import METRICS, log
+from crawler.parsing import SoupElement
+from crawler.scheduler import RequestTicket
+from crawler.waits import WAIT_STATS, wait_for_ready
+
+FETCH_BACKENDS = ('http', 'selenium')
+
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+
+class PageNotReady(Exception):
+    """받아온 페이지에 기대한 요소(상품 목록)가 없음
+
+    page에는 받아온 페이지의 파싱 대상이 담겨 있어서, 빈 카테고리처럼 상품 목록이 원래 없는 페이지인지
+    호출하는 쪽에서 확인할 수 있다.
+    """
+
+    def __init__(self, message, page=None):
+        super().__init__(message)
+        self.page = page
+
+
+def request_slot(limiter, url):
+    """호스트 제한기가 있으면 요청 슬롯을 점유 (응답 상태를 적을 RequestTicket을 돌려줌)"""
+    return limiter.slot(url) if limiter else nullcontext(RequestTicket())
+
+
+class Fetcher:
+    """페치 백엔드 공통 인터페이스"""
+
+    def fetch_page(self, url, ready_selector=None):
+        raise NotImplementedError
+
+    def fetch_html(self, url, ready_selector=None):
+        """파싱하지 않은 본문 HTML과 최종 URL, 새로 받았는지 여부 반환"""
+        raise NotImplementedError
+
+    def confirm(self, url, ready):
+        """fetch_html()로 받은 페이지를 파싱한 쪽에서 ready_selector 확인 결과를 알려 줌"""
+
+    def fallback_page(self, url, ready_selector=None):
+        """기대한 요소가 없는 페이지를 대체 수단으로 한 번 열기 (대체 수단이 없으면 None)"""
+        return None
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class HttpFetcher(Fetcher):
+    """브라우저 없이 HTTP로 서버 렌더링 페이지를 가져오는 백엔드 (keep-alive 연결 풀 사용)
+
+    cache(PageCache)를 넘기면 저장된 페이지는 조건부 요청으로 재검증하고 304면 캐시 본문을 쓴다.
+    """
+
+    def __init__(self, pool_size=10, timeout=15, headers=None, limiter=None, cache=None):
+        self.timeout = timeout
+        self.limiter = limiter
+        self.cache = cache
+        # ready_selector 확인을 기다리는 페이지 {URL: (HTML, 최종 URL, 응답 헤더)}
+        # (파싱이 성공하든 실패하거나 취소되든 호출하는 쪽이 confirm()으로 꺼내야 함)
+        self._unconfirmed = {}
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url, text=True, **kwargs):
+        """GET 요청 (응답 인코딩 보정 포함, text=False면 이미지 같은 바이너리 본문이라 보정하지 않음)"""
+        kwargs.setdefault('timeout', self.timeout)
+        with request_slot(self.limiter, url) as ticket:
+            response = self.session.get(url, **kwargs)
+            # 429/5xx와 Retry-After는 제한기가 요청 속도를 늦추는 데 사용
+            ticket.status = response.status_code
+            ticket.retry_after = response.headers.get('Retry-After')
+        METRICS.inc('bytes', len(response.content))
+        response.raise_for_status()
+        # charset이 없는 응답은 requests가 ISO-8859-1로 가정하므로 본문에서 추정
+        if text and (not response.encoding or response.encoding.upper() == 'ISO-8859-1'):
+            response.encoding = response.apparent_encoding
+        return response
+
+    def _load(self, url):
+        """캐시를 거쳐 본문을 가져와서 (HTML, 최종 URL, 새로 받은 응답 또는 None) 반환"""
+        cached = self.cache.lookup(url) if self.cache else None
+        response = None
+        if cached and self.cache.is_fresh(cached):
+            html = self.cache.read_body(url)
+            page_url = cached['final_url']
+        else:
+            headers = self.cache.conditional_headers(cached) if cached else {}
+            response = self.get(url, headers=headers)
+            if cached and response.status_code == 304:
+                # 바뀌지 않은 페이지는 본문을 다시 받지 않고 캐시에서 꺼냄
+                html = self.cache.read_body(url, revalidated=True)
+                page_url = cached['final_url']
+                response = None
+            else:
+                if cached:
+                    self.cache.record_miss()
+                html = response.text
+                page_url = response.url
+        return html, page_url, response
+
+    def fetch_html(self, url, ready_selector=None):
+        """본문 HTML과 최종 URL, 새로 받았는지 여부 반환 (캐시 적중이나 304면 False)
+
+        파싱하지 않으므로 ready_selector 확인은 HTML을 파싱하는 쪽에서 한다.
+        ready_selector를 넘기면 confirm()으로 확인 결과를 받은 뒤에야 캐시에 저장한다.
+        """
+        html, page_url, response = self._load(url)
+        if self.cache and response is not None:
+            if ready_selector:
+                self._unconfirmed[url] = (html, page_url, response.headers)
+            else:
+                self.cache.store(url, html, page_url, response.headers)
+        return html, page_url, response is not None
+
+    def confirm(self, url, ready):
+        """상품 목록이 있는 정상 페이지만 캐시에 저장"""
+        pending = self._unconfirmed.pop(url, None)
+        if pending and ready:
+            self.cache.store(url, *pending)
+
+    def fetch_page(self, url, ready_selector=None):
+        """페이지를 받아서 한 번 파싱한 루트 요소 반환"""
+        html, page_url, response = self._load(url)
+        page = SoupElement.from_html(html, page_url)
+        if ready_selector and not page.find_elements(By.CSS_SELECTOR, ready_selector):
+            raise PageNotReady(f"'{ready_selector}' 요소가 없습니다", page)
+
+        # 상품 목록이 있는 정상 페이지만 캐시에 저장
+        if self.cache and response is not None:
+            self.cache.store(url, html, page_url, response.headers)
+        return page
+
+    def close(self):
+        self.session.close()
+
+
+class SeleniumFetcher(Fetcher):
+    """헤드리스 크롬으로 페이지를 여는 백엔드 (스크립트 렌더링이 필요할 때 사용)"""
+
+    def __init__(self, driver_manager=None, wait_timeout=10, stable_for=0.3, fast_parse=True, limiter=None,
+                 wait_stats=WAIT_STATS):
+        self.driver_manager = driver_manager or DriverManager()
+        self.limiter = limiter
+        self.wait_timeout = wait_timeout
+        self.stable_for = stable_for
+        self.fast_parse = fast_parse
+        self.wait_stats = wait_stats
+
+    def _parse(self, driver):
+        """열린 페이지의 파싱 대상 (fast_parse가 꺼져 있으면 드라이버 자체)"""
+        if not self.fast_parse:
+            return driver
+        # 페이지 소스를 한 번만 가져와서 파싱 (상품/필드별 WebDriver 요청 없음)
+        return SoupElement.from_html(driver.page_source, driver.current_url)
+
+    def _open(self, url, ready_selector):
+        driver = self.driver_manager.get()
+        with request_slot(self.limiter, url):
+            load_page(driver, url)
+        # 상품 목록이 나타나고 더 이상 바뀌지 않을 때까지만 대기
+        if ready_selector:
+            try:
+                wait_for_ready(driver, ready_selector, self.wait_timeout, self.stable_for, stats=self.wait_stats)
+            except TimeoutException as e:
+                # 기다려도 상품 목록이 없는 페이지는 다시 열어도 같으므로 재시도하지 않도록 PageNotReady로 알림
+                raise PageNotReady(e.msg or str(e), self._parse(driver)) from e
+        return driver
+
+    def _open_or_restart(self, url, ready_selector):
+        try:
+            return self._open(url, ready_selector)
+        except WebDriverException:
+            # 브라우저가 죽은 경우 다시 시작해서 한 번 더 시도
+            if self.driver_manager.is_alive():
+                raise
+            log('warning', 'browser_restart', f"브라우저를 다시 시작하고 페이지를 재시도합니다: {url}", url=url)
+            self.driver_manager.restart()
+            return self._open(url, ready_selector)
+
+    def fetch_page(self, url, ready_selector=None):
+        """페이지를 열고 파싱 대상 반환 (fast_parse가 꺼져 있으면 드라이버 자체를 반환)"""
+        return self._parse(self._open_or_restart(url, ready_selector))
+
+    def fetch_html(self, url, ready_selector=None):
+        driver = self._open_or_restart(url, ready_selector)
+        return driver.page_source, driver.current_url, True
+
+    def close(self):
+        self.driver_manager.quit()
+
+
+class FallbackFetcher(Fetcher):
+    """HTTP로 가져오고, 기대한 요소가 없는 페이지만 셀레늄으로 다시 여는 백엔드
+
+    요청 오류(연결 실패, 4xx/5xx)는 그대로 올려 보내서 호출하는 쪽의 재시도와 실패 목록에 맡긴다.
+    """
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+        self.fallback_count = 0
+
+    def fetch_page(self, url, ready_selector=None):
+        return self.primary.fetch_page(url, ready_selector)
+
+    def fetch_html(self, url, ready_selector=None):
+        return self.primary.fetch_html(url, ready_selector)
+
+    def fallback_page(self, url, ready_selector=None):
+        self.fallback_count += 1
+        METRICS.inc('fallbacks')
+        log('warning', 'fallback', f"HTTP로 받은 페이지에 상품 목록이 없어 셀레늄으로 다시 시도합니다: {url}", url=url)
+        return self.fallback.fetch_page(url, ready_selector)
+
+    def confirm(self, url, ready):
+        self.primary.confirm(url, ready)
+
+    def close(self):
+        self.primary.close()
+        self.fallback.close()
+
+
+def build_fetcher(backend='http', wait_timeout=10, fast_parse=True, limiter=None, cache=None):
+    """사이트별 설정에 맞는 페치 백엔드 생성
+
+    backend='http'이면 HTTP로 가져오고 셀레늄은 상품 목록이 없는 페이지의 대체 수단으로만 사용한다.
+    셀레늄 브라우저는 실제로 필요해질 때 처음 시작된다.
+    limiter(HostLimiter)를 넘기면 두 백엔드의 요청이 같은 호스트별 요청 속도 제한을 공유한다.
+    cache(PageCache)는 HTTP 백엔드에서만 사용한다.
+    """
+    selenium_fetcher = SeleniumFetcher(
+        wait_timeout=wait_timeout, fast_parse=fast_parse, limiter=limiter
+    )
+    if backend == 'selenium':
+        return selenium_fetcher
+    if backend == 'http':
+        return FallbackFetcher(HttpFetcher(limiter=limiter, cache=cache), selenium_fetcher)
+    raise ValueError(f"알 수 없는 페치 백엔드: {backend} (사용 가능: {', '.join(FETCH_BACKENDS)})")
@@ -0,0 +1,188 @@
+"""상품 가격/재고 변화 이력 저장소
+
+    python -m crawler.history show joamom 62890
+    python -m crawler.history import chicfox old/chicfox_products_data.csv
+"""
+import argparse
+import csv
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from crawler.index import INDEX_PATH, ProductIndex, connect
+from crawler.schema import split_colors, to_bool, to_float, to_int
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS price_history (
+    id INTEGER PRIMARY KEY,
+    site TEXT NOT NULL,
+    product_id INTEGER NOT NULL REFERENCES products (id),
+    crawl_time REAL NOT NULL,
+    price INTEGER,
+    original_price INTEGER,
+    discount_rate REAL,
+    sold_out INTEGER,
+    colors TEXT
+);
+CREATE INDEX IF NOT EXISTS price_history_product ON price_history (site, product_id, crawl_time);
+"""
+
+# 사이트마다 다른 판매가 컬럼 이름
+PRICE_COLUMNS = ('판매가', '가격')
+
+
+def product_state(product):
+    """이력에 기록하는 상품 상태 (판매가, 정가, 할인율, 품절여부, 색상)"""
+    price = None
+    for column in PRICE_COLUMNS:
+        price = to_int(product.get(column))
+        if price is not None:
+            break
+    sold_out = to_bool(product.get('품절여부'))
+    colors = split_colors(product.get('색상'))
+    return (
+        price,
+        to_int(product.get('정가')),
+        to_float(product.get('할인율')),
+        None if sold_out is None else int(sold_out),
+        json.dumps(colors, ensure_ascii=False) if colors else None,
+    )
+
+
+class PriceHistory:
+    """크롤링할 때마다 상태가 바뀐 상품만 (site, product_id, crawl_time)으로 추가하는 이력 저장소
+
+    사이트별로 상품마다 마지막 상태를 메모리에 두고 비교해서, 판매가/정가/할인율/품절여부/색상 중
+    하나라도 바뀐 상품만 한 줄을 추가한다. 같은 실행의 행은 모두 같은 crawl_time을 쓰고,
+    여러 카테고리에 나오는 상품은 실행마다 처음 본 상태 하나만 비교한다.
+    마지막 상태는 crawl_time이 가장 늦은 행이고, 이미 crawl_time보다 나중 기록이 있는 상품은
+    시간 순서가 깨지지 않도록 기록하지 않는다 (skipped에 셈, 예전 CSV를 늦게 가져올 때).
+    """
+
+    def __init__(self, site_name, path=INDEX_PATH, crawl_time=None):
+        self.site_name = site_name
+        self.crawl_time = crawl_time or time.time()
+        self.changes = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._checked = set()
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        # 상품마다 crawl_time이 가장 늦은 행 (같은 시각이면 나중에 추가한 행)
+        self._latest = {}
+        self._latest_time = {}
+        for row in self._conn.execute(
+            'SELECT product_id, crawl_time, price, original_price, discount_rate, sold_out, colors FROM ('
+            '  SELECT *, ROW_NUMBER() OVER (PARTITION BY product_id ORDER BY crawl_time DESC, id DESC) AS rank '
+            '  FROM price_history WHERE site = ?'
+            ') WHERE rank = 1',
+            (site_name,),
+        ):
+            self._latest_time[row[0]] = row[1]
+            self._latest[row[0]] = tuple(row[2:])
+
+    def record(self, products):
+        """상품ID가 붙은 행 중 상태가 바뀐 상품만 이력에 추가하고 추가한 수 반환"""
+        rows = []
+        with self._lock:
+            for product in products:
+                product_id = product.get('상품ID')
+                if product_id is None or product_id in self._checked:
+                    continue
+                self._checked.add(product_id)
+                if self._latest_time.get(product_id, self.crawl_time) > self.crawl_time:
+                    self.skipped += 1
+                    continue
+                state = product_state(product)
+                if self._latest.get(product_id) == state:
+                    continue
+                self._latest[product_id] = state
+                self._latest_time[product_id] = self.crawl_time
+                rows.append((self.site_name, product_id, self.crawl_time) + state)
+            if rows:
+                self._conn.executemany(
+                    'INSERT INTO price_history (site, product_id, crawl_time, price, original_price, '
+                    'discount_rate, sold_out, colors) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    rows,
+                )
+                self._conn.commit()
+                self.changes += len(rows)
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def product_history(site_name, product_key, path=INDEX_PATH):
+    """상품 키 하나의 변화 이력 (오래된 순)"""
+    conn = connect(path)
+    try:
+        return conn.execute(
+            'SELECT h.crawl_time, h.price, h.original_price, h.discount_rate, h.sold_out, h.colors '
+            'FROM products p JOIN price_history h ON h.site = p.site AND h.product_id = p.id '
+            'WHERE p.site = ? AND p.product_key = ? ORDER BY h.crawl_time',
+            (site_name, product_key),
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def import_csv(site, path, crawl_time=None):
+    """예전 실행의 결과 CSV를 이력에 가져와서 (추가한 변경 수, 나중 기록이 있어 건너뛴 상품 수) 반환
+
+    crawl_time을 주지 않으면 파일 수정 시각을 쓴다. 이력이 시간 순서로 쌓이도록 여러 파일은 오래된
+    것부터 가져와야 하고, 이미 더 나중 기록이 있는 상품의 행은 가져오지 않는다.
+    """
+    index = ProductIndex(site.name)
+    history = PriceHistory(site.name, crawl_time=crawl_time or os.path.getmtime(path))
+    try:
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            products = [dict(row) for row in csv.DictReader(f)]
+        index.assign(site, products)
+        return history.record(products), history.skipped
+    finally:
+        history.close()
+        index.close()
+
+
+def main(argv=None):
+    from crawler.sites import get_site
+
+    parser = argparse.ArgumentParser(description="상품 가격/재고 변화 이력")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    show = commands.add_parser('show', help="상품 하나의 변화 이력 출력")
+    show.add_argument('site')
+    show.add_argument('product_key', help="상품 키 (메이크샵 branduid, 카페24 상품 번호)")
+
+    import_parser = commands.add_parser('import', help="예전 결과 CSV를 이력에 가져오기")
+    import_parser.add_argument('site')
+    import_parser.add_argument('csv_path')
+    import_parser.add_argument('--time', help="크롤링 시각 (YYYY-MM-DD 또는 ISO 형식, 기본: 파일 수정 시각)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'show':
+        started = time.perf_counter()
+        rows = product_history(args.site, args.product_key)
+        elapsed = (time.perf_counter() - started) * 1000
+        if not rows:
+            print(f"{args.site} {args.product_key} 상품의 이력이 없습니다.")
+        for crawl_time, price, original_price, discount_rate, sold_out, colors in rows:
+            when = datetime.fromtimestamp(crawl_time).strftime('%Y-%m-%d %H:%M')
+            print(f"{when}  판매가 {price}  정가 {original_price}  할인율 {discount_rate}  "
+                  f"품절 {'-' if sold_out is None else bool(sold_out)}  색상 {colors or '-'}")
+        print(f"({len(rows)}건, 조회 {elapsed:.1f}ms)")
+    else:
+        crawl_time = datetime.fromisoformat(args.time).timestamp() if args.time else None
+        added, skipped = import_csv(get_site(args.site), args.csv_path, crawl_time)
+        print(f"{args.csv_path}에서 변경 이력 {added}건을 추가했습니다.")
+        if skipped:
+            print(f"이 파일보다 나중 이력이 이미 있는 상품 {skipped}개는 건너뛰었습니다 (오래된 파일부터 가져오세요).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""상품 이미지를 내용 해시 기준으로 한 번만 저장하는 이미지 다운로더
+
+    python -m crawler.images closhoew_products_data.csv all_products_data.csv
+"""
+import argparse
+import csv
+import hashlib
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from crawler.fetch import HttpFetcher
+from crawler.index import INDEX_PATH, connect
+from crawler.metrics import log
+from crawler.scheduler import HostLimiter
+
+# 이미지를 동시에 받는 워커 수
+IMAGE_WORKERS = 8
+
+# 이미지 호스트별 동시 요청 수와 요청 간격의 하한(초) (목록 페이지와 따로 제한)
+IMAGE_HOST_CONCURRENCY = 4
+IMAGE_MIN_INTERVAL = 0.1
+
+# 이미지 저장 디렉토리 (해시 앞 두 글자로 하위 디렉토리를 나눔)
+IMAGE_DIR = 'product_images'
+
+IMAGE_HEADERS = {
+    'Accept': 'image/avif,image/webp,image/apng,image/*,*/*;q=0.8',
+}
+
+# 확장자를 URL에서 알 수 없을 때 Content-Type으로 정함
+CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/avif': '.avif',
+}
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.avif')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    url TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    extension TEXT,
+    size INTEGER,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+def image_extension(url, content_type=None):
+    """이미지 URL 또는 Content-Type에 맞는 확장자"""
+    extension = posixpath.splitext(urlsplit(url).path)[1].lower()
+    if extension in IMAGE_EXTENSIONS:
+        return extension
+    if content_type:
+        return CONTENT_TYPE_EXTENSIONS.get(content_type.split(';')[0].strip().lower(), '')
+    return ''
+
+
+class ImageStore:
+    """이미지 본문을 SHA-1 해시 이름으로 저장하고 URL -> 해시 매핑을 상품 색인 DB에 기록
+
+    같은 이미지가 여러 카테고리나 사이트, 캐시 무효화용 쿼리가 다른 URL로 나와도 파일은 하나만 남는다.
+    매핑에 있고 파일도 있는 URL은 다시 받지 않으므로 중단된 실행은 받은 이미지 다음부터 이어진다.
+    """
+
+    def __init__(self, directory=IMAGE_DIR, path=INDEX_PATH):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+        self._hashes = {
+            url: (content_hash, extension)
+            for url, content_hash, extension in self._conn.execute('SELECT url, content_hash, extension FROM images')
+        }
+
+    def file_path(self, content_hash, extension):
+        return os.path.join(self.directory, content_hash[:2], f'{content_hash}{extension}')
+
+    def lookup(self, url):
+        """이미 받은 URL이면 내용 해시 반환 (파일이 지워졌으면 None)"""
+        with self._lock:
+            entry = self._hashes.get(url)
+        if entry and os.path.exists(self.file_path(*entry)):
+            return entry[0]
+        return None
+
+    def save(self, url, content, extension):
+        """이미지 본문을 저장하고 (내용 해시, 새로 쓴 파일인지) 반환"""
+        content_hash = hashlib.sha1(content).hexdigest()
+        path = self.file_path(content_hash, extension)
+        written = False
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 같은 이미지를 동시에 받는 워커가 있어도 임시 파일을 교체하므로 반쯤 쓴 파일이 남지 않음
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            written = True
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO images (url, content_hash, extension, size, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                (url, content_hash, extension, len(content), time.time()),
+            )
+            self._conn.commit()
+            self._hashes[url] = (content_hash, extension)
+        return content_hash, written
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ImageStage:
+    """상품 행의 이미지URL을 워커 풀에서 동시에 받아서 내용 해시로 저장하는 단계
+
+    DetailStage처럼 목록 워커는 submit()으로 URL을 넘기기만 하고 다운로드를 기다리지 않는다.
+    이미 받은 이미지는 바로 '이미지해시'를 붙이고, 이번에 새로 받는 이미지의 해시는 결과 파일을
+    다 쓴 뒤 fill_image_hashes()로 채운다. 대기 중인 다운로드는 max_pending개까지만 둔다.
+    이미지 호스트(CDN)는 목록 페이지와 따로 제한해서 목록 요청의 슬롯을 차지하지 않는다.
+    """
+
+    def __init__(self, limiter=None, max_workers=IMAGE_WORKERS, max_pending=None, store=None):
+        self.limiter = limiter or HostLimiter(IMAGE_HOST_CONCURRENCY, IMAGE_MIN_INTERVAL, IMAGE_MIN_INTERVAL)
+        self.store = store or ImageStore()
+        self.stats = {'downloaded': 0, 'deduplicated': 0, 'cached': 0, 'failed': 0, 'bytes': 0, 'filled': 0}
+        self._lock = threading.Lock()
+        self._submitted = set()
+        self._submitted_lock = threading.Lock()
+        self._local = threading.local()
+        self._fetchers = []
+        self._pending = threading.BoundedSemaphore(max_pending or max_workers * 4)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image')
+
+    def _fetcher(self):
+        fetcher = getattr(self._local, 'fetcher', None)
+        if fetcher is None:
+            fetcher = self._local.fetcher = HttpFetcher(headers=IMAGE_HEADERS, limiter=self.limiter)
+            with self._lock:
+                self._fetchers.append(fetcher)
+        return fetcher
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def _claim(self, key):
+        """목록 워커 여러 개가 같은 키를 동시에 넘겨도 한 번만 True"""
+        with self._submitted_lock:
+            if key in self._submitted:
+                return False
+            self._submitted.add(key)
+            return True
+
+    def submit(self, products):
+        """상품 행의 이미지를 받도록 넘기고 이미 받은 이미지면 '이미지해시'를 붙임 (아니면 None)"""
+        for product in products:
+            url = product.get('이미지URL')
+            content_hash = self.store.lookup(url) if url else None
+            product['이미지해시'] = content_hash
+            if content_hash:
+                self._count('cached')
+                continue
+            if not url or not self._claim(url):
+                continue
+            # 대기 작업이 가득 차면 자리가 날 때까지 목록 워커를 잠시 멈춤
+            self._pending.acquire()
+            self._executor.submit(self._run, url)
+
+    def _run(self, url):
+        try:
+            self._download(url)
+        except Exception as e:
+            self._count('failed')
+            log('warning', 'image_failed', f"이미지 다운로드 중 오류 발생: {url} ({e})", url=url, error=str(e))
+        finally:
+            self._pending.release()
+
+    def _download(self, url):
+        # 본문은 .content로만 읽으므로 텍스트 인코딩 추정(apparent_encoding)을 거치지 않음
+        response = self._fetcher().get(url, text=False)
+        extension = image_extension(url, response.headers.get('Content-Type'))
+        _, written = self.store.save(url, response.content, extension)
+        self._count('downloaded' if written else 'deduplicated')
+        if written:
+            self._count('bytes', len(response.content))
+
+    def fill(self, paths):
+        """남은 다운로드를 마친 뒤 결과 파일들의 빈 '이미지해시'를 채움"""
+        self._executor.shutdown(wait=True)
+        for path in paths:
+            if os.path.exists(path):
+                self._count('filled', fill_image_hashes(path, self.store))
+
+    def close(self):
+        """남은 다운로드를 모두 마치고 정리"""
+        self._executor.shutdown(wait=True)
+        for fetcher in self._fetchers:
+            fetcher.close()
+        self.store.close()
+
+    def print_summary(self):
+        stats = self.stats
+        print("\n===== 이미지 단계 =====")
+        print(f"새로 저장: {stats['downloaded']}개 ({stats['bytes'] / 1024 / 1024:.1f}MB), "
+              f"같은 내용이라 재사용: {stats['deduplicated']}개, 이미 받음: {stats['cached']}개, "
+              f"실패: {stats['failed']}개, 결과 파일에 채운 해시: {stats['filled']}개")
+        print(f"저장 위치: {self.store.directory}")
+
+
+def fill_hashes(urls, hashes, store):
+    """비어 있는 해시를 URL -> 해시 매핑으로 채운 (해시 목록, 채운 개수) 반환"""
+    filled = 0
+    result = []
+    for url, content_hash in zip(urls, hashes):
+        if not content_hash and url:
+            content_hash = store.lookup(url)
+            filled += content_hash is not None
+        result.append(content_hash or None)
+    return result, filled
+
+
+def _fill_csv(path, store):
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        columns = list(reader.fieldnames or [])
+        rows = [dict(row) for row in reader]
+    if '이미지URL' not in columns:
+        return 0
+    if '이미지해시' not in columns:
+        columns.append('이미지해시')
+    hashes, filled = fill_hashes([row.get('이미지URL') for row in rows], [row.get('이미지해시') for row in rows], store)
+    if not filled:
+        return 0
+    for row, content_hash in zip(rows, hashes):
+        row['이미지해시'] = content_hash
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+    return filled
+
+
+def _fill_parquet(path, store):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    filled = 0
+    tmp_path = f'{path}.tmp'
+    with pq.ParquetFile(path) as source:
+        schema = source.schema_arrow
+        if '이미지URL' not in schema.names or '이미지해시' not in schema.names:
+            return 0
+        index = schema.get_field_index('이미지해시')
+        # row group 단위로 읽고 써서 결과가 커도 메모리 사용량은 일정
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for batch in source.iter_batches():
+                table = pa.Table.from_batches([batch], schema)
+                hashes, count = fill_hashes(table.column('이미지URL').to_pylist(),
+                                            table.column(index).to_pylist(), store)
+                filled += count
+                writer.write_table(table.set_column(index, schema.field(index), pa.array(hashes, pa.string())))
+    if filled:
+        os.replace(tmp_path, path)
+    else:
+        os.remove(tmp_path)
+    return filled
+
+
+def _fill_excel(path, store):
+    from openpyxl import Workbook, load_workbook
+
+    source = load_workbook(path, read_only=True)
+    try:
+        rows = [list(row) for row in source.active.iter_rows(values_only=True)]
+    finally:
+        source.close()
+    if not rows or '이미지URL' not in rows[0] or '이미지해시' not in rows[0]:
+        return 0
+    # 읽기 전용 모드는 행 끝의 빈 셀을 돌려주지 않으므로 헤더 길이에 맞춤
+    rows = [row + [None] * (len(rows[0]) - len(row)) for row in rows]
+    url_index = rows[0].index('이미지URL')
+    hash_index = rows[0].index('이미지해시')
+    hashes, filled = fill_hashes([row[url_index] for row in rows[1:]], [row[hash_index] for row in rows[1:]], store)
+    if not filled:
+        return 0
+    for row, content_hash in zip(rows[1:], hashes):
+        row[hash_index] = content_hash
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append(row)
+    tmp_path = f'{path}.tmp.xlsx'
+    workbook.save(tmp_path)
+    os.replace(tmp_path, path)
+    return filled
+
+
+def fill_image_hashes(path, store):
+    """결과 파일(CSV, Parquet, Excel)의 빈 '이미지해시'를 받아 둔 이미지의 해시로 채우고 채운 행 수 반환"""
+    fill = {'.csv': _fill_csv, '.parquet': _fill_parquet, '.xlsx': _fill_excel}.get(os.path.splitext(path)[1].lower())
+    if fill is None:
+        raise ValueError(f"이미지 해시를 채울 수 없는 파일 형식입니다: {path}")
+    return fill(path, store)
+
+
+def download_csv_images(path, batch_size=100, max_workers=IMAGE_WORKERS):
+    """결과 CSV의 이미지를 받고 '이미지해시' 컬럼을 채워서 다시 저장"""
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        products = [dict(row) for row in csv.DictReader(f)]
+
+    stage = ImageStage(max_workers=max_workers)
+    try:
+        for start in range(0, len(products), batch_size):
+            stage.submit(products[start:start + batch_size])
+            print(f"{min(start + batch_size, len(products))}/{len(products)}개 상품 처리")
+        stage.fill([path])
+    finally:
+        stage.close()
+    stage.print_summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="결과 CSV의 상품 이미지를 내려받고 이미지해시 컬럼 추가")
+    parser.add_argument('csv_paths', nargs='+', help="결과 CSV 경로 (여러 개 지정 가능)")
+    parser.add_argument('--workers', type=int, default=IMAGE_WORKERS, help="동시 다운로드 수")
+    args = parser.parse_args(argv)
+    for path in args.csv_paths:
+        print(f"이미지 다운로드: {path}")
+        download_csv_images(path, max_workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
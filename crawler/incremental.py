@@ -0,0 +1,55 @@
+import os
+import threading
+
+from crawler.journal import STATE_DIR
+
+
+def snapshot_path(site_name):
+    """사이트별 상품 ID 스냅샷 파일 경로"""
+    return os.path.join(STATE_DIR, f"{site_name}_known_ids.txt")
+
+
+class KnownProducts:
+    """이전 실행까지 수집한 상품 ID 스냅샷
+
+    증분 크롤링에서 한 페이지의 상품이 모두 이전 스냅샷에 있으면 그 뒤 페이지는 이미 본 상품으로 보고
+    페이징을 멈춘다. 이번 실행에서 본 ID는 따로 모았다가 save()에서 스냅샷에 합친다
+    (실행 중에 다른 카테고리가 추가한 ID 때문에 일찍 멈추지 않도록 판단은 이전 스냅샷으로만 한다).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._previous = set()
+        self._seen = set()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self._previous = {line.strip() for line in f if line.strip()}
+
+    def __len__(self):
+        return len(self._previous)
+
+    def is_known(self, product_id):
+        return product_id in self._previous
+
+    def all_known(self, product_ids):
+        """ID가 하나 이상 있고 모두 이전 스냅샷에 있으면 True"""
+        product_ids = list(product_ids)
+        return bool(product_ids) and all(self.is_known(product_id) for product_id in product_ids)
+
+    def add(self, product_ids):
+        with self._lock:
+            self._seen.update(product_id for product_id in product_ids if product_id)
+
+    def save(self):
+        """이전 스냅샷과 이번 실행에서 본 ID를 합쳐서 저장"""
+        with self._lock:
+            product_ids = sorted(self._previous | self._seen)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(f'{product_id}\n' for product_id in product_ids)
+        os.replace(tmp_path, self.path)
+        return len(product_ids)
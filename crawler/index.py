@@ -0,0 +1,97 @@
+import os
+import sqlite3
+import threading
+import time
+
+from crawler.journal import STATE_DIR
+
+# 모든 사이트가 함께 쓰는 상품 색인 DB
+INDEX_PATH = os.path.join(STATE_DIR, 'products.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    site TEXT NOT NULL,
+    product_key TEXT NOT NULL,
+    name TEXT,
+    url TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    UNIQUE (site, product_key)
+)
+"""
+
+
+def connect(path=INDEX_PATH):
+    """여러 워커 스레드에서 함께 쓰는 SQLite 연결 (WAL 모드)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+class ProductIndex:
+    """사이트별 상품 키(branduid, 상품 번호 등)를 정수 상품 ID에 매핑하는 실행 간 공유 색인
+
+    시작할 때 사이트의 키 -> ID 매핑을 메모리에 올려 두므로 조회는 dict 한 번이고,
+    새 상품만 DB에 추가한다 (다른 프로세스가 먼저 추가한 키는 DB의 ID를 씀). 결과 행에는
+    '상품키'와 '상품ID'가 붙어서 중복 제거와 실행 간 비교를 작은 정수로 할 수 있다.
+    """
+
+    def __init__(self, site_name, path=INDEX_PATH):
+        self.site_name = site_name
+        self.path = path
+        self.new_products = 0
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+        self._ids = dict(self._conn.execute(
+            'SELECT product_key, id FROM products WHERE site = ?', (site_name,)
+        ))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def assign(self, site, products):
+        """페이지의 상품 행에 상품키와 상품ID를 붙이고 색인에 반영"""
+        now = time.time()
+        with self._lock:
+            seen_ids = []
+            for product in products:
+                product_key = site.product_key(product)
+                product['상품키'] = product_key
+                if not product_key:
+                    product['상품ID'] = None
+                    continue
+                product_id = self._ids.get(product_key)
+                if product_id is None:
+                    # 같은 사이트를 크롤링하는 다른 프로세스가 먼저 추가했을 수 있으므로 무시하고 ID를 다시 읽음
+                    cursor = self._conn.execute(
+                        'INSERT OR IGNORE INTO products (site, product_key, name, url, first_seen, last_seen) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (self.site_name, product_key, product.get('상품명'), product.get('상품URL'), now, now),
+                    )
+                    if cursor.rowcount == 1:
+                        product_id = cursor.lastrowid
+                        self.new_products += 1
+                    else:
+                        product_id = self._conn.execute(
+                            'SELECT id FROM products WHERE site = ? AND product_key = ?',
+                            (self.site_name, product_key),
+                        ).fetchone()[0]
+                        seen_ids.append((now, product_id))
+                    self._ids[product_key] = product_id
+                else:
+                    seen_ids.append((now, product_id))
+                product['상품ID'] = product_id
+            self._conn.executemany('UPDATE products SET last_seen = ? WHERE id = ?', seen_ids)
+            self._conn.commit()
+        return products
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
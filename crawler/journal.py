@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+
+# 크롤링 상태 파일(저널 등)을 저장하는 디렉토리
+STATE_DIR = 'crawl_state'
+
+
+def journal_path(site_name):
+    """사이트별 기본 저널 파일 경로"""
+    return os.path.join(STATE_DIR, f"{site_name}_journal.jsonl")
+
+
+class CrawlJournal:
+    """카테고리의 페이지 단위로 완료 기록을 남기는 append-only 저널 (JSON Lines)
+
+    한 줄이 완료된 페이지 하나이며, 페이지를 끝낼 때마다 그 페이지의 행만 덧붙이므로
+    체크포인트 비용은 새로 수집한 행 수에만 비례한다. resume=True면 기존 기록을 읽어서
+    끝난 페이지를 건너뛰고, 그 페이지의 행은 저널에서 그대로 다시 꺼내 쓴다.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pages = {}
+        self._total_pages = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if resume:
+            self._load()
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def _load(self):
+        """기존 저널 읽기 (크래시로 잘린 마지막 줄은 무시)"""
+        # crawler.metrics가 이 모듈의 STATE_DIR을 쓰므로 여기서 가져옴
+        from crawler.metrics import log
+
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                self._pages[(entry['category'], entry['page'])] = entry['rows']
+                if entry.get('total_pages'):
+                    self._total_pages[entry['category']] = entry['total_pages']
+        log('info', 'journal_loaded', f"저널에서 완료된 페이지 {len(self._pages)}개를 불러왔습니다: {self.path}",
+            pages=len(self._pages), path=self.path)
+
+    def is_done(self, category_url, page):
+        return (category_url, page) in self._pages
+
+    def page_rows(self, category_url, page):
+        """이전 실행에서 완료된 페이지의 행 (한 번 꺼낸 행은 메모리에서 해제)"""
+        key = (category_url, page)
+        rows = self._pages.get(key) or []
+        if key in self._pages:
+            self._pages[key] = None
+        return rows
+
+    def total_pages(self, category_url):
+        """이전 실행에서 확인한 카테고리의 총 페이지 수 (모르면 None)"""
+        return self._total_pages.get(category_url)
+
+    def record_page(self, category_url, page, rows, total_pages=None):
+        """완료된 페이지 하나를 저널 끝에 추가하고 디스크에 기록"""
+        entry = {'category': category_url, 'page': page, 'total_pages': total_pages, 'rows': rows}
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
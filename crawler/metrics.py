@@ -0,0 +1,335 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+from crawler.journal import STATE_DIR
+
+# 실행 로그(JSON Lines)와 Prometheus 텍스트 파일을 저장하는 디렉토리
+LOG_DIR = os.path.join(STATE_DIR, 'logs')
+METRICS_DIR = os.path.join(STATE_DIR, 'metrics')
+
+LOG_LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+
+# 구간별 소요 시간 히스토그램의 상한(초)
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 요약에 보여 줄 카운터와 구간 (이름, 설명)
+SUMMARY_COUNTERS = (
+    ('pages', '페이지'),
+    ('products', '상품'),
+    ('failed_pages', '실패한 페이지'),
+    ('extract_failures', '추출 실패 상품'),
+    ('retries', '재시도'),
+    ('fallbacks', '셀레늄 대체'),
+    ('bytes', '받은 바이트'),
+)
+# 구간 (이름, 설명) - 프로파일링 모드에서만 재는 세부 구간(드라이버 준비, 페이지 로딩, HTML 파싱, 상품 추출,
+# 파일 마감)은 바깥 구간(페치, 파싱, 기록)에 포함되는 시간이다
+PHASES = (
+    ('driver_setup', '드라이버 준비'),
+    ('fetch', '페치'),
+    ('page_load', '페이지 로딩'),
+    ('wait', '요소 대기'),
+    ('throttle', '요청 간격 대기'),
+    ('backoff', '재시도 대기'),
+    ('parse', '파싱'),
+    ('soup', 'HTML 파싱'),
+    ('extract', '상품 추출'),
+    ('write', '기록'),
+    ('export', '파일 마감'),
+)
+
+
+class RunLog:
+    """수준(level) 필터가 있는 구조화 로그
+
+    기록마다 시각, 수준, 이벤트 이름과 필드를 담은 JSON 한 줄을 실행 로그 파일에 쓰고,
+    콘솔에는 사람이 읽는 메시지(json_console=True면 같은 JSON 줄)를 출력한다.
+    파싱 프로세스는 capture()로 기록을 모아서 돌려주고, 부모 프로세스가 replay()로 실행 로그에 쓴다.
+    """
+
+    def __init__(self, level='info', json_console=False):
+        self._lock = threading.Lock()
+        self._file = None
+        self._captured = None
+        self.path = None
+        self.configure(level, json_console)
+
+    def configure(self, level='info', json_console=False, path=None):
+        if level not in LOG_LEVELS:
+            raise ValueError(f"알 수 없는 로그 수준: {level} (사용 가능: {', '.join(LOG_LEVELS)})")
+        with self._lock:
+            self.level_name = level
+            self.level = LOG_LEVELS[level]
+            self.json_console = json_console
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self.path = path
+            if path:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._file = open(path, 'a', encoding='utf-8')
+
+    def enabled(self, level):
+        return LOG_LEVELS[level] >= self.level
+
+    def log(self, level, event, message='', **fields):
+        if not self.enabled(level):
+            return
+        record = {'ts': round(time.time(), 3), 'level': level, 'event': event}
+        if message:
+            record['msg'] = message
+        record.update(fields)
+        if self._captured is not None:
+            self._captured.append(record)
+            return
+        self._write(record)
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + '\n')
+                self._file.flush()
+            if self.json_console:
+                print(line)
+            elif record.get('msg'):
+                print(record['msg'])
+
+    @contextmanager
+    def capture(self):
+        """이 블록에서 남긴 기록을 출력하지 않고 목록에 모음 (파싱 프로세스에서 부모에게 넘길 기록)"""
+        records = []
+        self._captured = records
+        try:
+            yield records
+        finally:
+            self._captured = None
+
+    def replay(self, records, **fields):
+        """다른 프로세스에서 capture()로 모은 기록을 fields(사이트, 카테고리 등)를 붙여서 기록"""
+        for record in records:
+            if self.enabled(record['level']):
+                self._write(dict(record, **{name: value for name, value in fields.items() if name not in record}))
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Histogram:
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        """Prometheus 형식의 누적 버킷 개수 (le, 개수)"""
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            yield bound, running
+        yield '+Inf', self.count
+
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items() if value is not None))
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(key, extra=None):
+    pairs = list(key) + (extra or [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+
+class Metrics:
+    """사이트/카테고리 등 라벨별 카운터와 구간(fetch, wait, parse, write) 소요 시간 히스토그램
+
+    labels()로 스레드에 기본 라벨(사이트, 카테고리)을 걸어 두면 그 스레드에서 기록하는 값에 붙으므로,
+    페치 백엔드나 호스트 제한기처럼 카테고리를 모르는 곳에서도 카테고리별로 집계된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._context = threading.local()
+        # True면 phase()로 감싼 세부 구간도 잰다 (--profile)
+        self.profiling = False
+        self.reset()
+
+    @contextmanager
+    def labels(self, **labels):
+        """이 스레드에서 기록하는 값에 붙일 기본 라벨"""
+        previous = getattr(self._context, 'labels', {})
+        self._context.labels = dict(previous, **labels)
+        try:
+            yield
+        finally:
+            self._context.labels = previous
+
+    def context_labels(self):
+        """이 스레드에 걸린 기본 라벨"""
+        return dict(getattr(self._context, 'labels', {}))
+
+    def _key(self, name, labels):
+        return name, _label_key(dict(getattr(self._context, 'labels', {}), **labels))
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+            self.started_at = time.time()
+
+    def inc(self, name, amount=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, phase, seconds, **labels):
+        key = self._key(phase, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, phase, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - started, **labels)
+
+    def phase(self, phase, **labels):
+        """프로파일링 모드에서만 재는 세부 구간 (꺼져 있으면 아무것도 하지 않음)"""
+        if not self.profiling:
+            return nullcontext()
+        return self.timer(phase, **labels)
+
+    def counter_total(self, name, **labels):
+        """라벨 조건에 맞는 카운터 합계"""
+        wanted = set(_label_key(labels))
+        with self._lock:
+            return sum(value for (counter, key), value in self._counters.items()
+                       if counter == name and wanted <= set(key))
+
+    def phase_totals(self):
+        """구간별 (횟수, 합계, 최대) - 라벨은 합침"""
+        totals = {}
+        with self._lock:
+            for (phase, _), histogram in self._histograms.items():
+                count, total, maximum = totals.get(phase, (0, 0.0, 0.0))
+                totals[phase] = (count + histogram.count, total + histogram.total, max(maximum, histogram.max))
+        return totals
+
+    def phase_breakdown(self, label='category'):
+        """label 값별 구간 (횟수, 합계, 최대) - 그 라벨이 없는 기록은 None 아래에 모임"""
+        breakdown = {}
+        with self._lock:
+            for (phase, key), histogram in self._histograms.items():
+                phases = breakdown.setdefault(dict(key).get(label), {})
+                count, total, maximum = phases.get(phase, (0, 0.0, 0.0))
+                phases[phase] = (count + histogram.count, total + histogram.total, max(maximum, histogram.max))
+        return breakdown
+
+    def summary(self, **labels):
+        """실행 요약 (카운터 합계와 구간별 횟수/평균/최대)"""
+        result = {name: self.counter_total(name, **labels) for name, _ in SUMMARY_COUNTERS}
+        result['elapsed_seconds'] = round(time.time() - self.started_at, 3)
+        for phase, (count, total, maximum) in self.phase_totals().items():
+            result[f'{phase}_count'] = count
+            result[f'{phase}_avg_seconds'] = round(total / count, 4) if count else 0.0
+            result[f'{phase}_max_seconds'] = round(maximum, 4)
+        return result
+
+    def print_summary(self, **labels):
+        summary = self.summary(**labels)
+        elapsed = summary['elapsed_seconds'] or 1.0
+        print("\n===== 실행 지표 =====")
+        print(', '.join(f"{title} {summary[name]:,}" for name, title in SUMMARY_COUNTERS)
+              + f" (페이지/초 {summary['pages'] / elapsed:.2f}, 상품/초 {summary['products'] / elapsed:.1f})")
+        for phase, title in PHASES:
+            count = summary.get(f'{phase}_count')
+            if count:
+                print(f"{title}: {count}회, 평균 {summary[f'{phase}_avg_seconds'] * 1000:.1f}ms, "
+                      f"최대 {summary[f'{phase}_max_seconds'] * 1000:.1f}ms")
+
+    def prometheus_text(self, prefix='crawler'):
+        """Prometheus 텍스트 형식 (node_exporter textfile collector용)"""
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+
+        declared = set()
+        for (name, key), value in counters:
+            metric = f'{prefix}_{name}_total'
+            if metric not in declared:
+                lines.append(f'# TYPE {metric} counter')
+                declared.add(metric)
+            lines.append(f'{metric}{_format_labels(key)} {value}')
+
+        metric = f'{prefix}_phase_seconds'
+        if histograms:
+            lines.append(f'# TYPE {metric} histogram')
+        for (phase, key), histogram in histograms:
+            labels = list(key) + [('phase', phase)]
+            for bound, count in histogram.cumulative():
+                lines.append(f'{metric}_bucket{_format_labels(labels, [("le", bound)])} {count}')
+            lines.append(f'{metric}_sum{_format_labels(labels)} {histogram.total:.6f}')
+            lines.append(f'{metric}_count{_format_labels(labels)} {histogram.count}')
+
+        lines.append(f'# TYPE {prefix}_run_started_seconds gauge')
+        lines.append(f'{prefix}_run_started_seconds {self.started_at:.3f}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Prometheus 텍스트 파일 저장 (임시 파일에 쓰고 교체해서 수집기가 반쯤 쓴 파일을 읽지 않음)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+
+# 실행 전체에서 공유하는 기본 로그와 지표
+LOG = RunLog()
+METRICS = Metrics()
+
+
+def log(level, event, message='', **fields):
+    """실행 로그에 기록 (이 스레드에 걸린 지표 라벨인 사이트, 카테고리도 필드로 붙음)"""
+    LOG.log(level, event, message, **dict(METRICS.context_labels(), **fields))
+
+
+def run_log_path(site_name):
+    """실행마다 새로 만드는 사이트별 로그 파일 경로"""
+    return os.path.join(LOG_DIR, f"{site_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+
+
+def metrics_path(site_name):
+    """사이트별 Prometheus 텍스트 파일 경로 (실행마다 덮어씀)"""
+    return os.path.join(METRICS_DIR, f"{site_name}.prom")
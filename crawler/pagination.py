@@ -0,0 +1,65 @@
+import math
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def page_url(url, page, param='page'):
+    """목록 URL의 페이지 번호 설정 (1페이지는 원래 URL 그대로 사용)"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if page == 1 and all(key != param for key, _ in query):
+        return url
+    query = [(key, value) for key, value in query if key != param]
+    query.append((param, str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def count_total_pages(total_items, page_size, visible_max_page=1):
+    """총 상품 수와 페이지당 상품 수로 전체 페이지 수 계산
+
+    페이지 링크는 한 블록(보통 10페이지)만 보이므로 링크만 보면 큰 카테고리를 덜 크롤링하게 된다.
+    총 상품 수를 알 수 없으면 보이는 최대 페이지 번호를 쓰고, 알 수 있어도 그보다 작게 잡지 않는다.
+    """
+    if total_items and page_size:
+        return max(math.ceil(total_items / page_size), visible_max_page)
+    return visible_max_page
+
+
+def plan_pages(url, total_pages, max_pages=None, param='page'):
+    """크롤링할 모든 페이지 URL을 한 번에 생성 (동시에, 또는 순서와 상관없이 가져올 수 있음)"""
+    if max_pages:
+        total_pages = min(total_pages, max_pages)
+    return [page_url(url, page, param) for page in range(1, total_pages + 1)]
+
+
+def set_query_params(url, params):
+    """URL의 쿼리 파라미터 값을 설정 (이미 있으면 교체)"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key not in params]
+    query.extend((key, str(value)) for key, value in params.items())
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def query_param(url, name):
+    """URL에서 쿼리 파라미터 값 읽기 (없으면 None)"""
+    for key, value in parse_qsl(urlsplit(url).query, keep_blank_values=True):
+        if key == name:
+            return value
+    return None
+
+
+# 같은 상품 URL에 붙는 추적/표시용 쿼리 파라미터
+TRACKING_PARAMS = {'GfDT', 'utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term'}
+
+# 카페24 상품 URL 끝에 붙는 카테고리/진열 위치 경로 (예: /category/48/display/1/)
+CAFE24_DISPLAY_PATH = re.compile(r'/category/\d+/display/\d+/?$')
+
+
+def strip_tracking_params(url):
+    """상품 URL에서 추적용 파라미터와 카테고리 진열 경로를 제거"""
+    if not url:
+        return url
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key not in TRACKING_PARAMS]
+    path = CAFE24_DISPLAY_PATH.sub('/', parts.path)
+    return urlunsplit(parts._replace(path=path, query=urlencode(query)))
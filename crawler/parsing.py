@@ -0,0 +1,157 @@
+import importlib.util
+import re
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, Comment, NavigableString
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+from crawler.metrics import METRICS
+
+# lxml이 설치되어 있으면 더 빠른 lxml 파서 사용
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+# 브라우저가 URL로 해석해서 돌려주는 속성 (get_attribute가 절대 URL 반환)
+URL_ATTRIBUTES = {'href', 'src'}
+
+# 지연 로딩 이미지의 실제 주소가 들어있는 속성 (페이지 스크립트가 src로 옮겨줌)
+LAZY_SRC_ATTRIBUTES = ('data-frz-src', 'data-src', 'data-original', 'ec-data-src')
+
+# 화면에 표시되지 않는 태그
+HIDDEN_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'title'}
+
+# 줄바꿈이 생기는 블록 태그
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'ul',
+}
+
+HEX_COLOR_PATTERN = re.compile(r'#([0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b')
+
+
+def make_soup(html, parser=None):
+    """HTML 문자열을 한 번만 파싱"""
+    # 브라우저처럼 '--!>'도 주석 끝으로 처리 (html.parser는 이후 문서 전체를 주석으로 봄)
+    html = html.replace('--!>', '-->')
+    return BeautifulSoup(html, parser or HTML_PARSER)
+
+
+def _hex_to_rgb(match):
+    value = match.group(1)
+    if len(value) == 3:
+        value = ''.join(ch * 2 for ch in value)
+    r, g, b = (int(value[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgb({r}, {g}, {b})"
+
+
+def normalize_style(style):
+    """style 속성을 브라우저가 돌려주는 형태로 정규화 (예: 'background:#FFF' -> 'background: rgb(255, 255, 255);')"""
+    declarations = []
+    for declaration in style.split(';'):
+        if ':' not in declaration:
+            continue
+        name, value = declaration.split(':', 1)
+        name = name.strip().lower()
+        value = ' '.join(value.split())
+        if not name or not value:
+            continue
+        value = HEX_COLOR_PATTERN.sub(_hex_to_rgb, value)
+        declarations.append(f"{name}: {value};")
+    return ' '.join(declarations)
+
+
+def _is_hidden(tag):
+    """CSS로 숨겨진 요소인지 확인 (Cafe24의 displaynone 클래스, 인라인 display:none)"""
+    if tag.name in HIDDEN_TAGS:
+        return True
+    if 'displaynone' in (tag.get('class') or []):
+        return True
+    style = (tag.get('style') or '').replace(' ', '').lower()
+    return 'display:none' in style
+
+
+def _collect_text(tag, parts):
+    for child in tag.children:
+        if isinstance(child, Comment):
+            continue
+        if isinstance(child, NavigableString):
+            parts.append(str(child))
+            continue
+        if _is_hidden(child):
+            continue
+        if child.name == 'br':
+            parts.append('\n')
+            continue
+        is_block = child.name in BLOCK_TAGS
+        if is_block:
+            parts.append('\n')
+        _collect_text(child, parts)
+        if is_block:
+            parts.append('\n')
+
+
+def visible_text(tag):
+    """셀레늄 WebElement.text와 같은 규칙으로 화면에 보이는 텍스트 추출"""
+    if _is_hidden(tag):
+        return ''
+    parts = []
+    _collect_text(tag, parts)
+    text = ''.join(parts).replace('\xa0', ' ')
+    lines = (' '.join(line.split()) for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class SoupElement:
+    """BeautifulSoup 요소를 셀레늄 WebElement처럼 쓰기 위한 래퍼
+
+    extract_product_info()가 WebDriver 요청 없이 같은 코드로 동작하도록
+    find_element / find_elements / text / get_attribute 만 흉내낸다.
+    """
+
+    def __init__(self, tag, base_url=''):
+        self.tag = tag
+        self.base_url = base_url
+
+    @classmethod
+    def from_html(cls, html, base_url='', parser=None):
+        """페이지 소스 전체를 한 번 파싱해서 루트 요소 생성"""
+        with METRICS.phase('soup'):
+            return cls(make_soup(html, parser), base_url)
+
+    def _check_by(self, by):
+        if by != By.CSS_SELECTOR:
+            raise ValueError(f"CSS 선택자만 지원합니다: {by}")
+
+    def find_element(self, by, value):
+        self._check_by(by)
+        tag = self.tag.select_one(value)
+        if tag is None:
+            raise NoSuchElementException(f"요소를 찾을 수 없습니다: {value}")
+        return SoupElement(tag, self.base_url)
+
+    def find_elements(self, by, value):
+        self._check_by(by)
+        return [SoupElement(tag, self.base_url) for tag in self.tag.select(value)]
+
+    @property
+    def text(self):
+        return visible_text(self.tag)
+
+    def get_attribute(self, name):
+        value = self.tag.get(name)
+        if name == 'src' and not value:
+            # 지연 로딩 스크립트가 실행된 뒤의 브라우저 상태와 맞춤
+            for lazy_name in LAZY_SRC_ATTRIBUTES:
+                if self.tag.get(lazy_name):
+                    value = self.tag.get(lazy_name)
+                    break
+        if value is None:
+            return None
+        if isinstance(value, list):
+            value = ' '.join(value)
+        if name in URL_ATTRIBUTES:
+            return urljoin(self.base_url, value.strip()) if value else value
+        if name == 'style':
+            return normalize_style(value)
+        return value
@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from selenium.webdriver.common.by import By
+
+from crawler.fetch import PageNotReady
+from crawler.metrics import LOG, METRICS
+from crawler.parsing import SoupElement
+
+# 파싱 프로세스마다 한 번만 만드는 사이트 어댑터
+_SITES = {}
+
+
+def parse_listing_html(site_name, html, page_url, category, plan=False):
+    """파싱 프로세스에서 목록 페이지 HTML을 (상품 목록, 총 페이지 수, 구간별 시간, 추출 실패 수, 로그 기록)으로 변환
+
+    구간별 시간은 {'parse': 전체 파싱 시간}이고, 프로파일링 모드면 세부 구간(HTML 파싱, 상품 추출)도 담긴다.
+    로그 기록은 여기서 출력하지 않고 부모 프로세스가 사이트/카테고리 필드를 붙여서 실행 로그에 쓴다.
+    """
+    from crawler.engine import parse_listing
+    from crawler.sites import get_site
+
+    started = time.perf_counter()
+    failures_before = METRICS.counter_total('extract_failures')
+    phases_before = METRICS.phase_totals()
+    site = _SITES.get(site_name)
+    if site is None:
+        site = _SITES[site_name] = get_site(site_name)
+    page = SoupElement.from_html(html, page_url)
+    if (site.ready_selector and not page.find_elements(By.CSS_SELECTOR, site.ready_selector)
+            and not site.is_empty_listing(page)):
+        raise PageNotReady(f"'{site.ready_selector}' 요소가 없습니다")
+    with LOG.capture() as records:
+        products, total_pages = parse_listing(site, page, category, plan)
+    extract_failures = METRICS.counter_total('extract_failures') - failures_before
+    phase_seconds = {
+        phase: total - phases_before.get(phase, (0, 0.0, 0.0))[1]
+        for phase, (_, total, _) in METRICS.phase_totals().items()
+        if phase != 'parse' and total > phases_before.get(phase, (0, 0.0, 0.0))[1]
+    }
+    phase_seconds['parse'] = time.perf_counter() - started
+    return products, total_pages, phase_seconds, extract_failures, records
+
+
+def init_worker(log_level, json_console, profiling=False):
+    """파싱 프로세스가 부모 프로세스와 같은 로그 수준, 프로파일링 설정을 쓰도록 함 (로그는 부모에게 넘겨서 부모가 씀)"""
+    LOG.configure(log_level, json_console)
+    METRICS.profiling = profiling
+
+
+def completed(result):
+    """이미 계산한 결과를 Future로 감쌈 (파싱 풀 없이 실행할 때 같은 흐름을 쓰기 위함)"""
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class ParsePool:
+    """목록 페이지 HTML을 상품 행으로 바꾸는 파싱 프로세스 풀
+
+    페치 워커(스레드)는 받은 HTML을 넘기고 바로 다음 페이지를 받으러 가고, BeautifulSoup 파싱과
+    상품 정보 추출은 별도 프로세스에서 여러 코어로 실행된다. 대기 중인 파싱 작업은 max_pending개까지만
+    두어서 페치가 훨씬 빠르면 페치 워커가 기다린다 (받은 HTML이 메모리에 쌓이지 않음).
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.stats = {'pages': 0, 'seconds': 0.0}
+        self._stats_lock = threading.Lock()
+        self._pending = threading.BoundedSemaphore(max_pending or self.max_workers * 2)
+        # 페치 스레드가 돌고 있는 프로세스를 fork하면 잠금 상태까지 복사되므로 spawn으로 시작
+        self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=init_worker, initargs=(LOG.level_name, LOG.json_console, METRICS.profiling))
+
+    def _done(self, future):
+        self._pending.release()
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._stats_lock:
+            self.stats['pages'] += 1
+            self.stats['seconds'] += future.result()[2]['parse']
+
+    def submit(self, site_name, html, page_url, category, plan=False):
+        """HTML 파싱을 맡기고 (상품 목록, 총 페이지 수, 구간별 시간, 추출 실패 수, 로그 기록)을 돌려줄 Future 반환"""
+        self._pending.acquire()
+        try:
+            future = self._executor.submit(parse_listing_html, site_name, html, page_url, category, plan)
+        except Exception:
+            self._pending.release()
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def print_summary(self):
+        stats = self.stats
+        if not stats['pages']:
+            return
+        print("\n===== 파싱 프로세스 =====")
+        print(f"프로세스 {self.max_workers}개, 파싱한 페이지 {stats['pages']}개, "
+              f"페이지당 평균 {stats['seconds'] / stats['pages'] * 1000:.1f}ms")
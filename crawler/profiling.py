@@ -0,0 +1,162 @@
+"""크롤링 실행의 구간별 시간 보고서와 코드 프로파일러 (--profile)
+
+    python chicfox.py --profile               # 카테고리별/구간별 시간만
+    python chicfox.py --profile cprofile      # + cProfile 결과 (.prof, snakeviz 등으로 열 수 있음)
+    python chicfox.py --profile pyinstrument  # + pyinstrument HTML 보고서 (pip install pyinstrument)
+
+cprofile/pyinstrument 모드에서는 카테고리 워커가 하나로 줄어들어 실행 시간이 길어진다.
+"""
+import cProfile
+import importlib.util
+import io
+import json
+import os
+import pstats
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import reduce
+
+from crawler.journal import STATE_DIR
+from crawler.metrics import METRICS, PHASES
+
+# 프로파일 결과를 저장하는 디렉토리
+PROFILE_DIR = os.path.join(STATE_DIR, 'profiles')
+
+# --profile 모드 (timers: 구간별 시간만, 나머지는 코드 프로파일러도 함께 실행)
+PROFILE_MODES = ('timers', 'cprofile', 'pyinstrument')
+
+# cProfile 요약에 출력할 함수 수
+PROFILE_TOP_FUNCTIONS = 30
+
+
+def profile_path(site_name, suffix):
+    """실행마다 새로 만드는 사이트별 프로파일 결과 파일 경로"""
+    return os.path.join(PROFILE_DIR, f"{site_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}")
+
+
+class CodeProfiler:
+    """카테고리마다 워커 스레드에서 켜고 실행이 끝나면 합치는 코드 프로파일러
+
+    cProfile과 pyinstrument는 켠 스레드만 보므로 워커 스레드 안에서 thread()로 감싼다.
+    Python 3.12부터 cProfile은 프로세스 전체에서 하나만 켤 수 있으므로("Another profiling tool is
+    already active") 한 번에 한 스레드에서만 켠다. run_site()는 코드 프로파일링 중에 카테고리 워커를
+    하나로 줄이고, 상세/이미지 단계와 다른 스레드의 코드는 결과에 나오지 않는다.
+    """
+
+    def __init__(self, kind):
+        if kind not in PROFILE_MODES[1:]:
+            raise ValueError(f"알 수 없는 프로파일러: {kind} (사용 가능: {', '.join(PROFILE_MODES[1:])})")
+        if kind == 'pyinstrument' and importlib.util.find_spec('pyinstrument') is None:
+            raise RuntimeError("pyinstrument가 설치되어 있지 않습니다 (pip install pyinstrument)")
+        self.kind = kind
+        self._lock = threading.Lock()
+        self._active = threading.Lock()
+        self._results = []
+
+    @contextmanager
+    def thread(self):
+        """이 스레드에서 실행하는 코드를 프로파일링 (다른 스레드에서 이미 켜져 있으면 RuntimeError)"""
+        if not self._active.acquire(blocking=False):
+            raise RuntimeError("코드 프로파일러는 한 번에 한 스레드에서만 켤 수 있습니다 (카테고리 워커를 1개로 실행하세요)")
+        try:
+            with self._profile():
+                yield
+        finally:
+            self._active.release()
+
+    @contextmanager
+    def _profile(self):
+        if self.kind == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                with self._lock:
+                    self._results.append(profiler)
+        else:
+            from pyinstrument import Profiler
+
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield
+            finally:
+                session = profiler.stop()
+                with self._lock:
+                    self._results.append(session)
+
+    def save(self, site_name):
+        """스레드별 결과를 합쳐서 파일로 저장하고 요약 출력, 저장한 경로 반환 (결과가 없으면 None)"""
+        if not self._results:
+            return None
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        if self.kind == 'cprofile':
+            path = profile_path(site_name, '.prof')
+            stream = io.StringIO()
+            stats = pstats.Stats(*self._results, stream=stream)
+            stats.dump_stats(path)
+            stats.sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+            print(f"\n===== cProfile (누적 시간 상위 {PROFILE_TOP_FUNCTIONS}개) =====")
+            print(stream.getvalue())
+        else:
+            from pyinstrument.renderers import ConsoleRenderer, HTMLRenderer
+            from pyinstrument.session import Session
+
+            path = profile_path(site_name, '.html')
+            session = reduce(Session.combine, self._results)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(HTMLRenderer().render(session))
+            print("\n===== pyinstrument =====")
+            print(ConsoleRenderer(unicode=True, color=False).render(session))
+        print(f"프로파일 결과 저장: {path}")
+        return path
+
+
+def phase_report(metrics=METRICS):
+    """카테고리별 구간 시간 {카테고리: {구간: {'count', 'seconds', 'max_seconds'}}} (카테고리 밖은 '(공통)')"""
+    report = {}
+    for category, phases in metrics.phase_breakdown('category').items():
+        report[category or '(공통)'] = {
+            phase: {'count': count, 'seconds': round(total, 4), 'max_seconds': round(maximum, 4)}
+            for phase, (count, total, maximum) in phases.items()
+        }
+    return report
+
+
+def print_phase_report(report, elapsed):
+    """구간별 합계와 카테고리별 구간 시간 출력
+
+    워커가 동시에 실행되므로 구간 합계는 실행 시간보다 클 수 있고, 세부 구간은 바깥 구간에 포함된다.
+    """
+    titles = dict(PHASES)
+    totals = {}
+    for phases in report.values():
+        for phase, entry in phases.items():
+            count, seconds = totals.get(phase, (0, 0.0))
+            totals[phase] = (count + entry['count'], seconds + entry['seconds'])
+
+    print(f"\n===== 구간별 시간 (실행 시간 {elapsed:.1f}초) =====")
+    for phase, title in PHASES:
+        if phase not in totals:
+            continue
+        count, seconds = totals[phase]
+        print(f"{title}: {seconds:.2f}초 (실행 시간의 {seconds / (elapsed or 1.0) * 100:.1f}%), "
+              f"{count}회, 평균 {seconds / count * 1000:.1f}ms")
+
+    print("\n===== 카테고리별 구간 시간 =====")
+    for category, phases in sorted(report.items(), key=lambda item: str(item[0])):
+        parts = [f"{titles[phase]} {phases[phase]['seconds']:.2f}초" for phase, _ in PHASES if phase in phases]
+        print(f"[{category}] " + ', '.join(parts))
+
+
+def save_phase_report(site_name, report, elapsed):
+    """구간별 시간을 JSON으로 저장 (실행끼리 비교할 때 사용)"""
+    path = profile_path(site_name, '_phases.json')
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'elapsed_seconds': round(elapsed, 3), 'categories': report}, f, ensure_ascii=False, indent=2)
+    print(f"구간별 시간 저장: {path}")
+    return path
@@ -0,0 +1,108 @@
+import json
+import os
+import random
+import threading
+import time
+
+import requests
+
+from crawler.fetch import PageNotReady
+from crawler.journal import STATE_DIR
+from crawler.metrics import METRICS, log
+
+
+def dead_letter_path(site_name):
+    """사이트별 마지막까지 실패한 페이지 목록 파일 경로"""
+    return os.path.join(STATE_DIR, f"{site_name}_dead_letters.json")
+
+
+def is_retryable(error):
+    """다시 시도해 볼 만한 오류인지
+
+    429를 뺀 4xx 응답과 상품 목록이 없는 페이지(PageNotReady)는 다시 요청해도 같으므로 제외한다.
+    """
+    if isinstance(error, PageNotReady):
+        return False
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return True
+
+
+class RetryBudget:
+    """한 번 실행에서 모든 워커가 함께 쓰는 재시도 횟수 한도
+
+    사이트 전체가 응답하지 않을 때 페이지마다 재시도를 반복해서 실행이 끝없이 늘어지지 않게 한다.
+    """
+
+    def __init__(self, limit=100):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self):
+        """재시도 한 번을 쓰고 성공 여부 반환 (한도를 다 썼으면 False)"""
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+
+def retry_call(func, attempts=3, base_delay=2.0, max_delay=60.0, budget=None, label=''):
+    """func()를 실행하고 실패하면 지수 백오프(full jitter)로 attempts번까지 다시 시도"""
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= attempts or not is_retryable(e) or (budget is not None and not budget.take()):
+                raise
+            # 대기 시간을 0 ~ base_delay * 2^attempt 사이에서 고르면 여러 워커의 재시도가 한꺼번에 몰리지 않음
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            attempt += 1
+            METRICS.inc('retries')
+            log('warning', 'retry', f"{label} 요청 실패, {delay:.1f}초 뒤 다시 시도합니다 ({attempt}/{attempts}): {e}",
+                attempt=attempt, delay=round(delay, 3), error=str(e))
+            METRICS.observe('backoff', delay)
+            time.sleep(delay)
+
+
+class DeadLetters:
+    """재시도까지 실패한 목록 페이지 모음 (실행 마지막에 한 번 더 시도)
+
+    page가 None인 항목은 첫 페이지부터 실패해서 카테고리 전체를 다시 시도해야 하는 경우이다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(list(self.entries))
+
+    def add(self, category, listing_url, page=None, page_url=None, total_pages=None, error=None):
+        with self._lock:
+            self.entries.append({
+                'category': category,
+                'listing_url': listing_url,
+                'page': page,
+                'page_url': page_url or listing_url,
+                'total_pages': total_pages,
+                'error': str(error) if error else None,
+            })
+
+    def save(self, path):
+        """남은 항목을 JSON으로 저장 (없으면 이전 파일 삭제)"""
+        if not self.entries:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
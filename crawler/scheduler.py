@@ -0,0 +1,235 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from crawler.metrics import METRICS, log
+
+
+class _HostState:
+    def __init__(self, max_concurrency, interval, min_interval):
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.lock = threading.Lock()
+        self.robots_lock = threading.Lock()
+        self.robots_checked = False
+        self.crawl_delay = None
+        # 토큰 하나가 생기는 주기(현재 요청 간격)와 더 줄이지 않는 하한
+        self.interval = interval
+        self.min_interval = min_interval
+        self.tokens = 1.0
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.latency = None
+        self.requests = 0
+        self.backoffs = 0
+        self.waited = 0.0
+
+
+class RequestTicket:
+    """슬롯 안에서 보낸 요청의 결과 (응답 상태와 Retry-After)를 제한기에 알려 주는 객체"""
+
+    def __init__(self):
+        self.status = None
+        self.retry_after = None
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더의 초 값 (날짜 형식이거나 없으면 None)"""
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def robots_crawl_delay(scheme, host, user_agent='*', timeout=5):
+    """robots.txt의 Crawl-delay/Request-rate를 요청 간격(초)으로 반환 (없으면 None)
+
+    User-Agent가 없는 요청에는 403이나 다른 정책을 돌려주는 호스트가 있으므로 페이지 요청과 같은 헤더를 보낸다.
+    """
+    # crawler.fetch가 이 모듈을 가져오므로 여기서 가져옴
+    from crawler.fetch import DEFAULT_HEADERS
+
+    try:
+        response = requests.get(f'{scheme}://{host}/robots.txt', headers=DEFAULT_HEADERS, timeout=timeout)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+
+    parser = RobotFileParser()
+    parser.parse(response.text.splitlines())
+    # parse()만 하면 읽은 시각이 없어서 crawl_delay()가 None을 돌려주므로 직접 기록
+    parser.modified()
+    delays = []
+    crawl_delay = parser.crawl_delay(user_agent)
+    if crawl_delay:
+        delays.append(float(crawl_delay))
+    request_rate = parser.request_rate(user_agent)
+    if request_rate and request_rate.requests:
+        delays.append(request_rate.seconds / request_rate.requests)
+    return max(delays) if delays else None
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수와 요청 속도를 응답 상태에 맞춰 조절하는 토큰 버킷 제한기
+
+    호스트마다 동시에 진행 중인 요청은 max_concurrency개 이하이고, 요청은 interval초마다 하나씩
+    생기는 토큰을 써야 시작할 수 있다. interval은 initial_interval에서 시작해서
+    - 429/5xx 응답이나 연결 오류가 나면 backoff배로 늘리고 (Retry-After가 있으면 그동안 멈춤)
+    - 평균 응답 시간이 slow_threshold초를 넘으면 조금 늘리고
+    - 응답이 빠르고 정상이면 speedup배로 줄여서 min_interval까지 빨라진다.
+    robots.txt에 Crawl-delay나 Request-rate가 있으면 그 값보다 빨리 요청하지 않는다.
+    """
+
+    def __init__(self, max_concurrency=2, min_interval=0.25, initial_interval=1.0, max_interval=30.0,
+                 slow_threshold=2.0, backoff=2.0, speedup=0.9, respect_robots=True, user_agent='*'):
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self.initial_interval = max(initial_interval, min_interval)
+        self.max_interval = max_interval
+        self.slow_threshold = slow_threshold
+        self.backoff = backoff
+        self.speedup = speedup
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.max_concurrency, self.initial_interval,
+                                                       self.min_interval)
+            return state
+
+    def _check_robots(self, state, scheme, host):
+        # 호스트마다 처음 한 번만 robots.txt를 읽음 (다른 워커는 읽을 때까지 대기)
+        with state.robots_lock:
+            if state.robots_checked:
+                return
+            crawl_delay = robots_crawl_delay(scheme, host, self.user_agent)
+            with state.lock:
+                if crawl_delay:
+                    state.crawl_delay = crawl_delay
+                    state.min_interval = max(state.min_interval, crawl_delay)
+                    state.interval = max(state.interval, crawl_delay)
+                state.robots_checked = True
+
+    def _reserve(self, state):
+        """토큰 하나를 예약하고 기다려야 할 시간 반환"""
+        with state.lock:
+            now = time.monotonic()
+            # 쉬는 동안 모인 토큰은 1개(버스트 없음)까지만 인정
+            state.tokens = min(1.0, state.tokens + (now - state.updated_at) / state.interval)
+            state.updated_at = now
+            state.tokens -= 1.0
+            wait = -state.tokens * state.interval if state.tokens < 0 else 0.0
+            wait = max(wait, state.blocked_until - now)
+            state.requests += 1
+            state.waited += wait
+            return wait
+
+    def _adjust(self, state, elapsed, ticket, failed):
+        """응답 결과에 따라 요청 간격 조절"""
+        status = ticket.status
+        with state.lock:
+            if failed or status == 429 or (status is not None and status >= 500):
+                state.interval = min(self.max_interval, state.interval * self.backoff)
+                state.backoffs += 1
+                retry_after = parse_retry_after(ticket.retry_after)
+                if retry_after:
+                    state.blocked_until = max(state.blocked_until, time.monotonic() + retry_after)
+                return
+
+            state.latency = elapsed if state.latency is None else state.latency * 0.8 + elapsed * 0.2
+            if state.latency > self.slow_threshold:
+                state.interval = min(self.max_interval, state.interval * 1.25)
+            else:
+                state.interval = max(state.min_interval, state.interval * self.speedup)
+
+    @contextmanager
+    def slot(self, url):
+        """요청 하나를 보내는 동안 호스트 슬롯을 점유하고, 끝나면 응답 결과로 요청 속도 조절
+
+        슬롯 안에서 받은 응답 상태는 yield된 RequestTicket에 적어 둔다.
+        """
+        parsed = urlparse(url)
+        state = self._state(parsed.netloc)
+        if self.respect_robots and not state.robots_checked:
+            self._check_robots(state, parsed.scheme or 'https', parsed.netloc)
+
+        ticket = RequestTicket()
+        state.semaphore.acquire()
+        try:
+            wait = self._reserve(state)
+            if wait > 0:
+                METRICS.observe('throttle', wait)
+                time.sleep(wait)
+            started = time.monotonic()
+            failed = False
+            try:
+                yield ticket
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self._adjust(state, time.monotonic() - started, ticket, failed)
+        finally:
+            state.semaphore.release()
+
+    def print_summary(self):
+        if not self._hosts:
+            return
+        print("\n===== 호스트별 요청 속도 =====")
+        for host, state in sorted(self._hosts.items()):
+            latency = f"{state.latency:.2f}초" if state.latency is not None else '-'
+            crawl_delay = f", robots 간격 {state.crawl_delay:g}초" if state.crawl_delay else ''
+            print(f"{host}: 요청 {state.requests}회, 감속 {state.backoffs}회, 대기 {state.waited:.1f}초, "
+                  f"평균 응답 {latency}, 현재 간격 {state.interval:.2f}초{crawl_delay}")
+
+
+def crawl_categories(categories, task, fetcher_factory, max_workers=4):
+    """워커 풀로 여러 카테고리를 동시에 크롤링
+
+    task(index, category, fetcher)를 카테고리마다 실행하고, 끝나는 순서대로
+    (index, category, 결과)를 돌려준다. index는 1부터 시작하는 원래 순서이다.
+    페치 백엔드(브라우저, HTTP 세션)는 워커 스레드마다 하나씩 만들어 재사용한다.
+    """
+    local = threading.local()
+    fetchers = []
+    fetchers_lock = threading.Lock()
+
+    def get_fetcher():
+        fetcher = getattr(local, 'fetcher', None)
+        if fetcher is None:
+            fetcher = local.fetcher = fetcher_factory()
+            with fetchers_lock:
+                fetchers.append(fetcher)
+        return fetcher
+
+    def run(index, category):
+        return task(index, category, get_fetcher())
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(run, index, category): (index, category)
+                for index, category in enumerate(categories, 1)
+            }
+            for future in as_completed(futures):
+                index, category = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    log('error', 'category_failed', f"카테고리 크롤링 작업 실패 ({index}/{len(categories)}): {e}",
+                        index=index, error=str(e))
+                    result = []
+                yield index, category, result
+    finally:
+        for fetcher in fetchers:
+            fetcher.close()
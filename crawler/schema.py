@@ -0,0 +1,99 @@
+import re
+
+# 결과 컬럼별 타입 ('int', 'float', 'bool', 'list', 'category', 그 외는 문자열)
+COLUMN_TYPES = {
+    '정가': 'int',
+    '판매가': 'int',
+    '가격': 'int',
+    '할인율': 'float',
+    '리뷰수': 'int',
+    '판매수량': 'int',
+    '좋아요수': 'int',
+    '품절여부': 'bool',
+    '상품ID': 'int',
+    '색상': 'list',
+    '카테고리': 'category',
+    '카테고리_대분류': 'category',
+    '카테고리_소분류': 'category',
+    '카테고리_전체': 'category',
+}
+
+
+def to_int(value):
+    """가격/개수 값을 정수로 변환 (숫자가 없으면 None)"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    digits = re.sub(r'[^\d]', '', str(value))
+    return int(digits) if digits else None
+
+
+def to_float(value):
+    """할인율 같은 값에서 첫 번째 숫자를 실수로 변환 (숫자가 없으면 None)"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    number_match = re.search(r'\d+(?:\.\d+)?', str(value))
+    return float(number_match.group(0)) if number_match else None
+
+
+def to_bool(value):
+    """True/False 값 또는 "True"/"False" 문자열을 bool로 변환"""
+    if value is None or isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ('true', '1', 'y', 'yes'):
+        return True
+    if text in ('false', '0', 'n', 'no', ''):
+        return False
+    return None
+
+
+def split_colors(value):
+    """쉼표로 이어 붙인 색상 문자열을 목록으로 분리 (rgb(...) 괄호 안의 쉼표는 나누지 않음)"""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+
+    colors = []
+    depth = 0
+    current = []
+    for char in str(value):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        if char == ',' and depth == 0:
+            colors.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+    colors.append(''.join(current))
+
+    # 스타일에서 가져온 값의 끝에 붙은 세미콜론과 공백 정리
+    return [color.strip().rstrip(';').strip() for color in colors if color.strip().rstrip(';').strip()]
+
+
+def to_text(value):
+    if value is None:
+        return None
+    return str(value)
+
+
+CONVERTERS = {
+    'int': to_int,
+    'float': to_float,
+    'bool': to_bool,
+    'list': split_colors,
+}
+
+
+def typed_row(row):
+    """결과 행의 값을 컬럼 타입에 맞게 변환"""
+    return {
+        column: CONVERTERS.get(COLUMN_TYPES.get(column), to_text)(value)
+        for column, value in row.items()
+    }
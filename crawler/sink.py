@@ -0,0 +1,262 @@
+import csv
+import hashlib
+import os
+import threading
+
+from crawler.schema import COLUMN_TYPES, typed_row
+
+
+class ResultSink:
+    """크롤링 결과 행을 받는 대로 기록하는 스트리밍 출력
+
+    write()는 여러 워커 스레드에서 호출될 수 있으므로 잠금 안에서 _write_rows()를 호출한다.
+    전체 결과를 메모리에 모으지 않으므로 사이트/카테고리가 늘어나도 메모리 사용량은 일정하다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rows_written = 0
+
+    def write(self, rows):
+        with self._lock:
+            self.rows_written += self._write_rows(rows)
+
+    def _write_rows(self, rows):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class CsvSink(ResultSink):
+    """CSV 파일에 행을 덧붙이고 쓸 때마다 flush (첫 행이 들어올 때 파일 생성)
+
+    append=True면 기존 파일 뒤에 이어 쓴다 (컬럼은 기존 헤더를 따름).
+    """
+
+    def __init__(self, path, columns=None, append=False):
+        super().__init__()
+        self.path = path
+        self.columns = columns
+        self.append = append
+        self._file = None
+        self._writer = None
+
+    def _open(self, first_row):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 컬럼을 지정하지 않으면 첫 행의 키 순서를 그대로 사용
+        columns = self.columns or list(first_row)
+        if self.append and os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, newline='', encoding='utf-8-sig') as f:
+                columns = next(csv.reader(f), None) or columns
+            self._file = open(self.path, 'a', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction='ignore')
+            return
+        self._file = open(self.path, 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def _write_rows(self, rows):
+        if not rows:
+            return 0
+        if self._writer is None:
+            self._open(rows[0])
+        self._writer.writerows(rows)
+        self._file.flush()
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.close()
+
+
+class ExcelSink(ResultSink):
+    """openpyxl write-only 모드로 Excel 파일 작성 (행은 임시 파일로 흘려보내고 close()에서 저장)"""
+
+    def __init__(self, path, columns=None):
+        super().__init__()
+        from openpyxl import Workbook
+
+        self.path = path
+        self.columns = columns
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet()
+        self._header_written = False
+        self._closed = False
+
+    def _write_rows(self, rows):
+        if not rows:
+            return 0
+        if not self._header_written:
+            self.columns = self.columns or list(rows[0])
+            self._sheet.append(self.columns)
+            self._header_written = True
+        for row in rows:
+            self._sheet.append([row.get(column) for column in self.columns])
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._header_written:
+                self._workbook.save(self.path)
+
+
+class ParquetSink(ResultSink):
+    """타입이 있는 스키마로 Parquet 파일 작성
+
+    가격/개수는 정수, 할인율은 실수, 품절여부는 bool, 색상은 문자열 목록, 카테고리 컬럼은
+    사전 인코딩으로 저장한다. 행은 batch_size개씩 모아 row group 단위로 기록한다.
+    """
+
+    def __init__(self, path, columns=None, batch_size=5000):
+        super().__init__()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        self.columns = columns
+        self.batch_size = batch_size
+        self._buffer = []
+        self._schema = None
+        self._writer = None
+        self._closed = False
+
+    def _build_schema(self, columns):
+        pa = self._pa
+        arrow_types = {
+            'int': pa.int64(),
+            'float': pa.float64(),
+            'bool': pa.bool_(),
+            'list': pa.list_(pa.string()),
+            'category': pa.dictionary(pa.int32(), pa.string()),
+        }
+        return pa.schema([
+            pa.field(column, arrow_types.get(COLUMN_TYPES.get(column), pa.string()))
+            for column in columns
+        ])
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        if self._writer is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._writer = self._pq.ParquetWriter(self.path, self._schema)
+        data = {column: [row.get(column) for row in self._buffer] for column in self._schema.names}
+        self._writer.write_table(self._pa.Table.from_pydict(data, schema=self._schema))
+        self._buffer = []
+
+    def _write_rows(self, rows):
+        if not rows:
+            return 0
+        if self._schema is None:
+            self.columns = self.columns or list(rows[0])
+            self._schema = self._build_schema(self.columns)
+        self._buffer.extend(typed_row(row) for row in rows)
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush()
+            if self._writer is not None:
+                self._writer.close()
+
+
+class MultiSink(ResultSink):
+    """같은 행을 여러 출력에 기록"""
+
+    def __init__(self, sinks):
+        super().__init__()
+        self.sinks = list(sinks)
+
+    def _write_rows(self, rows):
+        for sink in self.sinks:
+            sink.write(rows)
+        return len(rows)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class DedupSink(ResultSink):
+    """필드 값 기준으로 중복 행을 걸러서 다음 출력으로 전달
+
+    정수 값(상품 색인 ID)은 그대로, 문자열은 8바이트 해시로만 보관해서 상품 수가 많아도
+    중복 판단용 메모리는 작게 유지한다. 빈 값인 행은 버리고, 먼저 들어온 행을 유지한다.
+    """
+
+    def __init__(self, sink, field):
+        super().__init__()
+        self.sink = sink
+        self.field = field
+        self.rows_seen = 0
+        self._seen = set()
+
+    def _key(self, value):
+        if isinstance(value, int):
+            return value
+        value = str(value).strip()
+        if not value:
+            return None
+        return hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest()
+
+    def _write_rows(self, rows):
+        unique_rows = []
+        for row in rows:
+            self.rows_seen += 1
+            value = row.get(self.field)
+            key = self._key(value) if value is not None else None
+            if key is None:
+                continue
+            if key not in self._seen:
+                self._seen.add(key)
+                unique_rows.append(row)
+        self.sink.write(unique_rows)
+        return len(unique_rows)
+
+    def close(self):
+        self.sink.close()
+
+
+def open_output_sink(output_name, dedup_field, exports=('csv',)):
+    """통합 결과용 출력 생성 (중복 제거 후 Parquet과 선택한 추가 형식에 동시 기록)
+
+    Parquet이 기본 형식이고 exports에 'csv', 'xlsx'를 넣으면 함께 저장한다.
+    pyarrow가 없으면 결과를 잃지 않도록 CSV로 대신 저장한다.
+    """
+    sinks = []
+    try:
+        sinks.append(ParquetSink(f'{output_name}.parquet'))
+    except ImportError:
+        print("pyarrow가 설치되어 있지 않아 Parquet 대신 CSV로 저장합니다.")
+        exports = set(exports) | {'csv'}
+    if 'csv' in exports:
+        sinks.append(CsvSink(f'{output_name}.csv'))
+    if 'xlsx' in exports:
+        try:
+            sinks.append(ExcelSink(f'{output_name}.xlsx'))
+        except ImportError:
+            print("openpyxl이 설치되어 있지 않아 Excel 파일은 저장하지 않습니다.")
+    return DedupSink(MultiSink(sinks), dedup_field)
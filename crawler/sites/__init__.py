@@ -0,0 +1,20 @@
+"""사이트별 어댑터 모음"""
+from crawler.sites.baddiary import BaddiarySite
+from crawler.sites.chicfox import ChicfoxSite
+from crawler.sites.closhoew import CloshoewSite
+from crawler.sites.joamom import JoamomSite
+
+SITES = {
+    'chicfox': ChicfoxSite,
+    'joamom': JoamomSite,
+    'closhoew': CloshoewSite,
+    'baddiary': BaddiarySite,
+}
+
+
+def get_site(name):
+    """이름으로 사이트 어댑터 생성"""
+    try:
+        return SITES[name]()
+    except KeyError:
+        raise ValueError(f"알 수 없는 사이트: {name} (지원: {', '.join(SITES)})")
@@ -0,0 +1,251 @@
+"""baddiary (카페24) 사이트 어댑터"""
+import re
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+from bs4 import BeautifulSoup
+from crawler.detail import parse_cafe24_options
+from crawler.engine import SiteAdapter
+from crawler.metrics import log
+
+CATEGORY_HTML = """
+        <aside id="drawermenuwrap" class="drawermenuwrap2 d1popupwrap D1W" style="display: block;"><div class="drawermenu -frame -flex">
+                    <!-- 관리자 연동 -->
+                    <!--<div class="drawercategory"><ul id="drawercategorydata" class="-flex"></ul></div>-->
+                    <!-- HTML 코딩 -->
+                    <div class="drawercategory -flex"><ul class="drawerbox"><li cateno="36" class="-d1 d1ddm"><a href="/product/list.html?cate_no=36">BEST</a></li>
+    <li cateno="72" class="-d1 d1ddm"><a href="/product/list.html?cate_no=72">NEW 5%</a></li>
+    <li cateno="69" class="-d1 d1ddm"><a href="/product/list.html?cate_no=69">MADE</a></li>
+    <li cateno="33" class="-d1 d1ddm"><a href="/product/list.html?cate_no=33">오늘출발🚚</a></li>
+</ul><ul class="drawerbox"><li cateno="24" class="-d1 d1ddm hasChild">
+        <a href="/product/list.html?cate_no=24">DRESS<div class="icon"></div></a>
+        <ul class="-subcover1 submenu"><li cateno="173" class="-d2"><a href="/product/list.html?cate_no=173">프린트</a></li>
+            <li cateno="175" class="-d2"><a href="/product/list.html?cate_no=175">솔리드(무지)</a></li>
+            <li cateno="176" class="-d2"><a href="/product/list.html?cate_no=176">H라인</a></li>
+            <li cateno="177" class="-d2"><a href="/product/list.html?cate_no=177">플레어&amp;A라인</a></li>
+        </ul></li>
+</ul><ul class="drawerbox"><li cateno="25" class="-d1 d1ddm hasChild">
+        <a href="/product/list.html?cate_no=25">OUTER<div class="icon"></div></a>
+        <ul class="-subcover1 submenu"><li cateno="177" class="-d2"><a href="/product/list.html?cate_no=51">가디건</a></li>
+            <li cateno="52" class="-d2"><a href="/product/list.html?cate_no=52">자켓/코트</a></li>
+            <li cateno="418" class="-d2"><a href="/product/list.html?cate_no=418">패딩</a></li>
+        </ul></li>
+</ul><ul class="drawerbox"><li cateno="42" class="-d1 d1ddm hasChild">
+        <a href="/product/list.html?cate_no=42">TOP<div class="icon"></div></a>
+        <ul class="-subcover1 submenu"><li cateno="46" class="-d2"><a href="/product/list.html?cate_no=46">블라우스</a></li>
+            <li cateno="45" class="-d2"><a href="/product/list.html?cate_no=45">티/니트</a></li>
+        </ul></li>
+</ul><ul class="drawerbox"><li cateno="27" class="-d1 d1ddm hasChild">
+        <a href="/product/list.html?cate_no=27">BOTTOM<div class="icon"></div></a>
+        <ul class="-subcover1 submenu"><li cateno="48" class="-d2"><a href="/product/list.html?cate_no=48">팬츠</a></li>
+            <li cateno="49" class="-d2"><a href="/product/list.html?cate_no=49">스커트</a></li>
+        </ul></li>
+</ul><ul class="drawerbox"><li cateno="28" class="-d1 d1ddm"><a href="/product/list.html?cate_no=28">ACC</a></li>
+    <li cateno="227" class="-d1 d1ddm"><a href="/product/list.html?cate_no=227">출근룩</a></li>
+    <li cateno="35" class="-d1 d1ddm"><a href="/product/list.html?cate_no=35">웨딩&amp;세레머니</a></li>
+    <li cateno="152" class="-d1 d1ddm"><a href="/product/list.html?cate_no=152">베이직</a></li>
+    <li cateno="320" class="-d1 d1ddm"><a href="/product/list.html?cate_no=320">셋업</a></li>
+    <li cateno="445" class="-d1 d1ddm"><a href="/product/list.html?cate_no=445">여행룩✈️</a></li>
+	<li cateno="31" class="-d1 d1ddm"><a href="/product/list.html?cate_no=43">77SIZE</a></li>
+	<li cateno="31" class="-d1 d1ddm"><a href="/product/list.html?cate_no=31">아울렛</a></li>
+</ul></div>
+                </div>
+            </aside>
+        """
+
+def extract_product_info(product_element):
+    """상품 요소에서 정보 추출"""
+    try:
+        # 상품명
+        product_name = ""
+        try:
+            product_name = product_element.find_element(By.CSS_SELECTOR, '.name a').text.strip()
+        except NoSuchElementException:
+            pass
+        
+        # 상품 URL
+        product_url = ""
+        try:
+            product_url = product_element.find_element(By.CSS_SELECTOR, '.name a').get_attribute('href')
+        except NoSuchElementException:
+            pass
+        
+        # 상품 설명
+        product_desc = ''
+        try:
+            product_desc = product_element.find_element(By.CSS_SELECTOR, '.xans-record- [rel="상품 요약설명"] span:last-child').text.strip()
+        except NoSuchElementException:
+            pass
+        
+        # 이미지 URL
+        image_url = ''
+        try:
+            img_element = product_element.find_element(By.CSS_SELECTOR, '.thumbnail img')
+            image_url = img_element.get_attribute('src')
+            # 이미지가 지연 로딩되는 경우 확인
+            if not image_url or image_url == "":
+                image_url = img_element.get_attribute('data-src')
+        except NoSuchElementException:
+            pass
+        
+        # 정가 (할인이 있는 경우)
+        original_price = None
+        try:
+            price_element = product_element.find_element(By.CSS_SELECTOR, '.xans-record- [rel="판매가"] span')
+            original_price_text = price_element.text.strip()
+            if "원" in original_price_text:
+                original_price = re.sub(r'[^\d]', '', original_price_text)
+        except NoSuchElementException:
+            pass
+        
+        # 할인가 (할인이 있는 경우)
+        discounted_price = None
+        try:
+            discount_element = product_element.find_element(By.CSS_SELECTOR, '.xans-record- [rel="할인판매가"] span')
+            discount_text = discount_element.text.strip()
+            discount_match = re.search(r'(\d+,?\d+)원', discount_text)
+            if discount_match:
+                discounted_price = re.sub(r'[^\d]', '', discount_match.group(1))
+        except NoSuchElementException:
+            # 할인이 없는 경우 원래 가격을 판매가로 설정
+            if original_price:
+                discounted_price = original_price
+                original_price = None
+        
+        # 할인율
+        discount_rate = None
+        try:
+            sale_element = product_element.find_element(By.CSS_SELECTOR, '.xans-record- [rel="할인판매가"] span span')
+            discount_text = sale_element.text.strip()
+            discount_match = re.search(r'(\d+(?:\.\d+)?)', discount_text)
+            if discount_match:
+                discount_rate = discount_match.group(1)
+        except NoSuchElementException:
+            pass
+            
+        # 또는 discountrate 클래스에서 할인율 추출
+        if not discount_rate:
+            try:
+                discount_rate_element = product_element.find_element(By.CSS_SELECTOR, '.discountrate span.per')
+                discount_rate = discount_rate_element.text.strip()
+            except NoSuchElementException:
+                pass
+        
+        # 리뷰 수
+        reviews = 0
+        try:
+            review_element = product_element.find_element(By.CSS_SELECTOR, '.snap_review_count')
+            review_text = review_element.text
+            review_match = re.search(r'리뷰 : (\d+)', review_text)
+            if review_match:
+                reviews = int(review_match.group(1))
+        except (NoSuchElementException, ValueError):
+            pass
+        
+        # 색상 정보
+        colors = []
+        try:
+            color_chips = product_element.find_elements(By.CSS_SELECTOR, '.colorChip span.chips')
+            for color in color_chips:
+                color_style = color.get_attribute('style')
+                if 'background-color:' in color_style:
+                    color_value = re.search(r'background-color:(.*)', color_style).group(1).strip()
+                    colors.append(color_value)
+        except NoSuchElementException:
+            pass
+        
+        # 제품 정보를 딕셔너리로 저장
+        product_info = {
+            '상품명': product_name,
+            '상품URL': product_url,
+            '상품설명': product_desc,
+            '이미지URL': image_url,
+            '정가': original_price,
+            '판매가': discounted_price if discounted_price else original_price,
+            '할인율': discount_rate,
+            '리뷰수': reviews,
+            '색상': ', '.join(colors)
+        }
+        
+        return product_info
+    
+    except Exception as e:
+        log('warning', 'extract_error', f"상품 정보 추출 중 오류 발생: {e}", error=str(e))
+        return None
+
+def extract_category_urls(html_content):
+    """HTML에서 카테고리 URL 추출"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    category_links = []
+    
+    # 드로어 메뉴에서 메인 카테고리와 서브 카테고리 추출
+    drawer_category = soup.select('.drawercategory .drawerbox')
+    
+    for box in drawer_category:
+        main_categories = box.select('li.-d1')
+        
+        for main_category in main_categories:
+            main_link = main_category.select_one('a')
+            if not main_link:
+                continue
+                
+            main_category_name = main_link.text.strip()
+            main_url = main_link.get('href', '')
+            
+            # 절대 URL로 변환
+            if main_url.startswith('/'):
+                main_url = f"https://baddiary.com{main_url}"
+            
+            # 서브카테고리가 있는지 확인
+            has_sub = main_category.has_attr('class') and 'hasChild' in main_category['class']
+            
+            if has_sub:
+                # 서브 카테고리 추출
+                sub_categories = main_category.select('ul.-subcover1 li.-d2')
+                for sub_category in sub_categories:
+                    sub_link = sub_category.select_one('a')
+                    if not sub_link:
+                        continue
+                        
+                    sub_category_name = sub_link.text.strip()
+                    sub_url = sub_link.get('href', '')
+                    
+                    # 절대 URL로 변환
+                    if sub_url.startswith('/'):
+                        sub_url = f"https://baddiary.com{sub_url}"
+                        
+                    # 카테고리 정보 저장
+                    category_links.append({
+                        'main_category': main_category_name,
+                        'sub_category': sub_category_name,
+                        'url': sub_url
+                    })
+            else:
+                # 서브 카테고리가 없는 경우 메인 카테고리만 추가
+                category_links.append({
+                    'main_category': main_category_name,
+                    'sub_category': '',
+                    'url': main_url
+                })
+    
+    return category_links
+
+class BaddiarySite(SiteAdapter):
+    name = 'baddiary'
+    ready_selector = '.xans-element-.xans-product.xans-product-listnormal ul.prdList li.item'
+    list_selectors = ('.xans-element-.xans-product.xans-product-listnormal ul.prdList li.item',)
+    total_selector = '.prdCount strong'
+    pagination_selector = '.ec-base-paginate li a'
+    # 카페24는 상품이 없으면 빈 목록 안내 모듈의 displaynone 클래스를 뺌
+    empty_selector = '.xans-product-listempty:not(.displaynone)'
+    page_size = 48
+    categories_file = 'baddiary_categories.csv'
+    output_name = 'baddiary_products_data'
+    newest_sort = {'sort_method': '5'}
+    product_key_param = 'product_no'
+    product_key_pattern = r'/product/[^/]+/(\d+)'
+    category_html = CATEGORY_HTML
+    category_id_params = ('cate_no',)
+
+    parse_categories = staticmethod(extract_category_urls)
+    extract_product_info = staticmethod(extract_product_info)
+    parse_detail = staticmethod(parse_cafe24_options)
@@ -0,0 +1,286 @@
+"""chicfox (메이크샵) 사이트 어댑터"""
+import re
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+from bs4 import BeautifulSoup
+from crawler.detail import parse_makeshop_options
+from crawler.engine import SiteAdapter
+from crawler.metrics import log
+
+CATEGORY_HTML = """
+        <div class="allMenuBx">
+                    <div class="allMenuInner">
+                        <div class="allMenuList lpNone">
+                            <ul>
+                                <li><a href="/shop/shopbrand.html?xcode=155&amp;type=P">BEST</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=157&amp;type=Y">NEW 5%</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=088&amp;type=Y" class="tmenuB">여우진</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=160&amp;type=Y" class="">스토리가든</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=086&amp;mcode=029&amp;type=Y" class="">봄신상 만나기</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=039&amp;type=P" class="">만원의 ♥행복</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=023&amp;type=O" class="">1+1 할인</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=086&amp;mcode=006&amp;type=Y" class="">리오더</a></li>
+                                <li><a href="/shop/shopbrand.html?xcode=067&amp;type=Y" class="">HOT! 세일</a></li>
+                            </ul>
+                        </div>
+                        <div class="allMenuList xline">
+                            <dl class="topMenu">
+                                <dt><a href="shop/shopbrand.html?xcode=001&amp;type=X">TOP</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=007">무지티</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=005">프린트티</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=004">후드&amp;맨투맨</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=002">나시</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=001">니트</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=008">베스트</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=006">셔츠</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=001&amp;type=M&amp;mcode=003">블라우스</a></dd>
+                            </dl>
+                            <dl class="bottomMenu">
+                                <dt><a href="/shop/shopbrand.html?xcode=113&amp;type=Y">KNIT/CARDIGAN</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=113&amp;type=N&amp;mcode=001">니트</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=113&amp;type=N&amp;mcode=002">가디건</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=113&amp;type=N&amp;mcode=003">베스트</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=113&amp;type=M&amp;mcode=004">집업</a></dd>
+                            </dl>
+                        </div>
+                        <div class="allMenuList">
+                            <dl class="topMenu">
+                                <dt><a href="/shop/shopbrand.html?xcode=010&amp;type=X">OUTER</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=010&amp;type=M&amp;mcode=001">자켓</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=010&amp;type=M&amp;mcode=002">점퍼/집업</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=010&amp;type=M&amp;mcode=003">가디건</a></dd>                                
+                                <dd><a href="/shop/shopbrand.html?xcode=010&amp;type=M&amp;mcode=004">코트</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=138&amp;type=P">바람막이</a></dd>
+                            </dl>
+                            <dl class="bottomMenu">
+                                <dt><a href="/shop/shopbrand.html?xcode=140&amp;type=Y">SHIRT/BLOUSE</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=140&amp;type=N&amp;mcode=001">셔츠</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=140&amp;type=N&amp;mcode=002">블라우스</a></dd>
+                            </dl>
+                        </div>
+                        <div class="allMenuList">
+                            <dl class="topMenu">
+                                <dt><a href="/shop/shopbrand.html?xcode=049&amp;type=X">PANTS</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=049&amp;type=M&amp;mcode=013">부츠컷</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=049&amp;type=M&amp;mcode=009">배기진</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=049&amp;type=M&amp;mcode=007">와이드팬츠</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=049&amp;type=M&amp;mcode=006">슬랙스</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=049&amp;type=M&amp;mcode=011">일자팬츠</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=049&amp;type=M&amp;mcode=005">반바지</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=049&amp;type=M&amp;mcode=002">트레이닝/레깅스</a></dd>
+                            </dl>
+                            <dl class="bottomMenu">
+                                <dt><a href="/shop/shopbrand.html?xcode=002&amp;type=X">DRESS&amp;SKIRT</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=002&amp;type=M&amp;mcode=001">원피스</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=002&amp;type=M&amp;mcode=002">스커트</a></dd>
+                            </dl>
+                        </div>
+                        <div class="allMenuList">
+                            <dl class="topMenu">
+                                <dt><a href="/shop/shopbrand.html?xcode=005&amp;type=X">ACC</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=005&amp;type=M&amp;mcode=002">모자</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=005&amp;type=M&amp;mcode=005">머플러&amp;스카프</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=005&amp;type=M&amp;mcode=006">쥬얼리</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=005&amp;type=M&amp;mcode=003">벨트</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=005&amp;type=M&amp;mcode=004">이너웨어</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=005&amp;type=M&amp;mcode=008">기타</a></dd>
+                            </dl>
+                            <dl class="bottomMenu">
+                                <dt><a href="/shop/shopbrand.html?xcode=004&amp;type=X">SHOES/BAG</a></dt>
+                                <dd><a href="/shop/shopbrand.html?xcode=004&amp;type=M&amp;mcode=001">SHOES</a></dd>
+                                <dd><a href="/shop/shopbrand.html?xcode=004&amp;type=M&amp;mcode=002">BAG</a></dd>
+                            </dl>
+                        </div>
+                    </div><!-- //inner -->
+                </div>
+        """
+
+def extract_product_info(product_element):
+    """상품 요소에서 정보 추출"""
+    try:
+        # 상품명
+        product_name = ""
+        try:
+            product_name = product_element.find_element(By.CSS_SELECTOR, '.item_name a').text.strip()
+        except NoSuchElementException:
+            pass
+        
+        # 상품 URL
+        product_url = ""
+        try:
+            product_url = product_element.find_element(By.CSS_SELECTOR, '.item_name a').get_attribute('href')
+        except NoSuchElementException:
+            pass
+        
+        # 상품 설명
+        product_desc = ''
+        try:
+            product_desc = product_element.find_element(By.CSS_SELECTOR, '.item_option').text.strip()
+        except NoSuchElementException:
+            pass
+        
+        # 이미지 URL
+        image_url = ''
+        try:
+            img_element = product_element.find_element(By.CSS_SELECTOR, '.item_img img')
+            image_url = img_element.get_attribute('src')
+            # 이미지가 지연 로딩되는 경우 data-frz-src 속성 확인
+            if not image_url or image_url == "":
+                image_url = img_element.get_attribute('data-frz-src')
+        except NoSuchElementException:
+            pass
+        
+        # 가격 정보
+        price_info = product_element.find_element(By.CSS_SELECTOR, '.item_price')
+        
+        # 정가 (할인이 있는 경우)
+        original_price = None
+        try:
+            strike_element = price_info.find_element(By.CSS_SELECTOR, '.strike')
+            original_price_text = strike_element.text.strip()
+            original_price = re.sub(r'[^\d]', '', original_price_text)
+        except NoSuchElementException:
+            pass
+        
+        # 판매가
+        current_price = None
+        try:
+            price_element = price_info.find_element(By.CSS_SELECTOR, '.price')
+            current_price_text = price_element.text.strip()
+            current_price = re.sub(r'[^\d]', '', current_price_text)
+        except NoSuchElementException:
+            pass
+        
+        # 할인율
+        discount_rate = None
+        try:
+            sale_element = price_info.find_element(By.CSS_SELECTOR, '.salePercent')
+            discount_text = sale_element.text.strip()
+            discount_match = re.search(r'(\d+(?:\.\d+)?)', discount_text)
+            if discount_match:
+                discount_rate = discount_match.group(1)
+        except NoSuchElementException:
+            pass
+        
+        # 리뷰 수
+        reviews = 0
+        try:
+            review_element = product_element.find_element(By.CSS_SELECTOR, '.snap_review_count')
+            review_text = review_element.text
+            review_match = re.search(r'리뷰 : (\d+)', review_text)
+            if review_match:
+                reviews = int(review_match.group(1))
+        except (NoSuchElementException, ValueError):
+            pass
+        
+        # 색상 정보
+        colors = []
+        try:
+            color_chips = product_element.find_elements(By.CSS_SELECTOR, '.colorchips .chip')
+            for color in color_chips:
+                color_style = color.get_attribute('style')
+                color_name = color.get_attribute('class').replace('chip', '').strip()
+                if not color_name and 'background-color:' in color_style:
+                    color_value = re.search(r'background-color:(.*)', color_style).group(1).strip()
+                    colors.append(color_value)
+                elif color_name:
+                    colors.append(color_name)
+        except NoSuchElementException:
+            pass
+        
+        # 판매수량
+        sales_count = 0
+        try:
+            stock_element = product_element.find_element(By.CSS_SELECTOR, '.item_stock')
+            stock_text = stock_element.text.strip()
+            sales_match = re.search(r'판매수량 : (\d+)', stock_text)
+            if sales_match:
+                sales_count = int(sales_match.group(1))
+        except (NoSuchElementException, ValueError):
+            pass
+        
+        # 제품 정보를 딕셔너리로 저장
+        product_info = {
+            '상품명': product_name,
+            '상품URL': product_url,
+            '상품설명': product_desc,
+            '이미지URL': image_url,
+            '정가': original_price,
+            '판매가': current_price,
+            '할인율': discount_rate,
+            '리뷰수': reviews,
+            '색상': ', '.join(colors),
+            '판매수량': sales_count
+        }
+        
+        return product_info
+    
+    except Exception as e:
+        log('warning', 'extract_error', f"상품 정보 추출 중 오류 발생: {e}", error=str(e))
+        return None
+
+def extract_category_urls(html_content):
+    """HTML에서 카테고리 URL 추출"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    category_links = []
+    
+    # 메인 카테고리 찾기
+    menu_sections = soup.select('dl')
+    
+    for section in menu_sections:
+        # 카테고리 제목 (dt 태그)
+        dt = section.find('dt')
+        if not dt:
+            continue
+            
+        dt_link = dt.find('a')
+        if not dt_link:
+            continue
+            
+        main_category = dt_link.text.strip()
+        main_url = dt_link.get('href', '')
+        
+        # 절대 URL로 변환
+        if main_url.startswith('/'):
+            main_url = f"https://www.chicfox.co.kr{main_url}"
+            
+        # 서브 카테고리 (dd 태그)
+        dds = section.find_all('dd')
+        for dd in dds:
+            dd_link = dd.find('a')
+            if not dd_link:
+                continue
+                
+            sub_category = dd_link.text.strip()
+            sub_url = dd_link.get('href', '')
+            
+            # 절대 URL로 변환
+            if sub_url.startswith('/'):
+                sub_url = f"https://www.chicfox.co.kr{sub_url}"
+                
+            # 카테고리 정보 저장 - 깊이별로 분리
+            category_links.append({
+                'main_category': main_category,
+                'sub_category': sub_category,
+                'url': sub_url
+            })
+    
+    return category_links
+
+class ChicfoxSite(SiteAdapter):
+    name = 'chicfox'
+    ready_selector = '.item-cont .item-list'
+    list_selectors = ('.item-cont .item-list',)
+    total_selector = '.item-total strong'
+    pagination_selector = '.paging a'
+    page_size = 20
+    categories_file = 'chicfox_categories.csv'
+    output_name = 'chicfox_products_data'
+    newest_sort = {'sort': 'order'}
+    product_key_param = 'branduid'
+    category_html = CATEGORY_HTML
+    category_id_params = ('xcode', 'mcode')
+
+    parse_categories = staticmethod(extract_category_urls)
+    extract_product_info = staticmethod(extract_product_info)
+    parse_detail = staticmethod(parse_makeshop_options)
@@ -0,0 +1,218 @@
+"""closhoew (카페24) 사이트 어댑터"""
+import re
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from bs4 import BeautifulSoup
+from crawler.detail import parse_cafe24_options
+from crawler.engine import SiteAdapter
+from crawler.metrics import log
+
+CATEGORY_HTML = """
+        <div id="all_category" class="xans-element- xans-layout xans-layout-category" style="display: block;"><div class="position">
+                <ul class="ct01-wrap">
+<li data-param="?cate_no=23" class="ct01 xans-record-"><a href="/product/list.html?cate_no=25">OUTER  </a><dl class="ct02-wrap"><dd data-param="?cate_no=48" class="ct02"><a href="/product/list.html?cate_no=48">자켓</a></dd><dd data-param="?cate_no=50" class="ct02"><a href="/product/list.html?cate_no=50">가디건</a></dd><dd data-param="?cate_no=54" class="ct02"><a href="/product/list.html?cate_no=54">트위드</a></dd><dd data-param="?cate_no=53" class="ct02"><a href="/product/list.html?cate_no=53">점퍼/집업</a></dd><dd data-param="?cate_no=55" class="ct02"><a href="/product/list.html?cate_no=55">야상</a></dd><dd data-param="?cate_no=103" class="ct02"><a href="/product/list.html?cate_no=103">베스트</a></dd><dd data-param="?cate_no=51" class="ct02"><a href="/product/list.html?cate_no=51">코트</a></dd><dd data-param="?cate_no=56" class="ct02"><a href="/product/list.html?cate_no=56">패딩</a></dd></dl></li>
+<li data-param="?cate_no=26" class="ct01 xans-record- be"><a href="/product/list.html?cate_no=26">TOP</a><dl class="ct02-wrap"><dd data-param="?cate_no=58" class="ct02 be"><a href="/product/list.html?cate_no=58">티셔츠</a><dl class="ct03-wrap"><dd data-param="?cate_no=59" class="ct03"><a href="/product/list.html?cate_no=59">긴팔</a></dd><dd data-param="?cate_no=76" class="ct03"><a href="/product/list.html?cate_no=76">반팔</a></dd><dd data-param="?cate_no=77" class="ct03"><a href="/product/list.html?cate_no=77">민소매</a></dd></dl></dd><dd data-param="?cate_no=61" class="ct02 be"><a href="/product/list.html?cate_no=61">블라우스/셔츠</a><dl class="ct03-wrap"><dd data-param="?cate_no=79" class="ct03"><a href="/product/list.html?cate_no=79">블라우스</a></dd><dd data-param="?cate_no=80" class="ct03"><a href="/product/list.html?cate_no=80">셔츠</a></dd></dl></dd><dd data-param="?cate_no=60" class="ct02"><a href="/product/list.html?cate_no=60">니트</a></dd><dd data-param="?cate_no=63" class="ct02 be"><a href="/product/list.html?cate_no=63">맨투맨/후디</a><dl class="ct03-wrap"><dd data-param="?cate_no=81" class="ct03"><a href="/product/list.html?cate_no=81">맨투맨</a></dd><dd data-param="?cate_no=82" class="ct03"><a href="/product/list.html?cate_no=82">후디</a></dd></dl></dd><dd data-param="?cate_no=95" class="ct02"><a href="/product/list.html?cate_no=95">뷔스티에</a></dd><dd data-param="?cate_no=94" class="ct02"><a href="/product/list.html?cate_no=94">베스트</a></dd></dl></li>
+<li data-param="?cate_no=27" class="ct01 xans-record- be"><a href="/product/list.html?cate_no=27">BOTTOM </a><dl class="ct02-wrap"><dd data-param="?cate_no=64" class="ct02"><a href="/product/list.html?cate_no=64">데님</a></dd><dd data-param="?cate_no=93" class="ct02"><a href="/product/list.html?cate_no=93">슬랙스</a></dd><dd data-param="?cate_no=78" class="ct02 be"><a href="/product/list.html?cate_no=78">스커트</a><dl class="ct03-wrap"><dd data-param="?cate_no=83" class="ct03"><a href="/product/list.html?cate_no=83">미니</a></dd><dd data-param="?cate_no=84" class="ct03"><a href="/product/list.html?cate_no=84">미디/롱</a></dd></dl></dd><dd data-param="?cate_no=66" class="ct02"><a href="/product/list.html?cate_no=66">숏팬츠</a></dd><dd data-param="?cate_no=65" class="ct02"><a href="/product/list.html?cate_no=65">롱팬츠</a></dd><dd data-param="?cate_no=101" class="ct02"><a href="/product/list.html?cate_no=101">조거팬츠</a></dd><dd data-param="?cate_no=100" class="ct02"><a href="/product/list.html?cate_no=100">레깅스</a></dd></dl></li>
+<li data-param="?cate_no=28" class="ct01 xans-record- be"><a href="/product/list.html?cate_no=28">DRESS   </a><dl class="ct02-wrap"><dd data-param="?cate_no=68" class="ct02"><a href="/product/list.html?cate_no=68">미니</a></dd><dd data-param="?cate_no=70" class="ct02"><a href="/product/list.html?cate_no=70">미디/롱</a></dd><dd data-param="?cate_no=71" class="ct02"><a href="/product/list.html?cate_no=71">점프수트</a></dd></dl></li>
+<li data-param="?cate_no=42" class="ct01 xans-record- be"><a href="/product/list.html?cate_no=42">SET ITEM</a><dl class="ct02-wrap"><dd data-param="?cate_no=75" class="ct02"><a href="/product/list.html?cate_no=75">상의 세트</a></dd><dd data-param="?cate_no=74" class="ct02"><a href="/product/list.html?cate_no=74">팬츠 세트</a></dd><dd data-param="?cate_no=85" class="ct02"><a href="/product/list.html?cate_no=85">스커트 세트</a></dd></dl></li>
+<li data-param="?cate_no=43" class="ct01 xans-record- be"><a href="/product/list.html?cate_no=43">SHOES</a><dl class="ct02-wrap"><dd data-param="?cate_no=86" class="ct02"><a href="/product/list.html?cate_no=86">슬리퍼/샌들</a></dd><dd data-param="?cate_no=88" class="ct02"><a href="/product/list.html?cate_no=88">부츠</a></dd><dd data-param="?cate_no=87" class="ct02"><a href="/product/list.html?cate_no=87">힐</a></dd></dl></li>
+<li data-param="?cate_no=44" class="ct01 xans-record- be"><a href="/product/list.html?cate_no=44">ACC</a><dl class="ct02-wrap"><dd data-param="?cate_no=106" class="ct02"><a href="/product/list.html?cate_no=106">이너웨어</a></dd><dd data-param="?cate_no=90" class="ct02"><a href="/product/list.html?cate_no=90">가방</a></dd><dd data-param="?cate_no=89" class="ct02"><a href="/product/list.html?cate_no=89">모자</a></dd><dd data-param="?cate_no=92" class="ct02"><a href="/product/list.html?cate_no=92">선글라스</a></dd><dd data-param="?cate_no=105" class="ct02"><a href="/product/list.html?cate_no=105">벨트</a></dd><dd data-param="?cate_no=91" class="ct02"><a href="/product/list.html?cate_no=91">악세사리</a></dd><dd data-param="?cate_no=104" class="ct02"><a href="/product/list.html?cate_no=104">홈웨어</a></dd><dd data-param="?cate_no=96" class="ct02"><a href="/product/list.html?cate_no=96">장갑&amp;양말</a></dd><dd data-param="?cate_no=99" class="ct02"><a href="/product/list.html?cate_no=99">머플러</a></dd></dl></li>
+                </ul>
+            </div>
+        </div>
+        """
+
+def extract_product_info(product_element):
+    """상품 요소에서 정보 추출"""
+    try:
+        # 상품명
+        product_name = ""
+        try:
+            name_elements = product_element.find_elements(By.CSS_SELECTOR, '.name a span')
+            if name_elements and len(name_elements) > 0:
+                product_name = name_elements[-1].text.strip()
+            else:
+                # 대체 방법으로 시도
+                name_element = product_element.find_element(By.CSS_SELECTOR, '.name a')
+                if name_element:
+                    product_name = name_element.text.strip()
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        
+        # 상품 URL
+        product_url = ""
+        try:
+            url_element = product_element.find_element(By.CSS_SELECTOR, '.name a')
+            product_url = url_element.get_attribute('href')
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        
+        # 이미지 URL
+        image_url = ''
+        try:
+            # 첫 번째 이미지 시도
+            img_elements = product_element.find_elements(By.CSS_SELECTOR, '.prdImg a img')
+            if img_elements and len(img_elements) > 0:
+                for img in img_elements:
+                    temp_url = img.get_attribute('src')
+                    if temp_url and 'medium' in temp_url:
+                        image_url = temp_url
+                        break
+                    elif temp_url:
+                        image_url = temp_url
+                        # 썸네일이면 중간 크기 이미지로 대체
+                        if "/tiny/" in image_url:
+                            image_url = image_url.replace("/tiny/", "/medium/")
+                        break
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        
+        # 가격 정보 (판매가)
+        price = None
+        try:
+            price_elements = product_element.find_elements(By.CSS_SELECTOR, '.spec li')
+            for price_el in price_elements:
+                price_text = price_el.text.strip()
+                if "원" in price_text:
+                    price = re.sub(r'[^\d]', '', price_text)
+                    break
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        
+        # 색상 정보
+        colors = []
+        try:
+            color_chips = product_element.find_elements(By.CSS_SELECTOR, '.colorchip span')
+            for color in color_chips:
+                color_style = color.get_attribute('style')
+                if color_style and 'background-color:' in color_style:
+                    try:
+                        color_value = re.search(r'background-color:(.*?)(;|$)', color_style).group(1).strip()
+                        colors.append(color_value)
+                    except (AttributeError, IndexError):
+                        pass
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        
+        # 품절 여부
+        is_sold_out = False
+        try:
+            sold_out_elements = product_element.find_elements(By.CSS_SELECTOR, '.icon .promotion img')
+            for sold_el in sold_out_elements:
+                alt_text = sold_el.get_attribute('alt')
+                if alt_text and '품절' in alt_text:
+                    is_sold_out = True
+                    break
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        
+        # 좋아요 수
+        like_count = 0
+        try:
+            like_elements = product_element.find_elements(By.CSS_SELECTOR, '.likePrdCount')
+            if like_elements and len(like_elements) > 0:
+                try:
+                    like_count = int(like_elements[0].text.strip())
+                except (ValueError, TypeError):
+                    pass
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        
+        # 제품 정보를 딕셔너리로 저장
+        product_info = {
+            '상품명': product_name,
+            '상품URL': product_url,
+            '이미지URL': image_url,
+            '가격': price,
+            '색상': ', '.join(colors),
+            '품절여부': is_sold_out,
+            '좋아요수': like_count
+        }
+        
+        return product_info
+    
+    except Exception as e:
+        log('warning', 'extract_error', f"상품 정보 추출 중 오류 발생: {e}", error=str(e))
+        return None
+
+def extract_category_urls(html_content):
+    """HTML에서 카테고리 URL 추출"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    category_links = []
+    
+    # 메인 카테고리 (ct01 클래스) 추출
+    main_categories = soup.select('#all_category .ct01-wrap li.ct01')
+    
+    for main_cat in main_categories:
+        main_cat_name = main_cat.find('a').text.strip()
+        main_cat_url = main_cat.find('a').get('href')
+        if not main_cat_url.startswith('http'):
+            main_cat_url = f"https://closhoew.com{main_cat_url}"
+        
+        # 서브 카테고리 (ct02 클래스) 존재 여부 확인
+        sub_categories = main_cat.select('dl.ct02-wrap dd.ct02')
+        
+        if sub_categories:
+            # 서브 카테고리가 있는 경우
+            for sub_cat in sub_categories:
+                sub_cat_name = sub_cat.find('a').text.strip()
+                sub_cat_url = sub_cat.find('a').get('href')
+                if not sub_cat_url.startswith('http'):
+                    sub_cat_url = f"https://closhoew.com{sub_cat_url}"
+                
+                # 3차 카테고리 (ct03 클래스) 존재 여부 확인
+                third_categories = sub_cat.select('dl.ct03-wrap dd.ct03')
+                
+                if third_categories:
+                    # 3차 카테고리가 있는 경우
+                    for third_cat in third_categories:
+                        third_cat_name = third_cat.find('a').text.strip()
+                        third_cat_url = third_cat.find('a').get('href')
+                        if not third_cat_url.startswith('http'):
+                            third_cat_url = f"https://closhoew.com{third_cat_url}"
+                        
+                        # 카테고리 정보 저장 (메인 > 서브 > 3차)
+                        category_links.append({
+                            'main_category': main_cat_name,
+                            'sub_category': f"{sub_cat_name} > {third_cat_name}",
+                            'url': third_cat_url
+                        })
+                else:
+                    # 3차 카테고리가 없는 경우 (메인 > 서브)
+                    category_links.append({
+                        'main_category': main_cat_name,
+                        'sub_category': sub_cat_name,
+                        'url': sub_cat_url
+                    })
+        else:
+            # 서브 카테고리가 없는 경우 (메인만)
+            category_links.append({
+                'main_category': main_cat_name,
+                'sub_category': '',
+                'url': main_cat_url
+            })
+    
+    return category_links
+
+class CloshoewSite(SiteAdapter):
+    name = 'closhoew'
+    ready_selector = '.prdList > li'
+    list_selectors = ('.prdList li.item', '.xans-product-listnormal ul.prdList li')
+    total_selector = '.prdCount'
+    total_pattern = r'(\d+)\s*PRODUCT'
+    pagination_selector = '.ec-base-paginate ol li a'
+    # 카페24는 상품이 없으면 빈 목록 안내 모듈의 displaynone 클래스를 뺌
+    empty_selector = '.xans-product-listempty:not(.displaynone)'
+    page_size = 40
+    min_request_interval = 1.0
+    categories_file = 'closhoew_categories.csv'
+    output_name = 'closhoew_products_data'
+    newest_sort = {'sort_method': '5'}
+    product_key_param = 'product_no'
+    product_key_pattern = r'/product/[^/]+/(\d+)'
+    category_html = CATEGORY_HTML
+    category_id_params = ('cate_no',)
+
+    parse_categories = staticmethod(extract_category_urls)
+    extract_product_info = staticmethod(extract_product_info)
+    parse_detail = staticmethod(parse_cafe24_options)
@@ -0,0 +1,227 @@
+"""joamom (메이크샵) 사이트 어댑터"""
+import re
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+from bs4 import BeautifulSoup
+from crawler.detail import parse_makeshop_options
+from crawler.engine import SiteAdapter
+from crawler.metrics import log
+
+CATEGORY_HTML = """
+        <div class="list">
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=094">MADE</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=&amp;mcode=008">MADFIT</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=062">TOP</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=063">BLOUSE</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065">PANTS</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=066">OPS/SKIRT</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=067">OUTER</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=094&amp;type=&amp;mcode=007">ETC</a></li>
+                    </ul>
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=062">TOP</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=062&amp;type=&amp;mcode=001">라운드넥</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=062&amp;type=&amp;mcode=002">브이넥</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=062&amp;type=&amp;mcode=003">나시</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=062&amp;type=&amp;mcode=004">폴라/터틀넥</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=062&amp;type=&amp;mcode=005">니트티</a></li>
+                    </ul>
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=063">BLOUSE</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=063&amp;type=X">블라우스</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=063&amp;type=X&amp;mcode=005">남방</a></li>
+                    </ul>
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=065">PANTS</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=&amp;mcode=008">MADFIT</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=&amp;mcode=001">일자핏</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=M&amp;mcode=003">배기핏</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=X&amp;mcode=002">와이드핏</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=M&amp;mcode=005">반바지</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=M&amp;mcode=004">부츠컷</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=M&amp;mcode=006">청바지</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=065&amp;type=M&amp;mcode=007">레깅스/트레이닝</a></li>
+                    </ul>
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=067">OUTER</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=067&amp;type=&amp;mcode=001">점퍼</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=067&amp;type=&amp;mcode=002">자켓</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=067&amp;type=&amp;mcode=003">조끼</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=067&amp;type=&amp;mcode=004">코트</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=067&amp;type=&amp;mcode=005">가디건</a></li>
+                    </ul>
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=071">UNDERWEAR</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=071&amp;type=&amp;mcode=004">브라</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=071&amp;type=&amp;mcode=005">팬티</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=071&amp;type=&amp;mcode=006">홈웨어</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=071&amp;type=&amp;mcode=001">보정속옷</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=071&amp;type=&amp;mcode=002">내의</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=071&amp;type=&amp;mcode=003">기타</a></li>
+                    </ul>
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=049">KNIT</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=049&amp;type=Y&amp;mcode=001">니트</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=049&amp;type=Y&amp;mcode=002">가디건</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=049&amp;type=Y&amp;mcode=003">조끼</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=049&amp;type=Y&amp;mcode=004">원피스/스커트</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=049&amp;type=Y&amp;mcode=005">팬츠</a></li>
+                    </ul>
+                    <ul>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=066">OPS/SKIRT</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=066&amp;type=&amp;mcode=001">원피스</a></li>
+                        <li><a href="/shop/shopbrand.html?xcode=066&amp;type=&amp;mcode=002">스커트</a></li>
+                        <li class="tit last"><a href="/shop/shopbrand.html?xcode=068">BAG&amp;SHOES</a></li>
+                        <li class="tit"><a href="/shop/shopbrand.html?xcode=069">ACC</a></li>
+                    </ul>
+                </div>
+        """
+
+def extract_product_info(product_element):
+    """상품 요소에서 정보 추출"""
+    try:
+        # 상품명
+        product_name = product_element.find_element(By.CSS_SELECTOR, '.prd-name a').text.strip()
+        
+        # 상품 URL
+        product_url = product_element.find_element(By.CSS_SELECTOR, '.prd-name a').get_attribute('href')
+        
+        # 상품 설명
+        product_desc = ''
+        try:
+            product_desc = product_element.find_element(By.CSS_SELECTOR, '.prd-subname').text.strip()
+        except NoSuchElementException:
+            pass
+        
+        # 이미지 URL
+        image_url = ''
+        try:
+            image_url = product_element.find_element(By.CSS_SELECTOR, '.thumb img').get_attribute('src')
+        except NoSuchElementException:
+            pass
+        
+        # 가격 정보
+        price_info = product_element.find_element(By.CSS_SELECTOR, '.prd-price')
+        
+        # 정가 (할인이 있는 경우)
+        original_price = None
+        try:
+            strike_element = price_info.find_element(By.CSS_SELECTOR, '.strike')
+            original_price_text = strike_element.text.strip()
+            original_price = re.sub(r'[^\d]', '', original_price_text)
+        except NoSuchElementException:
+            pass
+        
+        # 판매가
+        current_price = None
+        try:
+            price_element = price_info.find_element(By.CSS_SELECTOR, '.price')
+            current_price_text = price_element.text.strip()
+            current_price = re.sub(r'[^\d]', '', current_price_text)
+        except NoSuchElementException:
+            pass
+        
+        # 할인율
+        discount_rate = None
+        try:
+            sale_element = price_info.find_element(By.CSS_SELECTOR, '.salePercent')
+            discount_text = sale_element.text.strip()
+            discount_match = re.search(r'(\d+(?:\.\d+)?)', discount_text)
+            if discount_match:
+                discount_rate = discount_match.group(1)
+        except NoSuchElementException:
+            pass
+        
+        # 리뷰 수
+        reviews = 0
+        try:
+            review_element = price_info.find_element(By.CSS_SELECTOR, '.crema-product-reviews-count')
+            review_text = review_element.text
+            review_match = re.search(r'리뷰\s*:\s*(\d+)', review_text)
+            if review_match:
+                reviews = int(review_match.group(1))
+        except NoSuchElementException:
+            pass
+        
+        # 색상 정보
+        colors = []
+        try:
+            color_chips = product_element.find_elements(By.CSS_SELECTOR, '.clChip span')
+            for color in color_chips:
+                style = color.get_attribute('style')
+                if style and 'background' in style:
+                    color_value = style.replace('background:', '').strip()
+                    colors.append(color_value)
+        except NoSuchElementException:
+            pass
+        
+        # 제품 정보를 딕셔너리로 저장
+        product_info = {
+            '상품명': product_name,
+            '상품URL': product_url,
+            '상품설명': product_desc,
+            '이미지URL': image_url,
+            '정가': original_price,
+            '판매가': current_price,
+            '할인율': discount_rate,
+            '리뷰수': reviews,
+            '색상': ', '.join(colors)
+        }
+        
+        return product_info
+    
+    except Exception as e:
+        log('warning', 'extract_error', f"상품 정보 추출 중 오류 발생: {e}", error=str(e))
+        return None
+
+def extract_category_urls(html_content):
+    """HTML에서 카테고리 URL 추출"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    category_links = []
+    
+    # 모든 a 태그 찾기
+    links = soup.select('div.list a')
+    
+    for link in links:
+        href = link.get('href', '')
+        if href and '/shop/shopbrand.html' in href:
+            # 상대 URL을 절대 URL로 변환
+            if href.startswith('/'):
+                href = f"https://www.joamom.co.kr{href}"
+            
+            # 카테고리명 추출
+            category_name = link.text.strip()
+            
+            # 중복 제거하며 카테고리 정보 저장
+            category_links.append({
+                'name': category_name,
+                'url': href
+            })
+    
+    return category_links
+
+class JoamomSite(SiteAdapter):
+    name = 'joamom'
+    # 목록 위의 베스트 상품 캐러셀(.swiper-wrapper)도 같은 마크업이라 상품 목록에서 뺀다
+    ready_selector = '.item-cont:not(.swiper-wrapper) dl.item-list'
+    list_selectors = ('.item-cont:not(.swiper-wrapper) dl.item-list',)
+    total_selector = '.item-total strong'
+    pagination_selector = '.paging a'
+    page_size = 36
+    category_dir = 'category_data'
+    output_name = 'all_products_data'
+    newest_sort = {'sort': 'order'}
+    product_key_param = 'branduid'
+    category_html = CATEGORY_HTML
+    category_id_params = ('xcode', 'mcode')
+
+    parse_categories = staticmethod(extract_category_urls)
+    extract_product_info = staticmethod(extract_product_info)
+    parse_detail = staticmethod(parse_makeshop_options)
+
+    def category_name(self, category):
+        return category['name']
+
+    def category_fields(self, category):
+        return {'카테고리': category['name']}
@@ -0,0 +1,78 @@
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+
+from crawler.metrics import METRICS
+
+# 요소 개수를 확인하는 스크립트 (폴링 한 번에 WebDriver 요청 한 번)
+COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+
+class WaitStats:
+    """페이지 로딩 대기에 실제로 걸린 시간 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits = {}
+
+    def record(self, name, seconds, timed_out=False):
+        METRICS.observe('wait', seconds)
+        with self._lock:
+            entry = self._waits.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            entry['count'] += 1
+            entry['total'] += seconds
+            entry['max'] = max(entry['max'], seconds)
+            if timed_out:
+                entry['timeouts'] += 1
+
+    def summary(self):
+        """선택자별 대기 횟수, 평균/최대 시간, 타임아웃 횟수"""
+        with self._lock:
+            return {
+                name: dict(entry, avg=entry['total'] / entry['count'])
+                for name, entry in self._waits.items()
+            }
+
+    def print_summary(self):
+        summary = self.summary()
+        if not summary:
+            return
+        print("\n페이지 로딩 대기 통계:")
+        for name, entry in summary.items():
+            print(f"  {name}: {entry['count']}회, 평균 {entry['avg']:.2f}초, 최대 {entry['max']:.2f}초, "
+                  f"합계 {entry['total']:.1f}초, 타임아웃 {entry['timeouts']}회")
+
+
+# 실행 전체에서 공유하는 기본 통계
+WAIT_STATS = WaitStats()
+
+
+def wait_for_ready(driver, selector, timeout=10, stable_for=0.3, poll_interval=0.1, stats=WAIT_STATS):
+    """selector 요소가 나타나고 개수가 stable_for초 동안 변하지 않을 때까지만 대기
+
+    고정된 sleep 대신 상품 목록이 실제로 준비된 시점에 바로 돌아온다.
+    걸린 시간(초)을 반환하고 stats에 기록하며, timeout초 안에 준비되지 않으면 TimeoutException.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    last_count = 0
+    stable_since = None
+
+    while True:
+        count = driver.execute_script(COUNT_SCRIPT, selector) or 0
+        now = time.monotonic()
+        if count > 0:
+            if count != last_count:
+                last_count = count
+                stable_since = now
+            elif now - stable_since >= stable_for:
+                elapsed = now - start
+                if stats:
+                    stats.record(selector, elapsed)
+                return elapsed
+        if now >= deadline:
+            elapsed = now - start
+            if stats:
+                stats.record(selector, elapsed, timed_out=True)
+            raise TimeoutException(f"{timeout}초 안에 '{selector}' 요소가 준비되지 않았습니다")
+        time.sleep(poll_interval)
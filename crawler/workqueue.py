@@ -0,0 +1,369 @@
+"""여러 워커 프로세스/머신이 함께 쓰는 크롤링 작업 큐
+
+작업 하나는 (사이트, 카테고리, 페이지)이다. 워커는 작업을 임대(lease)해서 처리하고, 임대 시간
+(visibility timeout) 안에 완료하지 못하면 작업은 다시 다른 워커에게 돌아간다. 완료한 작업의 상품 행은
+같은 큐의 결과 테이블에 쌓이고, collect 단계에서 결과 파일로 만든다.
+
+기본 백엔드는 SQLite 파일이고, 여러 머신에서 쓰려면 한 곳에서 큐 서버를 띄우고 워커는 HTTP로 접속한다.
+큐 서버는 기본적으로 127.0.0.1에서만 받고, 요청마다 공유 토큰(X-Queue-Token 헤더)을 확인한다.
+
+    CRAWL_QUEUE_TOKEN=비밀값 python -m crawler.distributed serve --host 0.0.0.0 --port 8765
+    CRAWL_QUEUE_TOKEN=비밀값 python -m crawler.distributed --queue http://큐서버:8765 work
+"""
+import hmac
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from crawler.index import connect
+from crawler.journal import STATE_DIR
+from crawler.metrics import log
+
+# 로컬 작업 큐 DB
+QUEUE_PATH = os.path.join(STATE_DIR, 'tasks.sqlite')
+
+# 임대한 작업을 이 시간(초) 안에 완료하거나 연장하지 않으면 다른 워커가 가져갈 수 있음
+VISIBILITY_TIMEOUT = 300
+
+# 작업 하나를 시도하는 최대 횟수 (넘으면 dead 상태로 남김)
+MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    site TEXT NOT NULL,
+    category TEXT NOT NULL,
+    listing_url TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    page_url TEXT NOT NULL,
+    plan INTEGER NOT NULL DEFAULT 0,
+    max_pages INTEGER,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    UNIQUE (site, listing_url, page)
+);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, site);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    task_id INTEGER NOT NULL REFERENCES tasks (id),
+    site TEXT NOT NULL,
+    rows TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_site ON results (site, id);
+"""
+
+TASK_COLUMNS = ('id', 'site', 'category', 'listing_url', 'page', 'page_url', 'plan', 'max_pages', 'state', 'owner',
+                'lease_expires', 'attempts', 'error')
+
+# HTTP 큐 서버가 받는 메서드 (이름이 같은 SqliteTaskQueue 메서드를 호출, reset은 큐 파일이 있는 머신에서만)
+QUEUE_METHODS = ('add', 'lease', 'heartbeat', 'complete', 'fail', 'counts', 'has_work', 'results')
+
+# 큐 서버가 기본으로 받는 주소 (다른 머신의 워커를 받으려면 --host로 직접 지정)
+QUEUE_HOST = '127.0.0.1'
+
+# 큐 서버와 워커가 함께 쓰는 토큰을 담는 요청 헤더와 환경 변수
+TOKEN_HEADER = 'X-Queue-Token'
+TOKEN_ENV = 'CRAWL_QUEUE_TOKEN'
+
+
+def _task_from_row(row):
+    task = dict(zip(TASK_COLUMNS, row))
+    task['category'] = json.loads(task['category'])
+    task['plan'] = bool(task['plan'])
+    return task
+
+
+def _insert_tasks(conn, tasks, now):
+    added = 0
+    for task in tasks:
+        cursor = conn.execute(
+            'INSERT OR IGNORE INTO tasks (site, category, listing_url, page, page_url, plan, max_pages, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (task['site'], json.dumps(task['category'], ensure_ascii=False), task['listing_url'], task['page'],
+             task['page_url'], int(bool(task.get('plan'))), task.get('max_pages'), now),
+        )
+        added += cursor.rowcount
+    return added
+
+
+class SqliteTaskQueue:
+    """SQLite 파일에 작업과 결과를 저장하는 작업 큐
+
+    같은 파일을 여러 프로세스가 열어도 임대는 BEGIN IMMEDIATE 트랜잭션 안에서 하므로 한 작업을
+    두 워커가 동시에 가져가지 않는다. 완료는 임대를 가진 워커만 할 수 있어서, 임대 시간이 지나
+    다른 워커가 다시 가져간 작업의 결과가 두 번 쌓이지 않는다.
+    """
+
+    def __init__(self, path=QUEUE_PATH, max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        # 트랜잭션은 _transaction()에서 직접 시작
+        self._conn.isolation_level = None
+        self._conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def add(self, tasks):
+        """작업 추가 (같은 사이트/목록/페이지 작업이 이미 있으면 무시), 새로 추가한 수 반환"""
+        now = time.time()
+        with self._transaction() as conn:
+            return _insert_tasks(conn, tasks, now)
+
+    def lease(self, owner, sites=None, visibility_timeout=VISIBILITY_TIMEOUT):
+        """대기 중이거나 임대 시간이 지난 작업 하나를 owner에게 임대 (없으면 None)"""
+        now = time.time()
+        site_filter, params = '', []
+        if sites:
+            site_filter = f" AND site IN ({', '.join('?' * len(sites))})"
+            params = list(sites)
+        with self._transaction() as conn:
+            # 임대 시간이 지났는데 시도 횟수를 다 쓴 작업은 더 돌리지 않음
+            conn.execute(
+                "UPDATE tasks SET state = 'dead', owner = NULL, error = COALESCE(error, '임대 시간 초과'), "
+                "updated_at = ? WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            # 첫 페이지(계획) 작업을 먼저 처리해야 나머지 페이지 작업이 빨리 생김
+            row = conn.execute(
+                f"SELECT {', '.join(TASK_COLUMNS)} FROM tasks "
+                f"WHERE (state = 'pending' OR (state = 'leased' AND lease_expires < ?)){site_filter} "
+                f"ORDER BY plan DESC, id LIMIT 1",
+                [now] + params,
+            ).fetchone()
+            if row is None:
+                return None
+            task = _task_from_row(row)
+            conn.execute(
+                "UPDATE tasks SET state = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ?",
+                (owner, now + visibility_timeout, now, task['id']),
+            )
+        task.update(state='leased', owner=owner, lease_expires=now + visibility_timeout,
+                    attempts=task['attempts'] + 1)
+        return task
+
+    def heartbeat(self, task_id, owner, visibility_timeout=VISIBILITY_TIMEOUT):
+        """처리 중인 작업의 임대 시간 연장 (임대를 잃었으면 False)"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE id = ? AND state = 'leased' AND owner = ?",
+                (now + visibility_timeout, now, task_id, owner),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, task_id, owner, rows, new_tasks=()):
+        """작업 완료: 결과 행을 저장하고 이어지는 작업(나머지 페이지)을 추가 (임대를 잃었으면 아무것도 하지 않고 False)"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET state = 'done', owner = NULL, lease_expires = NULL, error = NULL, updated_at = ? "
+                "WHERE id = ? AND state = 'leased' AND owner = ?",
+                (now, task_id, owner),
+            )
+            if cursor.rowcount != 1:
+                return False
+            site = conn.execute('SELECT site FROM tasks WHERE id = ?', (task_id,)).fetchone()[0]
+            conn.execute(
+                'INSERT INTO results (task_id, site, rows, created_at) VALUES (?, ?, ?, ?)',
+                (task_id, site, json.dumps(rows, ensure_ascii=False, default=str), now),
+            )
+            _insert_tasks(conn, new_tasks, now)
+        return True
+
+    def fail(self, task_id, owner, error=None):
+        """작업 실패: 시도 횟수가 남았으면 다시 대기 상태로, 아니면 dead로 (임대를 잃었으면 False)"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'dead' ELSE 'pending' END, owner = NULL, "
+                "lease_expires = NULL, error = ?, updated_at = ? WHERE id = ? AND state = 'leased' AND owner = ?",
+                (self.max_attempts, str(error) if error else None, now, task_id, owner),
+            )
+        return cursor.rowcount == 1
+
+    def counts(self, site=None):
+        """상태별 작업 수 {'pending': .., 'leased': .., 'done': .., 'dead': ..}"""
+        query = 'SELECT state, COUNT(*) FROM tasks'
+        params = ()
+        if site:
+            query += ' WHERE site = ?'
+            params = (site,)
+        with self._lock:
+            counts = dict(self._conn.execute(query + ' GROUP BY state', params))
+        return {state: counts.get(state, 0) for state in ('pending', 'leased', 'done', 'dead')}
+
+    def has_work(self, sites=None):
+        """아직 끝나지 않은 작업(대기 중 또는 임대 중)이 있는지"""
+        query = "SELECT 1 FROM tasks WHERE state IN ('pending', 'leased')"
+        params = []
+        if sites:
+            query += f" AND site IN ({', '.join('?' * len(sites))})"
+            params = list(sites)
+        with self._lock:
+            return self._conn.execute(query + ' LIMIT 1', params).fetchone() is not None
+
+    def results(self, site, after_id=0, limit=100):
+        """사이트의 결과를 id 순서로 [(결과 id, 카테고리, 페이지, 상품 행 목록)] 반환 (after_id 다음부터)"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT results.id, tasks.category, tasks.page, results.rows FROM results '
+                'JOIN tasks ON tasks.id = results.task_id '
+                'WHERE results.site = ? AND results.id > ? ORDER BY results.id LIMIT ?',
+                (site, after_id, limit),
+            ).fetchall()
+        return [(result_id, json.loads(category), page, json.loads(products))
+                for result_id, category, page, products in rows]
+
+    def reset(self, site):
+        """사이트의 작업과 결과를 모두 지움 (새로 크롤링을 시작할 때)"""
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM results WHERE site = ?', (site,))
+            conn.execute('DELETE FROM tasks WHERE site = ?', (site,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class HttpTaskQueue:
+    """원격 큐 서버(serve_queue)에 HTTP로 접속하는 작업 큐 (reset을 뺀 SqliteTaskQueue와 같은 메서드)
+
+    token은 큐 서버를 띄울 때 쓴 공유 토큰이다 (None이면 CRAWL_QUEUE_TOKEN 환경 변수).
+    """
+
+    def __init__(self, base_url, token=None, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self._session = requests.Session()
+        token = token or os.environ.get(TOKEN_ENV)
+        if token:
+            self._session.headers[TOKEN_HEADER] = token
+
+    def _call(self, method, **params):
+        response = self._session.post(f'{self.base_url}/{method}', json=params, timeout=self.timeout)
+        if response.status_code >= 400:
+            # 서버가 본문에 담아 보낸 오류 메시지를 예외에 포함 (상태 코드로 재시도 여부를 판단하도록 HTTPError 유지)
+            try:
+                error = response.json().get('error')
+            except ValueError:
+                error = response.text
+            raise requests.HTTPError(f"작업 큐 {method} 요청 실패 ({response.status_code}): {error}", response=response)
+        return response.json()['result']
+
+    def add(self, tasks):
+        return self._call('add', tasks=list(tasks))
+
+    def lease(self, owner, sites=None, visibility_timeout=VISIBILITY_TIMEOUT):
+        return self._call('lease', owner=owner, sites=sites, visibility_timeout=visibility_timeout)
+
+    def heartbeat(self, task_id, owner, visibility_timeout=VISIBILITY_TIMEOUT):
+        return self._call('heartbeat', task_id=task_id, owner=owner, visibility_timeout=visibility_timeout)
+
+    def complete(self, task_id, owner, rows, new_tasks=()):
+        return self._call('complete', task_id=task_id, owner=owner, rows=rows, new_tasks=list(new_tasks))
+
+    def fail(self, task_id, owner, error=None):
+        return self._call('fail', task_id=task_id, owner=owner, error=str(error) if error else None)
+
+    def counts(self, site=None):
+        return self._call('counts', site=site)
+
+    def has_work(self, sites=None):
+        return self._call('has_work', sites=sites)
+
+    def results(self, site, after_id=0, limit=100):
+        return [tuple(result) for result in self._call('results', site=site, after_id=after_id, limit=limit)]
+
+    def close(self):
+        self._session.close()
+
+
+def serve_queue(queue, token, host=QUEUE_HOST, port=8765):
+    """queue(SqliteTaskQueue)를 HTTP로 공개 (POST /<메서드>에 JSON 인자, {"result": ..} 응답)
+
+    X-Queue-Token 헤더가 token과 다른 요청은 401로 거절한다. 토큰은 평문으로 오가므로
+    다른 머신에 공개할 때도 크롤링 워커만 접속하는 내부망에서 띄운다.
+    """
+    if not token:
+        raise ValueError("작업 큐 서버에는 공유 토큰이 필요합니다")
+    expected = token.encode('utf-8')
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status, payload):
+            # 상태 줄의 사유 문구는 latin-1로만 보낼 수 있으므로 기본 문구를 쓰고 한국어 메시지는 본문에 담음
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if not hmac.compare_digest(self.headers.get(TOKEN_HEADER, '').encode('utf-8'), expected):
+                self._reply(401, {'error': "작업 큐 토큰이 없거나 맞지 않습니다"})
+                return
+            method = self.path.strip('/')
+            if method not in QUEUE_METHODS:
+                self._reply(404, {'error': f"알 수 없는 메서드: {method}"})
+                return
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+                params = json.loads(self.rfile.read(length) or b'{}')
+                result = getattr(queue, method)(**params)
+            except (TypeError, ValueError) as e:
+                self._reply(400, {'error': str(e)})
+                return
+            except Exception as e:
+                # SQLite 잠금 등 서버 쪽 오류는 500으로 돌려주고 워커가 다시 시도하게 함
+                log('error', 'queue_request_failed', f"작업 큐 요청 처리 중 오류 발생 ({method}): {e}",
+                    method=method, error=str(e))
+                self._reply(500, {'error': f"{type(e).__name__}: {e}"})
+                return
+            self._reply(200, {'result': result})
+
+        def log_message(self, format, *args):
+            # 임대 요청마다 찍히는 접속 로그는 출력하지 않음
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"작업 큐 서버 시작: http://{host}:{server.server_port} ({queue.path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def is_remote(location):
+    """큐 위치가 원격 큐 서버 주소인지"""
+    return bool(location) and location.startswith(('http://', 'https://'))
+
+
+def open_queue(location=None, token=None):
+    """큐 위치에 맞는 백엔드 생성 (http(s):// 주소면 원격 큐, 아니면 SQLite 파일 경로, None이면 기본 경로)"""
+    if is_remote(location):
+        return HttpTaskQueue(location, token)
+    return SqliteTaskQueue(location or QUEUE_PATH)